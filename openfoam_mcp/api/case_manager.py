@@ -1,19 +1,285 @@
 """Case manager for creating and managing OpenFOAM cases."""
 
 import os
+import re
 import json
-import shutil
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Tuple
 from datetime import datetime
 from loguru import logger
 
 from ..builders.case_builder import CaseBuilder
+from ..builders.templates import foam_file
+from ..utils.file_io import (
+    append_file, copy_file, make_dirs, write_file, write_file_atomic
+)
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # not on Windows; metadata compaction is then unlocked
+    fcntl = None
+
+
+# Cells per 0.2 m of block edge for each mesh refinement level
+_BLOCK_MESH_REFINEMENT = MappingProxyType({
+    "coarse": 10,
+    "medium": 20,
+    "fine": 40,
+    "very_fine": 80
+})
+
+# (min, max) surface refinement levels for snappyHexMesh
+_SNAPPY_REFINEMENT = MappingProxyType({
+    "coarse": (2, 2),
+    "medium": (3, 3),
+    "fine": (4, 4),
+    "very_fine": (5, 5)
+})
+
+def _dumps_metadata(metadata: Dict[str, Any]) -> bytes:
+    """Serialize cases metadata to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+    return json.dumps(metadata, indent=2).encode()
+
+
+def _dumps_record(record: Dict[str, Any]) -> bytes:
+    """Serialize one case record as a newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, separators=(",", ":")) + "\n").encode()
+
+
+def _loads_metadata(data: bytes) -> Dict[str, Any]:
+    """Parse cases metadata from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _format_created(metadata: Dict[str, Any]) -> str:
+    """Format a case's creation time as an ISO 8601 string."""
+    if "created_ns" in metadata:
+        return datetime.fromtimestamp(metadata["created_ns"] / 1e9).isoformat()
+    return metadata.get("created", "N/A")
+
+
+@lru_cache(maxsize=256)
+def _dict_values_re(keys: Tuple[str, ...]) -> re.Pattern:
+    """Compiled pattern matching numeric entries (key  value;) for any of keys."""
+    alternatives = "|".join(map(re.escape, keys))
+    return re.compile(rf'(({alternatives})\s+)[0-9.eE+-]+(\s*;)')
+
+
+@lru_cache(maxsize=256)
+def _patch_headers_re(patch_names: Tuple[str, ...]) -> re.Pattern:
+    """Compiled pattern matching the opening of any of the boundary patch blocks."""
+    alternatives = "|".join(map(re.escape, patch_names))
+    return re.compile(rf'\b({alternatives})\s*\{{')
+
+
+_INTERNAL_FIELD_RE = re.compile(r'(internalField\s+uniform\s+)[0-9.eE+-]+(\s*;)')
+_BRACE_RE = re.compile(r'[{}]')
+_PATCH_VALUE_RE = re.compile(r'(\bvalue\s+uniform\s+)[^;]+(;)')
+
+
+def _matching_brace(content: str, open_index: int) -> int:
+    """Index of the brace closing the one at open_index, or -1 if unbalanced."""
+    depth = 0
+    for match in _BRACE_RE.finditer(content, open_index):
+        depth += 1 if match.group() == "{" else -1
+        if depth == 0:
+            return match.start()
+    return -1
+
+
+def _validate_temperature(temp: float, name: str) -> float:
+    """Validate temperature is in reasonable Kelvin range for casting."""
+    if temp < 200:
+        raise ValueError(
+            f"{name} = {temp} K is too low. "
+            f"Temperatures must be in Kelvin (not Celsius). "
+            f"Did you mean {temp + 273.15} K ({temp}°C)?"
+        )
+    if temp > 3500:
+        raise ValueError(
+            f"{name} = {temp} K is unrealistically high for casting. "
+            f"Maximum is ~3500 K. Check units (must be Kelvin)."
+        )
+    return temp
+
+
+# Mesh dictionary bodies; foam_file() adds the banner and FoamFile header
+_BLOCK_MESH_TEMPLATE = Template("""
+scale   1;
+
+vertices
+(
+    (0 0 0)
+    (${length} 0 0)
+    (${length} ${width} 0)
+    (0 ${width} 0)
+    (0 0 ${height})
+    (${length} 0 ${height})
+    (${length} ${width} ${height})
+    (0 ${width} ${height})
+);
+
+blocks
+(
+    hex (0 1 2 3 4 5 6 7) (${nx} ${ny} ${nz}) simpleGrading (1 1 1)
+);
+
+edges
+(
+);
+
+boundary
+(
+    walls
+    {
+        type wall;
+        faces
+        (
+            (0 4 7 3)
+            (2 6 5 1)
+            (1 5 4 0)
+            (3 7 6 2)
+        );
+    }
+    inlet
+    {
+        type patch;
+        faces
+        (
+            (0 3 2 1)
+        );
+    }
+    outlet
+    {
+        type patch;
+        faces
+        (
+            (4 5 6 7)
+        );
+    }
+);
+
+mergePatchPairs
+(
+);
+""")
+
+_SNAPPY_HEX_MESH_TEMPLATE = Template("""
+castellatedMesh true;
+snap            true;
+addLayers       false;
+
+geometry
+{
+    ${stl_name}
+    {
+        type triSurfaceMesh;
+        name casting;
+    }
+};
+
+castellatedMeshControls
+{
+    maxLocalCells 100000;
+    maxGlobalCells 2000000;
+    minRefinementCells 0;
+    nCellsBetweenLevels 2;
+    features        ( );
+    refinementSurfaces
+    {
+        casting
+        {
+            level (${min_ref} ${max_ref});
+        }
+    }
+    resolveFeatureAngle 30;
+    refinementRegions   {}
+    locationInMesh (0.001 0.001 0.001);
+    allowFreeStandingZoneFaces true;
+}
+
+snapControls
+{
+    nSmoothPatch 3;
+    tolerance 2.0;
+    nSolveIter 30;
+    nRelaxIter 5;
+}
+
+addLayersControls
+{
+    relativeSizes true;
+    layers        {}
+    expansionRatio 1.0;
+    finalLayerThickness 0.3;
+    minThickness 0.1;
+    nGrow 0;
+    featureAngle 30;
+    nRelaxIter 3;
+    nSmoothSurfaceNormals 1;
+    nSmoothNormals 3;
+    nSmoothThickness 10;
+    maxFaceThicknessRatio 0.5;
+    maxThicknessToMedialRatio 0.3;
+    minMedianAxisAngle 90;
+    nBufferCellsNoExtrude 0;
+    nLayerIter 50;
+}
+
+meshQualityControls
+{
+    maxNonOrtho 65;
+    maxBoundarySkewness 20;
+    maxInternalSkewness 4;
+    maxConcave 80;
+    minFlatness 0.5;
+    minVol 1e-13;
+    minTetQuality 1e-30;
+    minArea -1;
+    minTwist 0.02;
+    minDeterminant 0.001;
+    minFaceWeight 0.02;
+    minVolRatio 0.01;
+    minTriangleTwist -1;
+    nSmoothScale 4;
+    errorReduction 0.75;
+}
+
+debug 0;
+mergeTolerance 1e-6;
+""")
 
 
 class CaseManager:
     """Manager for OpenFOAM simulation cases."""
 
+    # Parsed metadata shared by every manager in the process, keyed by the
+    # resolved run directory and validated against the on-disk stamp
+    # (snapshot mtime, log size).
+    _METADATA_CACHE: Dict[Path, Tuple[Dict[str, Any], Tuple[int, int]]] = {}
+
+    # Log size in bytes beyond which an append triggers a compaction
+    LOG_COMPACT_BYTES = 1 << 20
+
     def __init__(self, run_dir: Optional[str] = None):
         """Initialize case manager.
 
@@ -23,20 +289,175 @@ class CaseManager:
         self.run_dir = Path(run_dir) if run_dir else Path.home() / "foam" / "run"
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
+        # Metadata lives in a snapshot plus an append-only log of case
+        # records written since the snapshot was taken
         self.metadata_file = self.run_dir / ".cases_metadata.json"
-        self.metadata = self._load_metadata()
+        self.metadata_log = self.run_dir / ".cases_metadata.jsonl"
+        # Appends hold it shared and compaction exclusive, so no record can
+        # land between a compaction's read of the log and its unlink
+        self.metadata_lock = self.run_dir / ".cases_metadata.lock"
+        self._cache_key = self.run_dir.resolve()
+        self._pending: List[str] = []
+        self._batch_depth = 0
+        self._set_metadata(self._load_metadata())
+
+    async def __aenter__(self) -> "CaseManager":
+        """Defer metadata writes until the context exits."""
+        self._batch_depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def close(self):
+        """Write any pending metadata changes and compact the log."""
+        if self._pending or self.metadata_log.exists():
+            self.compact()
+
+    def _set_metadata(self, metadata: Dict[str, Any]):
+        """Replace the in-memory metadata and regroup cases by type."""
+        self.metadata = metadata
+
+        # Case names grouped by case type; dicts act as insertion-ordered sets
+        self._by_type: Dict[str, Dict[str, None]] = defaultdict(dict)
+        for case_name, case_metadata in metadata.items():
+            self._by_type[case_metadata.get("type")][case_name] = None
+
+    @contextmanager
+    def _locked_metadata(self, exclusive: bool = False):
+        """Hold the run directory's metadata lock file.
+
+        Args:
+            exclusive: Take the lock exclusively (compaction) rather than
+                shared (appends)
+        """
+        fd = os.open(self.metadata_lock, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            yield
+        finally:
+            # Closing the descriptor releases the lock
+            os.close(fd)
+
+    def _metadata_stamp(self) -> Tuple[int, int]:
+        """Identify the on-disk metadata state as (snapshot mtime, log size)."""
+        try:
+            snapshot_ns = self.metadata_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            snapshot_ns = 0
+        try:
+            log_size = self.metadata_log.stat().st_size
+        except FileNotFoundError:
+            log_size = 0
+        return snapshot_ns, log_size
 
     def _load_metadata(self) -> Dict[str, Any]:
-        """Load cases metadata."""
-        if self.metadata_file.exists():
-            with open(self.metadata_file, 'r') as f:
-                return json.load(f)
-        return {}
+        """Load cases metadata, reusing the cached copy if nothing changed on disk."""
+        stamp = self._metadata_stamp()
+
+        cached = self._METADATA_CACHE.get(self._cache_key)
+        if cached and cached[1] == stamp:
+            return dict(cached[0])
+
+        metadata = {}
+        if stamp[0]:
+            metadata = _loads_metadata(self.metadata_file.read_bytes())
+        if stamp[1]:
+            # Replay the log on top of the snapshot; later records win
+            with open(self.metadata_log, "rb") as f:
+                for line in f:
+                    try:
+                        record = _loads_metadata(line)
+                    except ValueError:
+                        continue  # torn record from an interrupted append
+                    if record.get("_deleted"):
+                        metadata.pop(record["name"], None)
+                    else:
+                        metadata[record["name"]] = record
+
+        self._METADATA_CACHE[self._cache_key] = (metadata, stamp)
+        return dict(metadata)
+
+    def _record_case(self, case_name: str):
+        """Queue a case record for the log, appending it now unless inside a batch.
+
+        A case no longer present in the metadata is logged as a tombstone.
+        """
+        if case_name not in self.metadata:
+            for case_names in self._by_type.values():
+                case_names.pop(case_name, None)
+
+        self._pending.append(case_name)
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self):
+        """Append pending case records to the metadata log."""
+        if not self._pending:
+            return
+
+        with self._locked_metadata():
+            log_size = self._append_pending()
+
+        # Bound replay time and superseded records left in the log
+        if log_size > self.LOG_COMPACT_BYTES:
+            self.compact()
+
+    def _append_pending(self) -> int:
+        """Append the pending case records to the log.
+
+        The caller must hold the metadata lock.
+
+        Returns:
+            Size of the log after the append
+        """
+        records = [
+            self.metadata.get(case_name, {"name": case_name, "_deleted": True})
+            for case_name in self._pending
+        ]
+        data = b"".join(_dumps_record(record) for record in records)
+        log_size = append_file(self.metadata_log, data)
+
+        # Extend the shared cache only if it reflected the log just
+        # before this append; otherwise the next load re-reads it
+        cached = self._METADATA_CACHE.get(self._cache_key)
+        if cached and cached[1][1] == log_size - len(data):
+            for record in records:
+                if record.get("_deleted"):
+                    cached[0].pop(record["name"], None)
+                else:
+                    cached[0][record["name"]] = record
+            self._METADATA_CACHE[self._cache_key] = (cached[0], (cached[1][0], log_size))
+
+        self._pending.clear()
+        return log_size
+
+    def compact(self):
+        """Fold the log into a fresh snapshot and drop it.
+
+        Every manager in the run directory appends to the same log, so the
+        snapshot is rebuilt from the snapshot and log on disk rather than
+        from this manager's view, which may lack other managers' cases.
+        This manager's pending records are appended first; the merged
+        metadata then replaces its in-memory copy.
+        """
+        with self._locked_metadata(exclusive=True):
+            if self._pending:
+                self._append_pending()
+
+            self._METADATA_CACHE.pop(self._cache_key, None)
+            metadata = self._load_metadata()
 
-    def _save_metadata(self):
-        """Save cases metadata."""
-        with open(self.metadata_file, 'w') as f:
-            json.dump(self.metadata, f, indent=2)
+            write_file_atomic(self.metadata_file, _dumps_metadata(metadata))
+            # A crash before the unlink only replays records the snapshot already has
+            self.metadata_log.unlink(missing_ok=True)
+
+            self._METADATA_CACHE[self._cache_key] = (dict(metadata), self._metadata_stamp())
+
+        self._set_metadata(metadata)
 
     async def create_case(
         self,
@@ -60,33 +481,22 @@ class CaseManager:
         """
         case_dir = self.run_dir / case_name
 
-        if case_dir.exists():
-            raise ValueError(f"Case {case_name} already exists")
-
-        logger.info(f"Creating case: {case_name} at {case_dir}")
-
-        # Create case directory structure
-        case_dir.mkdir(parents=True)
-        (case_dir / "0").mkdir()
-        (case_dir / "constant").mkdir()
-        (case_dir / "system").mkdir()
-
         # Use CaseBuilder to create appropriate template
         builder = CaseBuilder(case_type)
         builder.set_metal_type(metal_type)
         builder.set_pouring_temperature(pouring_temperature)
         builder.set_mold_material(mold_material)
 
-        # Build case files
-        case_files = builder.build()
-
-        # Write files to case directory
-        for file_path, content in case_files.items():
-            full_path = case_dir / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
+        case_files = {
+            case_dir / file_path: content for file_path, content in builder.iter_files()
+        }
 
-            with open(full_path, 'w') as f:
-                f.write(content)
+        # Claim the case directory with every directory the files need, then
+        # write the generated files concurrently
+        await asyncio.to_thread(
+            self._make_case_dir, case_name, case_dir, {path.parent for path in case_files}
+        )
+        await self._write_case_files_concurrently(case_files)
 
         # Save metadata
         self.metadata[case_name] = {
@@ -95,11 +505,12 @@ class CaseManager:
             "metal_type": metal_type,
             "pouring_temperature": pouring_temperature,
             "mold_material": mold_material,
-            "created": datetime.now().isoformat(),
+            "created_ns": time.time_ns(),
             "status": "created",
             "path": str(case_dir)
         }
-        self._save_metadata()
+        self._by_type[case_type][case_name] = None
+        self._record_case(case_name)
 
         return {
             "name": case_name,
@@ -107,29 +518,119 @@ class CaseManager:
             "status": "created"
         }
 
-    async def list_cases(self, filter_type: Optional[str] = None) -> List[Dict[str, Any]]:
+    def _make_case_dir(self, case_name: str, case_dir: Path, subdirs: Iterable[Path] = ()):
+        """Create a new case directory with the standard OpenFOAM layout.
+
+        Args:
+            case_name: Name of the case
+            case_dir: Case directory to create
+            subdirs: Additional directories inside the case to create
+        """
+        # Create case directory; mkdir itself reports an existing case
+        try:
+            case_dir.mkdir(parents=True)
+        except FileExistsError:
+            raise ValueError(f"Case {case_name} already exists") from None
+
+        logger.info(f"Creating case: {case_name} at {case_dir}")
+
+        # Create case directory structure; the tree is new, so each
+        # directory is a single mkdir
+        standard_dirs = {case_dir / subdir for subdir in ("0", "constant", "system")}
+        make_dirs(standard_dirs.union(subdirs) - {case_dir})
+
+    async def _write_case_files_concurrently(self, case_files: Dict[Path, bytes]):
+        """Write files from worker threads so the writes overlap.
+
+        Parent directories must already exist.
+
+        Args:
+            case_files: Mapping of file path to encoded content
+        """
+        await asyncio.gather(*(
+            asyncio.to_thread(write_file, path, content)
+            for path, content in case_files.items()
+        ))
+
+    def _case_dir(self, case_name: str) -> Path:
+        """Get the directory of an existing case.
+
+        Cases registered in metadata are trusted without a filesystem check;
+        unregistered directories (e.g. copies made by a parametric study)
+        fall back to checking the disk.
+
+        Args:
+            case_name: Name of the case
+
+        Returns:
+            Path to the case directory
+        """
+        case_dir = self.run_dir / case_name
+
+        if case_name not in self.metadata and not case_dir.is_dir():
+            raise ValueError(f"Case {case_name} does not exist")
+
+        return case_dir
+
+    def _write_case_files(self, case_dir: Path, case_files: Iterable[Tuple[str, bytes]]):
+        """Write files into a case directory.
+
+        Args:
+            case_dir: Case directory
+            case_files: Iterable of (case-relative path, encoded content) pairs
+        """
+        case_files = [(case_dir / file_path, content) for file_path, content in case_files]
+
+        make_dirs(full_path.parent for full_path, _ in case_files)
+        for full_path, content in case_files:
+            write_file(full_path, content)
+
+    async def _read(self, path: Path) -> str:
+        """Read a text file in a worker thread."""
+        return await asyncio.to_thread(path.read_text)
+
+    async def _write(self, path: Path, content: str):
+        """Write a text file in a worker thread."""
+        await asyncio.to_thread(path.write_text, content)
+
+    async def list_cases(
+        self,
+        filter_type: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """List all cases.
 
         Args:
             filter_type: Optional filter by case type
+            limit: Optional maximum number of cases to return
 
         Returns:
             List of case information dictionaries
         """
-        cases = []
+        return list(islice(self.iter_cases(filter_type), limit))
 
-        for case_name, metadata in self.metadata.items():
-            if filter_type and metadata.get("type") != filter_type:
-                continue
+    def iter_cases(self, filter_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over cases lazily, in creation order.
 
-            cases.append({
+        Args:
+            filter_type: Optional filter by case type
+
+        Yields:
+            Case information dictionaries
+        """
+        if filter_type:
+            case_names = self._by_type.get(filter_type, {})
+        else:
+            case_names = self.metadata
+
+        for case_name in case_names:
+            metadata = self.metadata[case_name]
+            yield {
                 "name": case_name,
                 "type": metadata.get("type", "unknown"),
                 "status": metadata.get("status", "unknown"),
-                "created": metadata.get("created", "N/A")
-            })
-
-        return cases
+                "created": _format_created(metadata)
+            }
 
     async def setup_geometry(
         self,
@@ -151,25 +652,14 @@ class CaseManager:
         Returns:
             Dictionary with setup information
         """
-        case_dir = self.run_dir / case_name
-
-        if not case_dir.exists():
-            raise ValueError(f"Case {case_name} does not exist")
+        case_dir = self._case_dir(case_name)
 
         if geometry_type == "stl_file":
             if not stl_path:
                 raise ValueError("stl_path required for stl_file geometry type")
 
-            # Copy STL to case constant/triSurface directory
-            tri_surface_dir = case_dir / "constant" / "triSurface"
-            tri_surface_dir.mkdir(parents=True, exist_ok=True)
-
             stl_file = Path(stl_path)
-            dest_stl = tri_surface_dir / stl_file.name
-            shutil.copy(stl_path, dest_stl)
-
-            # Create snappyHexMeshDict
-            self._create_snappy_dict(case_dir, stl_file.name, mesh_refinement)
+            await asyncio.to_thread(self._import_stl, case_dir, stl_file, mesh_refinement)
 
             return {
                 "geometry_type": "stl_file",
@@ -182,7 +672,9 @@ class CaseManager:
             if not dimensions:
                 dimensions = {"length": 0.1, "width": 0.1, "height": 0.1}
 
-            self._create_block_mesh_dict(case_dir, dimensions, mesh_refinement)
+            await asyncio.to_thread(
+                self._create_block_mesh_dict, case_dir, dimensions, mesh_refinement
+            )
 
             return {
                 "geometry_type": "blockMesh",
@@ -193,6 +685,30 @@ class CaseManager:
         else:
             raise ValueError(f"Unsupported geometry type: {geometry_type}")
 
+    def _import_stl(self, case_dir: Path, stl_file: Path, mesh_refinement: str):
+        """Bring an STL file into a case and configure snappyHexMesh for it.
+
+        The STL is copied, never linked: the user's file stays independent of
+        the case, so neither can change the other afterwards. Copies made
+        from the case (parametric clones) may then share it by hardlink.
+        """
+        # Copy STL into case constant/triSurface directory
+        tri_surface_dir = case_dir / "constant" / "triSurface"
+        try:
+            tri_surface_dir.mkdir(parents=True)
+        except FileExistsError:
+            pass  # re-import; skips the is_dir() stat exist_ok=True would add
+
+        dest_stl = tri_surface_dir / stl_file.name
+        if dest_stl.resolve() != stl_file.resolve():
+            # Unlink first: an earlier import may have left a link to the
+            # user's file, which writing through would overwrite
+            dest_stl.unlink(missing_ok=True)
+            copy_file(stl_file, dest_stl)
+
+        # Create snappyHexMeshDict
+        self._create_snappy_dict(case_dir, stl_file.name, mesh_refinement)
+
     def _create_block_mesh_dict(
         self,
         case_dir: Path,
@@ -205,98 +721,25 @@ class CaseManager:
         height = dimensions.get("height", 0.1)
 
         # Set mesh resolution based on refinement level
-        refinement_map = {
-            "coarse": 10,
-            "medium": 20,
-            "fine": 40,
-            "very_fine": 80
-        }
-        cells_per_dim = refinement_map.get(mesh_refinement, 20)
-
-        nx = int(length / 0.01 * (cells_per_dim / 20))
-        ny = int(width / 0.01 * (cells_per_dim / 20))
-        nz = int(height / 0.01 * (cells_per_dim / 20))
-
-        block_mesh_dict = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      blockMeshDict;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-scale   1;
-
-vertices
-(
-    (0 0 0)
-    ({length} 0 0)
-    ({length} {width} 0)
-    (0 {width} 0)
-    (0 0 {height})
-    ({length} 0 {height})
-    ({length} {width} {height})
-    (0 {width} {height})
-);
-
-blocks
-(
-    hex (0 1 2 3 4 5 6 7) ({nx} {ny} {nz}) simpleGrading (1 1 1)
-);
-
-edges
-(
-);
-
-boundary
-(
-    walls
-    {{
-        type wall;
-        faces
-        (
-            (0 4 7 3)
-            (2 6 5 1)
-            (1 5 4 0)
-            (3 7 6 2)
-        );
-    }}
-    inlet
-    {{
-        type patch;
-        faces
-        (
-            (0 3 2 1)
-        );
-    }}
-    outlet
-    {{
-        type patch;
-        faces
-        (
-            (4 5 6 7)
-        );
-    }}
-);
-
-mergePatchPairs
-(
-);
-
-// ************************************************************************* //
-"""
-
-        block_mesh_path = case_dir / "system" / "blockMeshDict"
-        with open(block_mesh_path, 'w') as f:
-            f.write(block_mesh_dict)
+        cells_per_dim = _BLOCK_MESH_REFINEMENT.get(mesh_refinement, 20)
+
+        # Cells per metre: length / 0.01 * (cells_per_dim / 20) == length * scale.
+        # Round rather than truncate and never emit a zero cell count,
+        # which blockMesh rejects
+        scale = cells_per_dim * 5.0
+        nx = max(1, round(length * scale))
+        ny = max(1, round(width * scale))
+        nz = max(1, round(height * scale))
+
+        block_mesh_dict = foam_file(
+            "system/blockMeshDict",
+            "dictionary",
+            _BLOCK_MESH_TEMPLATE.substitute(
+                length=length, width=width, height=height, nx=nx, ny=ny, nz=nz
+            )
+        ).encode()
+
+        self._write_case_files(case_dir, [("system/blockMeshDict", block_mesh_dict)])
 
     def _create_snappy_dict(
         self,
@@ -306,119 +749,17 @@ mergePatchPairs
     ):
         """Create snappyHexMeshDict file."""
         # This is a simplified version - would need more sophistication for production
-        refinement_map = {
-            "coarse": (2, 2),
-            "medium": (3, 3),
-            "fine": (4, 4),
-            "very_fine": (5, 5)
-        }
-        min_ref, max_ref = refinement_map.get(mesh_refinement, (3, 3))
-
-        snappy_dict = f"""/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    object      snappyHexMeshDict;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-castellatedMesh true;
-snap            true;
-addLayers       false;
-
-geometry
-{{
-    {stl_name}
-    {{
-        type triSurfaceMesh;
-        name casting;
-    }}
-}};
-
-castellatedMeshControls
-{{
-    maxLocalCells 100000;
-    maxGlobalCells 2000000;
-    minRefinementCells 0;
-    nCellsBetweenLevels 2;
-    features        ( );
-    refinementSurfaces
-    {{
-        casting
-        {{
-            level ({min_ref} {max_ref});
-        }}
-    }}
-    resolveFeatureAngle 30;
-    refinementRegions   {{}}
-    locationInMesh (0.001 0.001 0.001);
-    allowFreeStandingZoneFaces true;
-}}
-
-snapControls
-{{
-    nSmoothPatch 3;
-    tolerance 2.0;
-    nSolveIter 30;
-    nRelaxIter 5;
-}}
-
-addLayersControls
-{{
-    relativeSizes true;
-    layers        {{}}
-    expansionRatio 1.0;
-    finalLayerThickness 0.3;
-    minThickness 0.1;
-    nGrow 0;
-    featureAngle 30;
-    nRelaxIter 3;
-    nSmoothSurfaceNormals 1;
-    nSmoothNormals 3;
-    nSmoothThickness 10;
-    maxFaceThicknessRatio 0.5;
-    maxThicknessToMedialRatio 0.3;
-    minMedianAxisAngle 90;
-    nBufferCellsNoExtrude 0;
-    nLayerIter 50;
-}}
+        min_ref, max_ref = _SNAPPY_REFINEMENT.get(mesh_refinement, (3, 3))
 
-meshQualityControls
-{{
-    maxNonOrtho 65;
-    maxBoundarySkewness 20;
-    maxInternalSkewness 4;
-    maxConcave 80;
-    minFlatness 0.5;
-    minVol 1e-13;
-    minTetQuality 1e-30;
-    minArea -1;
-    minTwist 0.02;
-    minDeterminant 0.001;
-    minFaceWeight 0.02;
-    minVolRatio 0.01;
-    minTriangleTwist -1;
-    nSmoothScale 4;
-    errorReduction 0.75;
-}}
+        snappy_dict = foam_file(
+            "system/snappyHexMeshDict",
+            "dictionary",
+            _SNAPPY_HEX_MESH_TEMPLATE.substitute(
+                stl_name=stl_name, min_ref=min_ref, max_ref=max_ref
+            )
+        ).encode()
 
-debug 0;
-mergeTolerance 1e-6;
-
-// ************************************************************************* //
-"""
-
-        snappy_path = case_dir / "system" / "snappyHexMeshDict"
-        with open(snappy_path, 'w') as f:
-            f.write(snappy_dict)
+        self._write_case_files(case_dir, [("system/snappyHexMeshDict", snappy_dict)])
 
     async def setup_material_properties(
         self,
@@ -437,10 +778,7 @@ mergeTolerance 1e-6;
         Returns:
             Dictionary with setup info
         """
-        case_dir = self.run_dir / case_name
-
-        if not case_dir.exists():
-            raise ValueError(f"Case {case_name} does not exist")
+        case_dir = self._case_dir(case_name)
 
         updated_files = []
 
@@ -448,28 +786,24 @@ mergeTolerance 1e-6;
         if metal_properties:
             metal_props_file = case_dir / "constant" / "physicalProperties.metal"
             if metal_props_file.exists():
-                with open(metal_props_file, 'r') as f:
-                    content = f.read()
-
-                # Update density
-                if "density" in metal_properties:
-                    content = self._update_dict_value(content, "rho", metal_properties["density"])
+                original = content = await self._read(metal_props_file)
 
-                # Update specific heat
-                if "specific_heat" in metal_properties:
-                    content = self._update_dict_value(content, "Cp", metal_properties["specific_heat"])
-
-                # Update viscosity (dynamic)
-                if "viscosity" in metal_properties:
-                    content = self._update_dict_value(content, "mu", metal_properties["viscosity"])
+                # Density, specific heat and (dynamic) viscosity, in one pass
+                property_keys = {"density": "rho", "specific_heat": "Cp", "viscosity": "mu"}
+                updates = {
+                    key: metal_properties[name]
+                    for name, key in property_keys.items()
+                    if name in metal_properties
+                }
+                content = self._update_dict_values(content, updates)
 
                 # Update thermal conductivity (if using const transport with Pr)
                 # Note: For const transport with Pr, k = mu * Cp / Pr
                 # OpenFOAM calculates k internally, so we just update mu and Pr
 
-                with open(metal_props_file, 'w') as f:
-                    f.write(content)
-                updated_files.append("physicalProperties.metal")
+                if content != original:
+                    await self._write(metal_props_file, content)
+                    updated_files.append("physicalProperties.metal")
 
         # Update mold/wall properties if provided
         # For thermal boundary conditions, this is typically handled via boundary conditions
@@ -482,22 +816,24 @@ mergeTolerance 1e-6;
             "files_updated": updated_files
         }
 
-    def _update_dict_value(self, content: str, key: str, value: float) -> str:
-        """Update a value in an OpenFOAM dictionary.
+    def _update_dict_values(self, content: str, updates: Dict[str, float]) -> str:
+        """Update values in an OpenFOAM dictionary in a single pass.
 
         Args:
             content: File content
-            key: Dictionary key
-            value: New value
+            updates: Mapping of dictionary key to new value
 
         Returns:
             Updated content
         """
-        import re
+        if not updates:
+            return content
+
+        def replace_value(match):
+            return f"{match.group(1)}{updates[match.group(2)]}{match.group(3)}"
+
         # Pattern matches: key  value; (with flexible whitespace)
-        pattern = rf'({key}\s+)[0-9.eE+-]+(\s*;)'
-        replacement = rf'\g<1>{value}\g<2>'
-        return re.sub(pattern, replacement, content)
+        return _dict_values_re(tuple(updates)).sub(replace_value, content)
 
     async def setup_boundary_conditions(
         self,
@@ -530,99 +866,19 @@ mergeTolerance 1e-6;
 
             Values outside 200-3500 K are rejected with clear error messages.
         """
-        case_dir = self.run_dir / case_name
-
-        if not case_dir.exists():
-            raise ValueError(f"Case {case_name} does not exist")
+        case_dir = self._case_dir(case_name)
 
         updated_files = []
-        import re
-
-        # Validate temperature inputs (Kelvin only, no conversion)
-        def validate_temperature(temp: float, name: str) -> float:
-            """Validate temperature is in reasonable Kelvin range for casting."""
-            if temp < 200:
-                raise ValueError(
-                    f"{name} = {temp} K is too low. "
-                    f"Temperatures must be in Kelvin (not Celsius). "
-                    f"Did you mean {temp + 273.15} K ({temp}°C)?"
-                )
-            if temp > 3500:
-                raise ValueError(
-                    f"{name} = {temp} K is unrealistically high for casting. "
-                    f"Maximum is ~3500 K. Check units (must be Kelvin)."
-                )
-            return temp
-
-        # Update velocity field (0/U)
-        if "inlet_velocity" in kwargs:
-            u_file = case_dir / "0" / "U"
-            if u_file.exists():
-                with open(u_file, 'r') as f:
-                    content = f.read()
-
-                # Update inlet velocity (assuming vertical inlet in z-direction)
-                v = kwargs["inlet_velocity"]
-                velocity_vec = f"(0 0 {v})"
-
-                # Update inlet boundary condition
-                content = self._update_boundary_value(content, "inlet", velocity_vec)
 
-                with open(u_file, 'w') as f:
-                    f.write(content)
-                updated_files.append("0/U")
-
-        # Update temperature field (0/T)
+        # U and T are independent files, so their updates run concurrently
+        updates = []
+        if "inlet_velocity" in kwargs:
+            updates.append(self._patch_u(case_dir, kwargs["inlet_velocity"]))
         if any(k in kwargs for k in ["inlet_temperature", "mold_wall_temperature", "ambient_temperature"]):
-            t_file = case_dir / "0" / "T"
-            if t_file.exists():
-                with open(t_file, 'r') as f:
-                    content = f.read()
-
-                if "inlet_temperature" in kwargs:
-                    T_inlet = validate_temperature(kwargs["inlet_temperature"], "inlet_temperature")
-                    content = self._update_boundary_value(content, "inlet", T_inlet)
-
-                if "mold_wall_temperature" in kwargs:
-                    T_wall = validate_temperature(kwargs["mold_wall_temperature"], "mold_wall_temperature")
-                    # Update wall boundary condition
-                    content = self._update_boundary_value(content, "walls", T_wall)
-
-                    # CRITICAL: Set internalField to mold temperature (domain starts at mold temp)
-                    pattern = r'(internalField\s+uniform\s+)[0-9.eE+-]+(\s*;)'
-                    content = re.sub(pattern, rf'\g<1>{T_wall}\g<2>', content)
-
-                    # Update metal Tref to match mold temperature
-                    # For hConst: h = Cp * (T - Tref) + Hf
-                    # When domain starts at T_wall, Tref should be T_wall for sensible initial enthalpy
-                    metal_path = case_dir / "constant" / "physicalProperties.metal"
-                    if metal_path.exists():
-                        with open(metal_path, 'r') as f:
-                            metal_content = f.read()
-                        metal_content = self._update_dict_value(metal_content, "Tref", T_wall)
-                        with open(metal_path, 'w') as f:
-                            f.write(metal_content)
-                        if "constant/physicalProperties.metal" not in updated_files:
-                            updated_files.append("constant/physicalProperties.metal")
-
-                if "ambient_temperature" in kwargs:
-                    T_ambient = validate_temperature(kwargs["ambient_temperature"], "ambient_temperature")
-
-                    # Update gas Tref to ambient temperature
-                    # Gas properties reference ambient conditions
-                    gas_path = case_dir / "constant" / "physicalProperties.gas"
-                    if gas_path.exists():
-                        with open(gas_path, 'r') as f:
-                            gas_content = f.read()
-                        gas_content = self._update_dict_value(gas_content, "Tref", T_ambient)
-                        with open(gas_path, 'w') as f:
-                            f.write(gas_content)
-                        if "constant/physicalProperties.gas" not in updated_files:
-                            updated_files.append("constant/physicalProperties.gas")
-
-                with open(t_file, 'w') as f:
-                    f.write(content)
-                updated_files.append("0/T")
+            updates.append(self._patch_t(case_dir, kwargs))
+
+        for files in await asyncio.gather(*updates):
+            updated_files.extend(files)
 
         # Update heat transfer coefficient if specified (would need mixed BC type)
         if "heat_transfer_coefficient" in kwargs:
@@ -637,26 +893,127 @@ mergeTolerance 1e-6;
             "files_updated": updated_files
         }
 
-    def _update_boundary_value(self, content: str, patch_name: str, value) -> str:
-        """Update a boundary condition value for a specific patch.
+    async def _patch_u(self, case_dir: Path, inlet_velocity: float) -> List[str]:
+        """Update the velocity field (0/U).
 
-        Args:
-            content: File content
-            patch_name: Name of the patch (e.g., "inlet", "walls")
-            value: New value (can be scalar or vector string)
+        Returns:
+            List of updated files
+        """
+        u_file = case_dir / "0" / "U"
+        if not u_file.exists():
+            return []
+
+        original = content = await self._read(u_file)
+
+        # Update inlet velocity (assuming vertical inlet in z-direction)
+        velocity_vec = f"(0 0 {inlet_velocity})"
+
+        # Update inlet boundary condition
+        content = self._update_boundary_values(content, {"inlet": velocity_vec})
+
+        if content == original:
+            return []
+
+        await self._write(u_file, content)
+        return ["0/U"]
+
+    async def _patch_t(self, case_dir: Path, kwargs: Dict[str, Any]) -> List[str]:
+        """Update the temperature field (0/T) and dependent reference temperatures.
 
         Returns:
-            Updated content
+            List of updated files
         """
-        import re
+        t_file = case_dir / "0" / "T"
+        if not t_file.exists():
+            return []
 
-        # Find the patch section
-        patch_pattern = rf'({patch_name}\s*\{{[^}}]*?value\s+uniform\s+)([^;]+)(;)'
+        updated_files = []
+        original = content = await self._read(t_file)
+
+        # Inlet and wall patch values are collected and applied in one pass
+        patch_values = {}
+
+        if "inlet_temperature" in kwargs:
+            T_inlet = _validate_temperature(kwargs["inlet_temperature"], "inlet_temperature")
+            patch_values["inlet"] = T_inlet
+
+        if "mold_wall_temperature" in kwargs:
+            T_wall = _validate_temperature(kwargs["mold_wall_temperature"], "mold_wall_temperature")
+            # Update wall boundary condition
+            patch_values["walls"] = T_wall
+
+            # CRITICAL: Set internalField to mold temperature (domain starts at mold temp)
+            content = _INTERNAL_FIELD_RE.sub(rf'\g<1>{T_wall}\g<2>', content)
+
+            # Update metal Tref to match mold temperature
+            # For hConst: h = Cp * (T - Tref) + Hf
+            # When domain starts at T_wall, Tref should be T_wall for sensible initial enthalpy
+            metal_path = case_dir / "constant" / "physicalProperties.metal"
+            if metal_path.exists():
+                metal_content = await self._read(metal_path)
+                updated = self._update_dict_values(metal_content, {"Tref": T_wall})
+                if updated != metal_content:
+                    await self._write(metal_path, updated)
+                    updated_files.append("constant/physicalProperties.metal")
+
+        if "ambient_temperature" in kwargs:
+            T_ambient = _validate_temperature(kwargs["ambient_temperature"], "ambient_temperature")
+
+            # Update gas Tref to ambient temperature
+            # Gas properties reference ambient conditions
+            gas_path = case_dir / "constant" / "physicalProperties.gas"
+            if gas_path.exists():
+                gas_content = await self._read(gas_path)
+                updated = self._update_dict_values(gas_content, {"Tref": T_ambient})
+                if updated != gas_content:
+                    await self._write(gas_path, updated)
+                    updated_files.append("constant/physicalProperties.gas")
+
+        content = self._update_boundary_values(content, patch_values)
+
+        # Unchanged files are not rewritten, so re-applying a configuration is free
+        if content != original:
+            await self._write(t_file, content)
+            updated_files.append("0/T")
+        return updated_files
+
+    def _update_boundary_values(self, content: str, patch_values: Dict[str, Any]) -> str:
+        """Update boundary condition values for several patches in a single pass.
 
-        def replace_value(match):
-            return f"{match.group(1)}{value}{match.group(3)}"
+        Args:
+            content: File content
+            patch_values: Mapping of patch name (e.g., "inlet", "walls") to new
+                value (can be scalar or vector string)
 
-        return re.sub(patch_pattern, replace_value, content, flags=re.DOTALL)
+        Returns:
+            Updated content
+        """
+        if not patch_values:
+            return content
+
+        # Locate each patch's brace-matched block in one scan and rewrite the
+        # value entry inside that block only
+        pieces = []
+        pos = 0
+        for header in _patch_headers_re(tuple(patch_values)).finditer(content):
+            if header.start() < pos:
+                continue  # nested inside a block that was already handled
+            block_end = _matching_brace(content, header.end() - 1)
+            if block_end < 0:
+                break
+
+            value = patch_values[header.group(1)]
+            block = _PATCH_VALUE_RE.sub(
+                lambda match: f"{match.group(1)}{value}{match.group(2)}",
+                content[header.end():block_end],
+                count=1
+            )
+            pieces.append(content[pos:header.end()])
+            pieces.append(block)
+            pos = block_end
+
+        pieces.append(content[pos:])
+        return "".join(pieces)
 
     async def get_case_status(self, case_name: str) -> Dict[str, Any]:
         """Get status of a case.
@@ -672,10 +1029,34 @@ mergeTolerance 1e-6;
 
         metadata = self.metadata[case_name]
 
+        # Copy so callers cannot mutate the cached entry
+        return dict(self._status_for(
+            metadata.get("status", "unknown"),
+            metadata.get("created_ns"),
+            metadata.get("created")
+        ))
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _status_for(
+        status: str,
+        created_ns: Optional[int],
+        created: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a case status dict, memoized on the metadata it depends on.
+
+        Keying on the metadata values rather than the metadata file's mtime
+        means polling needs no stat call and any change to a case's entry
+        is picked up immediately.
+        """
+        metadata = {"created_ns": created_ns} if created_ns is not None else {}
+        if created is not None:
+            metadata["created"] = created
+
         return {
-            "state": metadata.get("status", "unknown"),
+            "state": status,
             "progress": 0,  # Would parse from log files
-            "last_updated": metadata.get("created", "N/A")
+            "last_updated": _format_created(metadata)
         }
 
     async def optimize_gating(
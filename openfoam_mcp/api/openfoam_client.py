@@ -3,10 +3,102 @@
 import asyncio
 import subprocess
 import os
+import re
+import signal
+import threading
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional
 from loguru import logger
 
+from ..utils.file_io import regex_rewrite, write_file
+
+
+# controlDict entries
+_APPLICATION_RE = re.compile(r'application\s+(\w+);')
+_SOLVER_RE = re.compile(r'solver\s+(\w+);')
+_END_TIME_RE = re.compile(r'endTime\s+[\d.]+;')
+_WRITE_INTERVAL_RE = re.compile(r'writeInterval\s+[\d.]+;')
+
+# checkMesh statistics: "cells:"/"points:" lines and the overall verdict
+# ("Mesh OK." or "***Failed n mesh checks.")
+_MESH_STATS_RE = re.compile(r'^\s*(cells|points):\s+(\S+)|(Mesh OK|Failed)', re.MULTILINE)
+_MESH_STAT_KEYS = {"cells": "num_cells", "points": "num_points"}
+_MESH_STATS_DEFAULTS = {"num_cells": "N/A", "num_points": "N/A", "quality": "N/A"}
+
+# Mesh sizes recorded in the polyMesh/owner header by the mesh writers
+_POLYMESH_NOTE_RE = re.compile(r'note\s+"nPoints:\s*(\d+)\s+nCells:\s*(\d+)')
+
+_SUBDOMAINS_RE = re.compile(r'numberOfSubdomains\s+\d+;')
+
+# Written for a parallel run when the case has no decomposeParDict
+_DECOMPOSE_PAR_DICT = """FoamFile
+{{
+    format      ascii;
+    class       dictionary;
+    object      decomposeParDict;
+}}
+
+numberOfSubdomains {subdomains};
+
+method          scotch;
+"""
+
+
+# OpenFOAM environments captured per installation, shared by all clients
+_FOAM_ENVIRONMENTS: Dict[str, Optional[Dict[str, str]]] = {}
+_FOAM_ENVIRONMENTS_LOCK = threading.Lock()
+
+
+def _foam_environment(foam_dir: str) -> Optional[Dict[str, str]]:
+    """Source an installation's bashrc once and capture the resulting environment.
+
+    The result is kept in _FOAM_ENVIRONMENTS; concurrent first callers wait
+    for a single capture rather than each sourcing the bashrc.
+
+    Args:
+        foam_dir: Path to the OpenFOAM installation
+
+    Returns:
+        Environment mapping, or None if it could not be captured
+    """
+    with _FOAM_ENVIRONMENTS_LOCK:
+        if foam_dir not in _FOAM_ENVIRONMENTS:
+            _FOAM_ENVIRONMENTS[foam_dir] = _snapshot_environment(foam_dir)
+        return _FOAM_ENVIRONMENTS[foam_dir]
+
+
+def _snapshot_environment(foam_dir: str) -> Optional[Dict[str, str]]:
+    """Source the OpenFOAM bashrc and capture the resulting environment.
+
+    Args:
+        foam_dir: Path to the OpenFOAM installation
+
+    Returns:
+        Environment mapping, or None if it could not be captured
+    """
+    bashrc = Path(foam_dir) / "etc" / "bashrc"
+    if not bashrc.is_file():
+        return None
+
+    try:
+        completed = subprocess.run(
+            ["bash", "-c", 'source "$0" && env -0', str(bashrc)],
+            capture_output=True,
+            timeout=60,
+            check=True
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"Could not capture OpenFOAM environment: {e}")
+        return None
+
+    env = {}
+    for entry in completed.stdout.decode(errors="replace").split("\0"):
+        key, sep, value = entry.partition("=")
+        if sep:
+            env[key] = value
+    return env or None
+
 
 class OpenFOAMClient:
     """Client for executing OpenFOAM commands."""
@@ -21,11 +113,24 @@ class OpenFOAMClient:
         self.run_dir = Path.home() / "foam" / "run"
         self.run_dir.mkdir(parents=True, exist_ok=True)
 
+    async def _environment(self) -> Optional[Dict[str, str]]:
+        """Get the OpenFOAM environment, capturing it on first use.
+
+        Returns:
+            Environment mapping, or None if it could not be captured (commands
+            then fall back to sourcing the bashrc in a shell per call)
+        """
+        if self.foam_dir in _FOAM_ENVIRONMENTS:
+            return _FOAM_ENVIRONMENTS[self.foam_dir]
+        return await asyncio.to_thread(_foam_environment, self.foam_dir)
+
     async def run_command(
         self,
         command: list[str],
         case_dir: str,
-        capture_output: bool = True
+        capture_output: bool = True,
+        log_file: Optional[Path] = None,
+        line_handler: Optional[Callable[[str], None]] = None
     ) -> Dict[str, Any]:
         """Run an OpenFOAM command.
 
@@ -33,27 +138,89 @@ class OpenFOAMClient:
             command: Command and arguments to run
             case_dir: Case directory path
             capture_output: Whether to capture stdout/stderr
+            log_file: Stream stdout and stderr to this file instead of
+                capturing them; on failure the end of the log is reported
+                as stderr
+            line_handler: Called with each line of captured stdout as it
+                arrives, so output can be processed while the command runs
 
         Returns:
             Dictionary with returncode, stdout, stderr
         """
         logger.info(f"Running command: {' '.join(command)} in {case_dir}")
-
-        # Source OpenFOAM environment and run command
-        bash_cmd = f"""
-        source {self.foam_dir}/etc/bashrc && \\
-        cd {case_dir} && \\
-        {' '.join(command)}
-        """
-
-        process = await asyncio.create_subprocess_shell(
-            bash_cmd,
-            stdout=asyncio.subprocess.PIPE if capture_output else None,
-            stderr=asyncio.subprocess.PIPE if capture_output else None,
-            executable='/bin/bash'  # Use bash explicitly for 'source' command
-        )
-
-        stdout, stderr = await process.communicate()
+        foam_env = await self._environment()
+
+        log = None
+        if log_file is not None:
+            # Long runs write to disk rather than growing buffers in memory
+            try:
+                log = open(log_file, 'wb')
+            except OSError as e:
+                # E.g. a missing case directory; fail like the command would
+                logger.error(f"Command failed: {e}")
+                return {"returncode": 1, "stdout": "", "stderr": str(e)}
+            stdout_pipe, stderr_pipe = log, asyncio.subprocess.STDOUT
+        elif capture_output:
+            stdout_pipe = stderr_pipe = asyncio.subprocess.PIPE
+        else:
+            stdout_pipe = stderr_pipe = None
+
+        try:
+            if foam_env is not None:
+                # Run the binary directly with the cached OpenFOAM environment
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *command,
+                        cwd=case_dir,
+                        env=foam_env,
+                        stdout=stdout_pipe,
+                        stderr=stderr_pipe,
+                        start_new_session=True  # Own process group, so cancellation can stop it
+                    )
+                except FileNotFoundError as e:
+                    # Report like the shell would: command not found
+                    logger.error(f"Command failed: {e}")
+                    return {"returncode": 127, "stdout": "", "stderr": str(e)}
+            else:
+                # Source OpenFOAM environment and run command
+                bash_cmd = f"""
+                source {self.foam_dir}/etc/bashrc && \\
+                cd {case_dir} && \\
+                {' '.join(command)}
+                """
+
+                process = await asyncio.create_subprocess_shell(
+                    bash_cmd,
+                    stdout=stdout_pipe,
+                    stderr=stderr_pipe,
+                    executable='/bin/bash',  # Use bash explicitly for 'source' command
+                    start_new_session=True  # Own process group, so cancellation can stop it
+                )
+        finally:
+            # The child holds its own descriptor for the log
+            if log is not None:
+                log.close()
+
+        try:
+            if line_handler is not None and process.stdout is not None:
+                stdout, stderr = await asyncio.gather(
+                    self._stream_lines(process.stdout, line_handler),
+                    process.stderr.read() if process.stderr is not None else asyncio.sleep(0)
+                )
+                await process.wait()
+            else:
+                stdout, stderr = await process.communicate()
+        except asyncio.CancelledError:
+            # Kill the command together with any processes it started
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            raise
+
+        if log_file is not None and process.returncode != 0:
+            stderr = await asyncio.to_thread(self._read_log_tail, log_file)
 
         result = {
             "returncode": process.returncode,
@@ -68,11 +235,169 @@ class OpenFOAMClient:
 
         return result
 
+    @staticmethod
+    async def _stream_lines(
+        stream: asyncio.StreamReader,
+        line_handler: Callable[[str], None]
+    ) -> bytes:
+        """Pass each line of a stream to a handler as it arrives.
+
+        Returns:
+            Everything read from the stream
+        """
+        chunks = []
+        async for line in stream:
+            chunks.append(line)
+            line_handler(line.decode())
+        return b"".join(chunks)
+
+    @staticmethod
+    def _read_log_tail(log_file: Path, size: int = 4096) -> bytes:
+        """Read the last bytes of a log file."""
+        with open(log_file, 'rb') as f:
+            f.seek(max(0, os.fstat(f.fileno()).st_size - size))
+            return f.read()
+
+    async def run_pipeline(
+        self,
+        steps: List[List[str]],
+        case_dir: str
+    ) -> List[Dict[str, Any]]:
+        """Run dependent commands in order, stopping at the first failure.
+
+        Each command's output is written to log.<command> in the case
+        directory.
+
+        Args:
+            steps: Commands to run, each given as command and arguments
+            case_dir: Case directory path
+
+        Returns:
+            Results of the commands that ran; only the last can have failed
+        """
+        results = []
+        for command in steps:
+            result = await self.run_command(
+                command, case_dir, log_file=Path(case_dir) / f"log.{command[0]}"
+            )
+            results.append(result)
+            if result["returncode"] != 0:
+                break
+        return results
+
+    async def run_mesh_pipeline(self, case_name: str):
+        """Generate a case's mesh serially, without checkMesh.
+
+        Args:
+            case_name: Name of the case
+
+        Raises:
+            RuntimeError: If a mesh generation step fails
+        """
+        case_dir = self.run_dir / case_name
+
+        steps = self._mesh_steps(case_dir)
+        mesh_results = await self.run_pipeline(steps, str(case_dir))
+        failed = mesh_results[-1]
+        if failed["returncode"] != 0:
+            raise RuntimeError(f"{steps[len(mesh_results) - 1][0]} failed: {failed['stderr']}")
+
+    async def run_case(
+        self,
+        case_name: str,
+        solver: Optional[str] = None,
+        generate_mesh: bool = True,
+        cores: Optional[List[int]] = None
+    ) -> Dict[str, Any]:
+        """Mesh, check and solve a case in one pipeline.
+
+        checkMesh runs between meshing and solving (it writes
+        constant/polyMesh/sets for failed checks, so it must not overlap
+        decomposePar or the solver); a mesh that fails its checks is not
+        solved.
+
+        Args:
+            case_name: Name of the case
+            solver: Solver to use (if None, auto-detect from controlDict)
+            generate_mesh: Run mesh generation first; pass False when the
+                case already has its mesh
+            cores: CPU cores to solve on; with more than one, the solver runs
+                decomposed with one MPI rank bound to each core, and the
+                results are left in the processor directories
+
+        Returns:
+            Dictionary with mesh statistics and simulation results
+        """
+        case_dir = self.run_dir / case_name
+
+        if generate_mesh:
+            await self.run_mesh_pipeline(case_name)
+
+        # Mesh statistics are parsed line by line while checkMesh runs
+        stats = dict(_MESH_STATS_DEFAULTS)
+        checked = await self.run_command(
+            ["checkMesh"], str(case_dir), line_handler=partial(self._update_mesh_stats, stats)
+        )
+        if checked["returncode"] != 0 or stats["quality"] == "FAILED":
+            return {
+                "mesh": stats,
+                "simulation": {
+                    "status": "failed",
+                    "error": "checkMesh failed, solver not run: "
+                             + (checked["stderr"] or "mesh checks failed")
+                }
+            }
+
+        solver_cmd = self._solver_command(case_dir, solver)
+        log_file = case_dir / f"log.{solver_cmd[0]}"
+
+        async def solve() -> Dict[str, Any]:
+            if not cores or len(cores) < 2:
+                return await self.run_command(solver_cmd, str(case_dir), log_file=log_file)
+
+            await asyncio.to_thread(self._set_subdomains, case_dir, len(cores))
+            decomposed = await self.run_command(
+                ["decomposePar", "-force"],
+                str(case_dir),
+                log_file=case_dir / "log.decomposePar"
+            )
+            if decomposed["returncode"] != 0:
+                return decomposed
+
+            return await self.run_command(
+                ["mpirun", "-np", str(len(cores)), "--cpu-set", ",".join(map(str, cores)),
+                 "--bind-to", "core"] + solver_cmd + ["-parallel"],
+                str(case_dir),
+                log_file=log_file
+            )
+
+        return {
+            "mesh": stats,
+            "simulation": self._simulation_result(await solve(), case_dir)
+        }
+
+    @staticmethod
+    def _set_subdomains(case_dir: Path, subdomains: int):
+        """Set numberOfSubdomains, writing a scotch decomposeParDict if there is none."""
+        decompose_dict = case_dir / "system" / "decomposeParDict"
+        if decompose_dict.exists():
+            regex_rewrite(decompose_dict, [(_SUBDOMAINS_RE, f'numberOfSubdomains {subdomains};')])
+        else:
+            write_file(decompose_dict, _DECOMPOSE_PAR_DICT.format(subdomains=subdomains).encode())
+
+    def _mesh_steps(self, case_dir: Path) -> List[List[str]]:
+        """Serial mesh generation commands for a case."""
+        steps = [["blockMesh"]]
+        if (case_dir / "system" / "snappyHexMeshDict").exists():
+            steps.append(["snappyHexMesh", "-overwrite"])
+        return steps
+
     async def run_mesh_generation(
         self,
         case_name: str,
         parallel: bool = False,
-        num_processors: int = 4
+        num_processors: int = 4,
+        check_quality: bool = True
     ) -> Dict[str, Any]:
         """Run mesh generation for a case.
 
@@ -80,6 +405,8 @@ class OpenFOAMClient:
             case_name: Name of the case
             parallel: Whether to run in parallel
             num_processors: Number of processors for parallel execution
+            check_quality: Run checkMesh for the quality verdict; otherwise
+                only the cell and point counts are read from the mesh files
 
         Returns:
             Dictionary with mesh statistics
@@ -87,7 +414,11 @@ class OpenFOAMClient:
         case_dir = self.run_dir / case_name
 
         # Run blockMesh
-        result = await self.run_command(["blockMesh"], str(case_dir))
+        result = await self.run_command(
+            ["blockMesh"],
+            str(case_dir),
+            log_file=case_dir / "log.blockMesh"
+        )
 
         if result["returncode"] != 0:
             raise RuntimeError(f"blockMesh failed: {result['stderr']}")
@@ -101,61 +432,75 @@ class OpenFOAMClient:
                 # Decompose mesh
                 await self.run_command(
                     ["decomposePar"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / "log.decomposePar"
                 )
 
                 # Run snappyHexMesh in parallel
                 await self.run_command(
                     ["mpirun", "-np", str(num_processors), "snappyHexMesh", "-parallel", "-overwrite"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / "log.snappyHexMesh"
                 )
 
                 # Reconstruct mesh
                 await self.run_command(
                     ["reconstructParMesh", "-constant"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / "log.reconstructParMesh"
                 )
             else:
                 await self.run_command(
                     ["snappyHexMesh", "-overwrite"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / "log.snappyHexMesh"
                 )
 
-        # Get mesh statistics
-        check_mesh_result = await self.run_command(
+        if not check_quality:
+            return self._read_polymesh_header(case_dir)
+
+        # Get mesh statistics, parsing the output as checkMesh writes it
+        stats = dict(_MESH_STATS_DEFAULTS)
+        await self.run_command(
             ["checkMesh"],
-            str(case_dir)
+            str(case_dir),
+            line_handler=partial(self._update_mesh_stats, stats)
         )
 
-        # Parse mesh statistics from output
-        stats = self._parse_mesh_stats(check_mesh_result["stdout"])
+        return stats
+
+    def _read_polymesh_header(self, case_dir: Path) -> Dict[str, Any]:
+        """Read cell and point counts from the polyMesh owner file header."""
+        stats = dict(_MESH_STATS_DEFAULTS)
+
+        try:
+            with open(case_dir / "constant" / "polyMesh" / "owner", 'rb') as f:
+                header = f.read(2048).decode('ascii', errors='replace')
+        except OSError:
+            return stats
+
+        match = _POLYMESH_NOTE_RE.search(header)
+        if match:
+            stats["num_points"], stats["num_cells"] = match.groups()
 
         return stats
 
     def _parse_mesh_stats(self, output: str) -> Dict[str, Any]:
         """Parse checkMesh output for statistics."""
-        stats = {
-            "num_cells": "N/A",
-            "num_points": "N/A",
-            "quality": "N/A"
-        }
-
-        for line in output.split("\n"):
-            if "cells:" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    stats["num_cells"] = parts[1]
-            elif "points:" in line:
-                parts = line.split()
-                if len(parts) >= 2:
-                    stats["num_points"] = parts[1]
-            elif "Mesh OK" in line:
-                stats["quality"] = "OK"
-            elif "Failed" in line:
-                stats["quality"] = "FAILED"
-
+        stats = dict(_MESH_STATS_DEFAULTS)
+        self._update_mesh_stats(stats, output)
         return stats
 
+    @staticmethod
+    def _update_mesh_stats(stats: Dict[str, Any], output: str):
+        """Update mesh statistics from (part of) checkMesh output."""
+        for match in _MESH_STATS_RE.finditer(output):
+            name, value, verdict = match.groups()
+            if name:
+                stats[_MESH_STAT_KEYS[name]] = value
+            else:
+                stats["quality"] = "OK" if verdict == "Mesh OK" else "FAILED"
+
     def _detect_solver_from_controldict(self, case_dir: Path) -> tuple[str, Optional[str]]:
         """Detect which solver to use from controlDict.
 
@@ -173,13 +518,11 @@ class OpenFOAMClient:
         with open(control_dict, 'r') as f:
             content = f.read()
 
-        import re
-
         # Check for OpenFOAM 11+ style (foamRun with solver directive)
-        app_match = re.search(r'application\s+(\w+);', content)
+        app_match = _APPLICATION_RE.search(content)
         if app_match and app_match.group(1) == 'foamRun':
             # Extract solver module name
-            solver_match = re.search(r'solver\s+(\w+);', content)
+            solver_match = _SOLVER_RE.search(content)
             if solver_match:
                 solver_module = solver_match.group(1)
                 return ("foamRun", solver_module)
@@ -201,7 +544,8 @@ class OpenFOAMClient:
         end_time: Optional[float] = None,
         write_interval: Optional[float] = None,
         parallel: bool = False,
-        num_processors: int = 4
+        num_processors: int = 4,
+        reconstruct: bool = True
     ) -> Dict[str, Any]:
         """Run OpenFOAM simulation.
 
@@ -212,6 +556,8 @@ class OpenFOAMClient:
             write_interval: Write interval
             parallel: Run in parallel
             num_processors: Number of processors
+            reconstruct: Reconstruct a parallel run's results; the analyzer
+                can also read them from the processor directories
 
         Returns:
             Dictionary with simulation results
@@ -226,29 +572,15 @@ class OpenFOAMClient:
                 write_interval=write_interval
             )
 
-        # Auto-detect solver if not specified
-        solver_app = None
-        solver_module = None
-
-        if solver is None:
-            solver_app, solver_module = self._detect_solver_from_controldict(case_dir)
-            logger.info(f"Auto-detected solver: {solver_app}" +
-                       (f" with module {solver_module}" if solver_module else ""))
-        else:
-            # Legacy: solver provided as string
-            solver_app = solver
-
-        # Build solver command
-        if solver_app == "foamRun" and solver_module:
-            solver_cmd = ["foamRun", "-solver", solver_module]
-        else:
-            solver_cmd = [solver_app]
+        solver_cmd = self._solver_command(case_dir, solver)
+        solver_app = solver_cmd[0]
 
         if parallel:
             # Decompose case
             await self.run_command(
                 ["decomposePar"],
-                str(case_dir)
+                str(case_dir),
+                log_file=case_dir / "log.decomposePar"
             )
 
             # Run solver in parallel
@@ -256,25 +588,51 @@ class OpenFOAMClient:
                 # For foamRun, -parallel goes after -solver
                 result = await self.run_command(
                     ["mpirun", "-np", str(num_processors)] + solver_cmd + ["-parallel"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / f"log.{solver_app}"
                 )
             else:
                 result = await self.run_command(
                     ["mpirun", "-np", str(num_processors), solver_app, "-parallel"],
-                    str(case_dir)
+                    str(case_dir),
+                    log_file=case_dir / f"log.{solver_app}"
                 )
 
             # Reconstruct case
-            await self.run_command(
-                ["reconstructPar"],
-                str(case_dir)
-            )
+            if reconstruct:
+                await self.run_command(
+                    ["reconstructPar"],
+                    str(case_dir),
+                    log_file=case_dir / "log.reconstructPar"
+                )
         else:
             result = await self.run_command(
                 solver_cmd,
-                str(case_dir)
+                str(case_dir),
+                log_file=case_dir / f"log.{solver_app}"
             )
 
+        result = self._simulation_result(result, case_dir)
+        if result["status"] == "completed":
+            result["final_time"] = end_time or "N/A"
+        return result
+
+    def _solver_command(self, case_dir: Path, solver: Optional[str]) -> List[str]:
+        """Build the solver command, auto-detecting the solver if not specified."""
+        if solver is not None:
+            # Legacy: solver provided as string
+            return [solver]
+
+        solver_app, solver_module = self._detect_solver_from_controldict(case_dir)
+        logger.info(f"Auto-detected solver: {solver_app}" +
+                   (f" with module {solver_module}" if solver_module else ""))
+
+        if solver_app == "foamRun" and solver_module:
+            return ["foamRun", "-solver", solver_module]
+        return [solver_app]
+
+    def _simulation_result(self, result: Dict[str, Any], case_dir: Path) -> Dict[str, Any]:
+        """Summarise a solver run."""
         if result["returncode"] != 0:
             return {
                 "status": "failed",
@@ -283,7 +641,7 @@ class OpenFOAMClient:
 
         return {
             "status": "completed",
-            "final_time": end_time or "N/A",
+            "final_time": "N/A",
             "output_dir": str(case_dir)
         }
 
@@ -299,28 +657,14 @@ class OpenFOAMClient:
         if not control_dict_path.exists():
             return
 
-        with open(control_dict_path, 'r') as f:
-            content = f.read()
-
+        # Simple replacement - could use PyFoam for more robust parsing
+        substitutions = []
         if end_time is not None:
-            # Simple replacement - could use PyFoam for more robust parsing
-            import re
-            content = re.sub(
-                r'endTime\s+[\d.]+;',
-                f'endTime        {end_time};',
-                content
-            )
-
+            substitutions.append((_END_TIME_RE, f'endTime        {end_time};'))
         if write_interval is not None:
-            import re
-            content = re.sub(
-                r'writeInterval\s+[\d.]+;',
-                f'writeInterval  {write_interval};',
-                content
-            )
+            substitutions.append((_WRITE_INTERVAL_RE, f'writeInterval  {write_interval};'))
 
-        with open(control_dict_path, 'w') as f:
-            f.write(content)
+        await asyncio.to_thread(regex_rewrite, control_dict_path, substitutions)
 
     async def export_results(
         self,
@@ -4,37 +4,135 @@ This module provides tools for running and comparing multiple simulations
 with different parameters to optimize casting processes.
 """
 
+from collections import OrderedDict
+from functools import partial
+from itertools import product
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import asyncio
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import numpy as np
 from loguru import logger
 
 from .case_manager import CaseManager
 from .openfoam_client import OpenFOAMClient
 from .result_analyzer_real import RealResultAnalyzer
+from ..utils.field_parser import ANALYSIS_CACHE_DIR, OpenFOAMFieldParser
+from ..utils.file_io import clone_tree, link_or_copy, regex_rewrite
+
+
+# Inlet patch values in 0/U (vector) and 0/T (scalar)
+_INLET_U_RE = re.compile(r'(inlet\s*{.*?value\s+uniform\s+)\([^)]+\)', re.DOTALL)
+_INLET_T_RE = re.compile(r'(inlet\s*{.*?value\s+uniform\s+)([\d.]+)', re.DOTALL)
+
+# Case subdirectories shared between a base case and its parametric copies.
+# Everything else is copied: OpenFOAM utilities and the parameter edits
+# rewrite files in place, which would corrupt the base through a hardlink.
+_SHARED_CASE_DIRS = ("constant/triSurface",)
+
+# Files that define a case's mesh; cases whose copies agree share one mesh
+_MESH_FILES = ("system/blockMeshDict", "system/snappyHexMeshDict")
+_MESH_GEOMETRY_DIR = "constant/triSurface"
+
+
+async def _run_in_thread(func, *args):
+    """Run a blocking call in a worker thread, letting it finish if cancelled.
+
+    asyncio.to_thread cannot stop its thread, so a cancelled caller would
+    return while the call is still writing files. Here the cancellation is
+    re-raised only once the thread is done, so the caller can clean up.
+    """
+    future = asyncio.ensure_future(asyncio.to_thread(func, *args))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        while not future.done():
+            try:
+                await asyncio.wait([future])
+            except asyncio.CancelledError:
+                continue
+        raise
+
+
+class _CorePool:
+    """Hands out disjoint sets of CPU cores to concurrently running cases."""
+
+    def __init__(self, cores: List[int]):
+        """Initialize core pool.
+
+        Args:
+            cores: Core ids available to the engine
+        """
+        self.size = len(cores)
+        self._free = sorted(cores)
+        self._changed = asyncio.Condition()
+
+    async def acquire(self, count: int) -> List[int]:
+        """Wait for and take count cores."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: len(self._free) >= count)
+            cores, self._free = self._free[:count], self._free[count:]
+            return cores
+
+    async def release(self, cores: List[int]):
+        """Return cores taken with acquire."""
+        async with self._changed:
+            self._free = sorted(self._free + cores)
+            self._changed.notify_all()
+
+
+class _StudyMeshes:
+    """Meshes shared between the cases of one running study."""
+
+    def __init__(self, directory: Path):
+        """Initialize study meshes.
+
+        Args:
+            directory: Study-owned directory holding the shared meshes
+        """
+        self.directory = directory
+        # Mesh digest -> copy of the mesh generated for it (None if it failed)
+        self.cache: Dict[str, asyncio.Future] = {}
 
 
 class ParametricStudyEngine:
     """Engine for running parametric studies on casting simulations."""
 
-    def __init__(self, run_dir: Optional[str] = None):
+    # Analyses kept for reuse across comparisons (least recently used evicted)
+    ANALYSIS_CACHE_SIZE = 128
+
+    def __init__(self, run_dir: Optional[str] = None, openfoam_client: Optional[OpenFOAMClient] = None):
         """Initialize parametric study engine.
 
         Args:
             run_dir: Directory for simulation cases
+            openfoam_client: Client to run cases with (a new one if None)
         """
         self.run_dir = Path(run_dir) if run_dir else Path.home() / "foam" / "run"
         self.case_manager = CaseManager(run_dir)
-        self.openfoam_client = OpenFOAMClient()
+        self.openfoam_client = openfoam_client or OpenFOAMClient()
         self.analyzer = RealResultAnalyzer(run_dir)
 
-        self.results = {}  # Store results for comparison
+        self.results = {}  # Store results for comparison (case name -> parameters)
+        # (case_name, analysis_type) -> (results stamp, analysis)
+        self._analysis_cache: OrderedDict[Tuple[str, str], Tuple[Tuple, Dict[str, Any]]] = OrderedDict()
+        # Cores partitioned among the running cases of every study when they
+        # solve in parallel; created on first use (see _get_core_pool)
+        self._core_pool: Optional[_CorePool] = None
 
     async def run_parametric_study(
         self,
         base_case_name: str,
         parameters: Dict[str, List[Any]],
-        metric: str = "minimize_porosity"
+        metric: str = "minimize_porosity",
+        max_concurrent: int = 4,
+        early_stop_threshold: Optional[float] = None,
+        processors_per_case: int = 1
     ) -> Dict[str, Any]:
         """Run parametric study by varying parameters.
 
@@ -44,6 +142,13 @@ class ParametricStudyEngine:
                        e.g., {"inlet_velocity": [0.3, 0.5, 0.7],
                               "pouring_temperature": [730, 750, 770]}
             metric: Optimization metric to track
+            max_concurrent: Maximum number of cases simulated at the same time
+            early_stop_threshold: Stop the study as soon as a case scores at or
+                                  below this value (scores are lower-is-better);
+                                  cases still queued or running are cancelled
+            processors_per_case: MPI ranks per case; above 1, the machine's
+                                 cores are split among running cases so that
+                                 concurrent parallel runs never share a core
 
         Returns:
             Dictionary with study results and optimal configuration
@@ -56,37 +161,79 @@ class ParametricStudyEngine:
 
         logger.info(f"Generated {len(combinations)} parameter combinations")
 
-        # Run simulations for each combination
-        study_results = []
+        if processors_per_case > 1 and processors_per_case > self._get_core_pool().size:
+            raise ValueError(
+                f"processors_per_case={processors_per_case} exceeds the "
+                f"{self._get_core_pool().size} available cores"
+            )
 
-        for i, combo in enumerate(combinations):
-            logger.info(f"Running combination {i+1}/{len(combinations)}: {combo}")
+        # Meshes are shared only within a study (a later study recreates the
+        # cases), and live outside every case, so no case's cleanup can
+        # remove one while another case is linking it
+        meshes = _StudyMeshes(Path(tempfile.mkdtemp(prefix=".study_meshes_", dir=self.run_dir)))
+        tasks = []
+        try:
+            # Run simulations for all combinations, at most max_concurrent at a time,
+            # and consume them as they finish
+            semaphore = asyncio.Semaphore(max_concurrent)
+            tasks = [
+                asyncio.create_task(
+                    self._run_combination(
+                        semaphore, meshes, processors_per_case, base_case_name, i, combo, len(combinations)
+                    )
+                )
+                for i, combo in enumerate(combinations)
+            ]
 
-            case_name = self._generate_case_name(base_case_name, combo, i)
+            study_results = []
+            best_score = None
+            early_stopped = False
 
-            try:
-                # Create case with these parameters
-                result = await self._run_case_with_parameters(
-                    base_case_name,
-                    case_name,
-                    combo
-                )
+            for next_result in asyncio.as_completed(tasks):
+                entry = await next_result
+                study_results.append(entry)
 
-                study_results.append({
-                    "case_name": case_name,
-                    "parameters": combo,
-                    "results": result,
-                    "index": i
-                })
+                if "results" not in entry or "error" in entry["results"]:
+                    continue
 
-            except Exception as e:
-                logger.error(f"Error running case {case_name}: {e}")
-                study_results.append({
-                    "case_name": case_name,
-                    "parameters": combo,
-                    "error": str(e),
-                    "index": i
-                })
+                analysis = entry["results"].get("analysis", {})
+                defects = analysis.get("defects", {})
+                score = self._calculate_score(
+                    metric, defects.get("porosity", {}), defects.get("shrinkage", {}), analysis
+                )
+                if best_score is None or score < best_score:
+                    best_score = score
+                    logger.info(f"New best {metric} score {score} from {entry['case_name']}")
+
+                if early_stop_threshold is not None and score <= early_stop_threshold:
+                    logger.info(
+                        f"{entry['case_name']} reached early-stop threshold "
+                        f"{early_stop_threshold}; cancelling remaining cases"
+                    )
+                    early_stopped = True
+                    break
+
+            if early_stopped:
+                for task in tasks:
+                    task.cancel()
+                # Let cancelled cases clean up their directories, and keep the
+                # cases that finished before they could be cancelled
+                reported = {entry["index"] for entry in study_results}
+                for outcome in await asyncio.gather(*tasks, return_exceptions=True):
+                    if isinstance(outcome, dict) and outcome["index"] not in reported:
+                        study_results.append(outcome)
+        finally:
+            # Whether the study stopped early, failed or was itself cancelled,
+            # stop the cases still running (killing their solvers) and let
+            # them clean up before their shared meshes go
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Cases hold hardlinks to the files they use
+            shutil.rmtree(meshes.directory, ignore_errors=True)
+
+        # Report in combination order regardless of completion order
+        study_results.sort(key=itemgetter("index"))
 
         # Compare results and find optimal
         comparison = self._compare_results(study_results, metric)
@@ -95,48 +242,104 @@ class ParametricStudyEngine:
             "total_runs": len(combinations),
             "completed_runs": len([r for r in study_results if "results" in r]),
             "failed_runs": len([r for r in study_results if "error" in r]),
+            "cancelled_runs": len(combinations) - len(study_results),
+            "early_stopped": early_stopped,
             "study_results": study_results,
             "comparison": comparison,
             "optimal_configuration": comparison.get("best_case"),
             "metric": metric
         }
 
-    def _generate_combinations(self, parameters: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
-        """Generate all combinations of parameters.
+    def _get_core_pool(self) -> _CorePool:
+        """Get the engine's core pool, shared by all of its studies.
+
+        One pool for the engine's lifetime means concurrent studies draw
+        from the same free cores, so their cases never share a core.
+
+        Returns:
+            Pool of the cores this process may run on
+        """
+        if self._core_pool is None:
+            cores = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") \
+                else list(range(os.cpu_count() or 1))
+            self._core_pool = _CorePool(cores)
+        return self._core_pool
+
+    async def _run_combination(
+        self,
+        semaphore: asyncio.Semaphore,
+        meshes: _StudyMeshes,
+        processors_per_case: int,
+        base_case_name: str,
+        index: int,
+        combo: Dict[str, Any],
+        total: int
+    ) -> Dict[str, Any]:
+        """Run one parameter combination once a simulation slot is free.
 
         Args:
-            parameters: Dictionary of parameter lists
+            semaphore: Limits the number of concurrently running cases
+            meshes: Meshes shared within the study
+            processors_per_case: MPI ranks per case
+            base_case_name: Base case to vary
+            index: Combination index
+            combo: Parameter values for this combination
+            total: Total number of combinations (for logging)
 
         Returns:
-            List of parameter combination dictionaries
+            Study result entry, with either "results" or "error"
         """
-        if not parameters:
-            return [{}]
+        case_name = self._generate_case_name(base_case_name, combo, index)
+        self.results[case_name] = combo
 
-        # Get keys and values
-        keys = list(parameters.keys())
-        value_lists = [parameters[k] for k in keys]
+        async with semaphore:
+            logger.info(f"Running combination {index+1}/{total}: {combo}")
 
-        # Generate combinations using recursion
-        combinations = []
+            try:
+                # Create case with these parameters
+                result = await self._run_case_with_parameters(
+                    base_case_name,
+                    case_name,
+                    combo,
+                    meshes,
+                    processors_per_case
+                )
 
-        def generate(index: int, current: Dict):
-            if index == len(keys):
-                combinations.append(current.copy())
-                return
+                return {
+                    "case_name": case_name,
+                    "parameters": combo,
+                    "results": result,
+                    "index": index
+                }
 
-            key = keys[index]
-            for value in value_lists[index]:
-                current[key] = value
-                generate(index + 1, current)
-                del current[key]
+            except Exception as e:
+                logger.error(f"Error running case {case_name}: {e}")
+                return {
+                    "case_name": case_name,
+                    "parameters": combo,
+                    "error": str(e),
+                    "index": index
+                }
 
-        generate(0, {})
-        return combinations
+    def _generate_combinations(self, parameters: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+        """Generate all combinations of parameters.
+
+        Args:
+            parameters: Dictionary of parameter lists
+
+        Returns:
+            List of parameter combination dictionaries
+        """
+        keys = list(parameters)
+        return [dict(zip(keys, values)) for values in product(*parameters.values())]
 
     def _generate_case_name(self, base_name: str, params: Dict[str, Any], index: int) -> str:
         """Generate unique case name from parameters.
 
+        The parameters are hashed rather than spelled out, which keeps names
+        short and cannot collide when parameter names share a first letter.
+        self.results maps each name back to its parameters.
+
         Args:
             base_name: Base case name
             params: Parameter values
@@ -145,15 +348,16 @@ class ParametricStudyEngine:
         Returns:
             Generated case name
         """
-        # Create short parameter string
-        param_str = "_".join([f"{k[:1]}{v}" for k, v in params.items()])
-        return f"{base_name}_param{index}_{param_str}"
+        digest = hashlib.blake2b(repr(sorted(params.items())).encode(), digest_size=6).hexdigest()
+        return f"{base_name}_p{index:04d}_{digest}"
 
     async def _run_case_with_parameters(
         self,
         base_case: str,
         new_case: str,
-        parameters: Dict[str, Any]
+        parameters: Dict[str, Any],
+        meshes: _StudyMeshes,
+        processors_per_case: int
     ) -> Dict[str, Any]:
         """Run a case with specific parameter values.
 
@@ -161,6 +365,9 @@ class ParametricStudyEngine:
             base_case: Base case to copy from
             new_case: New case name
             parameters: Parameter values to apply
+            meshes: Meshes shared within the study
+            processors_per_case: MPI ranks for the case; above 1, the case
+                                 solves on cores of its own
 
         Returns:
             Analysis results for this case
@@ -172,39 +379,133 @@ class ParametricStudyEngine:
         if not base_path.exists():
             raise ValueError(f"Base case {base_case} not found")
 
-        # Create new case by copying base
-        import shutil
-        if new_path.exists():
-            shutil.rmtree(new_path)
-        shutil.copytree(base_path, new_path)
+        try:
+            # Create new case by cloning base
+            await _run_in_thread(self._clone_case, base_path, new_path)
 
-        # Modify parameters in new case
-        await self._modify_case_parameters(new_path, parameters)
+            # Modify parameters in new case
+            await self._modify_case_parameters(new_path, parameters)
 
-        # Run simulation
-        mesh_result = await self.openfoam_client.run_mesh_generation(
-            case_name=new_case,
-            parallel=False
-        )
-
-        sim_result = await self.openfoam_client.run_simulation(
-            case_name=new_case,
-            solver=None,  # Auto-detect from controlDict
-            parallel=False
-        )
+            # Reuse the mesh of an earlier case with the same mesh files
+            has_mesh = await self._mesh_from_cache(meshes, base_case, new_case)
 
-        # Analyze results
-        analysis = await self.analyzer.analyze(
-            case_name=new_case,
-            analysis_type="all"
-        )
+            # Mesh and run simulation as one pipeline, on cores of its own
+            # when cases solve in parallel
+            core_pool = self._get_core_pool() if processors_per_case > 1 else None
+            cores = await core_pool.acquire(processors_per_case) if core_pool else None
+            try:
+                run_result = await self.openfoam_client.run_case(
+                    case_name=new_case,
+                    solver=None,  # Auto-detect from controlDict
+                    generate_mesh=not has_mesh,
+                    cores=cores
+                )
+            finally:
+                if cores:
+                    await core_pool.release(cores)
+
+            # Analyze results
+            analysis = await self._analyze_cached(new_case, "all")
+        except asyncio.CancelledError:
+            # A cancelled case's partial results are meaningless; remove them.
+            # File operations run through _run_in_thread, so no worker thread
+            # is still writing into the case
+            await _run_in_thread(partial(shutil.rmtree, new_path, ignore_errors=True))
+            raise
 
         return {
-            "mesh": mesh_result,
-            "simulation": sim_result,
+            "mesh": run_result["mesh"],
+            "simulation": run_result["simulation"],
             "analysis": analysis
         }
 
+    async def _mesh_from_cache(self, meshes: _StudyMeshes, base_case: str, new_case: str) -> bool:
+        """Give a case the mesh generated from identical mesh files.
+
+        Cases are matched on the contents of the files that define the
+        mesh (see _mesh_digest), after their parameters are applied. The
+        first case with a given digest generates the mesh and hardlinks it
+        into the study's mesh directory; the others wait for it and
+        hardlink those polyMesh files, which nothing rewrites once meshing
+        is done.
+
+        Args:
+            meshes: Meshes shared within the study
+            base_case: Base case the study case was cloned from
+            new_case: Study case name
+
+        Returns:
+            True if the case now has its mesh, False if it must generate it
+        """
+        mesh_key = await _run_in_thread(self._mesh_digest, base_case, self.run_dir / new_case)
+        new_mesh = self.run_dir / new_case / "constant" / "polyMesh"
+
+        reference = meshes.cache.get(mesh_key)
+        if reference is not None:
+            mesh_path = await asyncio.shield(reference)
+            if mesh_path is not None:
+                await _run_in_thread(self._link_mesh, mesh_path, new_mesh)
+                return True
+            return False
+
+        meshes.cache[mesh_key] = reference = asyncio.get_running_loop().create_future()
+        try:
+            await self.openfoam_client.run_mesh_pipeline(new_case)
+            shared_mesh = meshes.directory / mesh_key
+            await _run_in_thread(self._link_mesh, new_mesh, shared_mesh)
+            reference.set_result(shared_mesh)
+        finally:
+            if not reference.done():
+                # Let waiting cases mesh themselves; a later case may retry
+                reference.set_result(None)
+                del meshes.cache[mesh_key]
+        return True
+
+    @staticmethod
+    def _mesh_digest(base_case: str, case_path: Path) -> str:
+        """Hash the files that define a case's mesh.
+
+        Args:
+            base_case: Base case the study case was cloned from
+            case_path: Study case directory
+
+        Returns:
+            Hex digest of the base case name, mesh dictionaries and geometry
+        """
+        geometry_dir = case_path / _MESH_GEOMETRY_DIR
+        paths = [case_path / relative for relative in _MESH_FILES]
+        if geometry_dir.is_dir():
+            paths.extend(sorted(p for p in geometry_dir.rglob("*") if p.is_file()))
+
+        digest = hashlib.blake2b(base_case.encode(), digest_size=16)
+        for path in paths:
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                continue
+            digest.update(f"\0{path.relative_to(case_path)}\0{len(data)}\0".encode())
+            digest.update(data)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _link_mesh(mesh_path: Path, new_mesh: Path):
+        """Replace a case's polyMesh with hardlinks to another case's."""
+        if new_mesh.exists():
+            shutil.rmtree(new_mesh)
+        shutil.copytree(mesh_path, new_mesh, copy_function=link_or_copy)
+
+    @staticmethod
+    def _clone_case(base_path: Path, new_path: Path):
+        """Replace new_path with a copy of the base case.
+
+        Args:
+            base_path: Base case directory
+            new_path: New case directory
+        """
+        if new_path.exists():
+            shutil.rmtree(new_path)
+        clone_tree(base_path, new_path, _SHARED_CASE_DIRS, exclude=(ANALYSIS_CACHE_DIR,))
+
     async def _modify_case_parameters(self, case_path: Path, parameters: Dict[str, Any]):
         """Modify OpenFOAM case files to set parameters.
 
@@ -226,43 +527,23 @@ class ParametricStudyEngine:
         u_file = case_path / "0" / "U"
 
         if u_file.exists():
-            with open(u_file, 'r') as f:
-                content = f.read()
-
             # Replace inlet velocity (assumes z-direction inlet)
-            import re
-            content = re.sub(
-                r'(inlet\s*{.*?value\s+uniform\s+)\([^)]+\)',
-                f'\\1(0 0 {velocity})',
-                content,
-                flags=re.DOTALL
+            await _run_in_thread(
+                regex_rewrite, u_file, [(_INLET_U_RE, f'\\1(0 0 {velocity})')]
             )
 
-            with open(u_file, 'w') as f:
-                f.write(content)
-
     async def _set_temperature(self, case_path: Path, temperature: float):
         """Set inlet temperature in 0/T file (if exists)."""
         t_file = case_path / "0" / "T"
 
         if t_file.exists():
-            with open(t_file, 'r') as f:
-                content = f.read()
-
             # Convert Celsius to Kelvin
             temp_k = temperature + 273.15
 
-            import re
-            content = re.sub(
-                r'(inlet\s*{.*?value\s+uniform\s+)([\d.]+)',
-                f'\\g<1>{temp_k}',
-                content,
-                flags=re.DOTALL
+            await _run_in_thread(
+                regex_rewrite, t_file, [(_INLET_T_RE, f'\\g<1>{temp_k}')]
             )
 
-            with open(t_file, 'w') as f:
-                f.write(content)
-
     async def _set_mesh_refinement(self, case_path: Path, refinement: str):
         """Modify blockMeshDict for different refinement levels."""
         # This would modify cell counts in blockMeshDict
@@ -279,44 +560,51 @@ class ParametricStudyEngine:
         Returns:
             Comparison summary with best case
         """
-        valid_results = [r for r in results if "results" in r and "error" not in r.get("results", {})]
-
-        if not valid_results:
-            return {
-                "error": "No valid results to compare",
-                "best_case": None
-            }
-
-        # Extract metrics for comparison
+        # Extract metrics for comparison, skipping failed runs
         comparison_data = []
+        porosities, shrinkages, analyses = [], [], []
 
-        for result in valid_results:
-            case_name = result["case_name"]
-            params = result["parameters"]
-            analysis = result["results"].get("analysis", {})
+        for result in results:
+            if "results" not in result:
+                continue
+            case_results = result["results"]
+            if "error" in case_results:
+                continue
+
+            analysis = case_results.get("analysis") or {}
 
             # Extract key metrics
             defects = analysis.get("defects", {})
             porosity = defects.get("porosity", {})
             shrinkage = defects.get("shrinkage", {})
 
-            # Calculate composite score based on metric
-            score = self._calculate_score(metric, porosity, shrinkage, analysis)
+            porosities.append(porosity)
+            shrinkages.append(shrinkage)
+            analyses.append(analysis)
 
             comparison_data.append({
-                "case_name": case_name,
-                "parameters": params,
-                "score": score,
+                "case_name": result["case_name"],
+                "parameters": result["parameters"],
+                "score": None,
                 "porosity_risk": porosity.get("high_risk_percentage", 0),
                 "shrinkage_risk": shrinkage.get("shrinkage_risk_percentage", 0),
                 "niyama_avg": porosity.get("niyama_stats", {}).get("mean", 0)
             })
 
-        # Sort by score (lower is better for risks)
-        comparison_data.sort(key=lambda x: x["score"])
+        if not comparison_data:
+            return {
+                "error": "No valid results to compare",
+                "best_case": None
+            }
+
+        # Score all cases at once, then sort by score (lower is better for risks)
+        scores = self._calculate_scores(metric, porosities, shrinkages, analyses)
+        for case, score in zip(comparison_data, scores.tolist()):
+            case["score"] = score
+        comparison_data = [comparison_data[i] for i in np.argsort(scores, kind="stable")]
 
         # Best case is first after sorting
-        best_case = comparison_data[0] if comparison_data else None
+        best_case = comparison_data[0]
 
         # Calculate improvements
         if len(comparison_data) > 1:
@@ -352,30 +640,117 @@ class ParametricStudyEngine:
         Returns:
             Score (lower is better)
         """
+        return self._calculate_scores(metric, [porosity], [shrinkage], [analysis]).item()
+
+    def _calculate_scores(
+        self,
+        metric: str,
+        porosities: List[Dict],
+        shrinkages: List[Dict],
+        analyses: List[Dict]
+    ) -> np.ndarray:
+        """Calculate optimization scores for many cases at once.
+
+        Args:
+            metric: Optimization objective
+            porosities: Porosity prediction data per case
+            shrinkages: Shrinkage prediction data per case
+            analyses: Full analysis data per case
+
+        Returns:
+            Scores in case order (lower is better)
+        """
+        count = len(analyses)
+
+        def column(values):
+            return np.fromiter(values, dtype=np.float64, count=count)
+
         if metric == "minimize_porosity":
             # Use porosity risk percentage as score
-            return porosity.get("high_risk_percentage", 100.0)
+            return column(p.get("high_risk_percentage", 100.0) for p in porosities)
 
         elif metric == "minimize_shrinkage":
-            return shrinkage.get("shrinkage_risk_percentage", 100.0)
+            return column(s.get("shrinkage_risk_percentage", 100.0) for s in shrinkages)
 
         elif metric == "uniform_solidification":
             # Want low temperature variation
-            temp_dist = analysis.get("temperature_distribution", {})
-            temp_stats = temp_dist.get("temperature_stats", {})
-            return temp_stats.get("std", 1000.0)
+            return column(
+                a.get("temperature_distribution", {}).get("temperature_stats", {}).get("std", 1000.0)
+                for a in analyses
+            )
 
         elif metric == "minimize_fill_time":
             # Extract fill time from analysis
-            filling = analysis.get("filling_pattern", {})
-            return filling.get("time", 999.0)
+            return column(a.get("filling_pattern", {}).get("time", 999.0) for a in analyses)
 
         else:
             # Composite score: weighted sum of all defects
-            porosity_risk = porosity.get("high_risk_percentage", 0)
-            shrinkage_risk = shrinkage.get("shrinkage_risk_percentage", 0)
+            porosity_risk = column(p.get("high_risk_percentage", 0) for p in porosities)
+            shrinkage_risk = column(s.get("shrinkage_risk_percentage", 0) for s in shrinkages)
             return porosity_risk * 0.6 + shrinkage_risk * 0.4
 
+    async def _analyze_cached(self, case_name: str, analysis_type: str) -> Dict[str, Any]:
+        """Analyze a case, reusing an earlier analysis while its results are unchanged.
+
+        The validity stamp is OpenFOAMFieldParser.results_stamp: the time
+        directories of each field root and the (mtime, size) of the fields
+        in the latest one, i.e. what the analyzer reads.
+
+        Args:
+            case_name: Name of the case
+            analysis_type: Type of analysis
+
+        Returns:
+            Analysis results
+        """
+        try:
+            stamp = await asyncio.to_thread(
+                OpenFOAMFieldParser(self.run_dir / case_name).results_stamp
+            )
+        except FileNotFoundError:
+            # Let the analyzer report the missing case
+            return await self.analyzer.analyze(case_name, analysis_type)
+
+        key = (case_name, analysis_type)
+        cached = self._analysis_cache.get(key)
+        if cached is not None and cached[0] == stamp:
+            self._analysis_cache.move_to_end(key)
+            return cached[1]
+
+        analysis = await self.analyzer.analyze(case_name, analysis_type)
+
+        self._analysis_cache[key] = (stamp, analysis)
+        self._analysis_cache.move_to_end(key)
+        if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analysis
+
+    async def reconstruct_best_case(self, study: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Reconstruct the optimal case of a study that was left decomposed.
+
+        Decomposed cases are analyzed straight from their processor
+        directories, so only the case worth keeping needs reconstructPar.
+
+        Args:
+            study: Result of run_parametric_study
+
+        Returns:
+            reconstructPar result, or None if there is nothing to reconstruct
+        """
+        best_case = study.get("optimal_configuration")
+        if not best_case:
+            return None
+
+        case_dir = self.run_dir / best_case["case_name"]
+        if not (case_dir / "processor0").is_dir():
+            return None
+
+        return await self.openfoam_client.run_command(
+            ["reconstructPar"],
+            str(case_dir),
+            log_file=case_dir / "log.reconstructPar"
+        )
+
     async def compare_two_cases(
         self,
         case1: str,
@@ -391,8 +766,10 @@ class ParametricStudyEngine:
             Detailed comparison
         """
         # Analyze both cases
-        analysis1 = await self.analyzer.analyze(case1, "all")
-        analysis2 = await self.analyzer.analyze(case2, "all")
+        analysis1, analysis2 = await asyncio.gather(
+            self._analyze_cached(case1, "all"),
+            self._analyze_cached(case2, "all")
+        )
 
         # Extract key metrics
         def extract_metrics(analysis):
@@ -436,27 +813,24 @@ class ParametricStudyEngine:
         diff: Dict
     ) -> str:
         """Generate human-readable comparison summary."""
-        summary = f"Comparison: {case1} vs {case2}\n\n"
+        # Recommend better case
+        better = case2 if metrics2['porosity_risk'] < metrics1['porosity_risk'] else case1
 
-        summary += "Porosity Risk:\n"
-        summary += f"  {case1}: {metrics1['porosity_risk']:.1f}%\n"
-        summary += f"  {case2}: {metrics2['porosity_risk']:.1f}%\n"
-        summary += f"  Difference: {diff['porosity_risk']:+.1f}%\n\n"
+        return f"""Comparison: {case1} vs {case2}
 
-        summary += "Shrinkage Risk:\n"
-        summary += f"  {case1}: {metrics1['shrinkage_risk']:.1f}%\n"
-        summary += f"  {case2}: {metrics2['shrinkage_risk']:.1f}%\n"
-        summary += f"  Difference: {diff['shrinkage_risk']:+.1f}%\n\n"
+Porosity Risk:
+  {case1}: {metrics1['porosity_risk']:.1f}%
+  {case2}: {metrics2['porosity_risk']:.1f}%
+  Difference: {diff['porosity_risk']:+.1f}%
 
-        summary += "Average Niyama:\n"
-        summary += f"  {case1}: {metrics1['niyama_avg']:.3f}\n"
-        summary += f"  {case2}: {metrics2['niyama_avg']:.3f}\n"
-        summary += f"  Difference: {diff['niyama_avg']:+.3f}\n\n"
+Shrinkage Risk:
+  {case1}: {metrics1['shrinkage_risk']:.1f}%
+  {case2}: {metrics2['shrinkage_risk']:.1f}%
+  Difference: {diff['shrinkage_risk']:+.1f}%
 
-        # Recommend better case
-        if metrics2['porosity_risk'] < metrics1['porosity_risk']:
-            summary += f"✅ {case2} shows better performance (lower porosity risk)"
-        else:
-            summary += f"✅ {case1} shows better performance (lower porosity risk)"
+Average Niyama:
+  {case1}: {metrics1['niyama_avg']:.3f}
+  {case2}: {metrics2['niyama_avg']:.3f}
+  Difference: {diff['niyama_avg']:+.3f}
 
-        return summary
+✅ {better} shows better performance (lower porosity risk)"""
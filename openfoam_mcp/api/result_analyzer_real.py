@@ -4,13 +4,290 @@ This module provides actual analysis of OpenFOAM simulation results,
 including defect prediction based on real calculations.
 """
 
+import asyncio
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Sequence, Tuple
 import numpy as np
 from loguru import logger
 
 from ..utils.field_parser import OpenFOAMFieldParser
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is an optional speedup
+    njit = None
+
+# Derived fields (gradients, cooling rates, Niyama) are kept in float32:
+# they are only meaningful to a few significant figures, and half the
+# width halves the memory traffic of the kernels that scan them
+_NIYAMA_FLOOR = np.float32(1e-10)
+
+
+# Statistics are computed exactly (two passes) over cache-sized blocks,
+# so each value is read from memory once. Blocks are merged with Chan's
+# parallel formula within each of a fixed number of chunks, so results do
+# not depend on the thread count
+_MOMENT_BLOCK = 512
+_MOMENT_CHUNKS = 64
+
+
+if njit is not None:
+    @njit(cache=True, nogil=True)
+    def _block_moments(values, lo, hi):
+        """(mean, M2, min, max) of a cache-sized block values[lo:hi]."""
+        total = 0.0
+        low = np.inf
+        high = -np.inf
+        for i in range(lo, hi):
+            x = values[i]
+            total += x
+            low = min(low, x)
+            high = max(high, x)
+        mean = total / (hi - lo)
+        m2 = 0.0
+        for i in range(lo, hi):
+            d = values[i] - mean
+            m2 += d * d
+        return mean, m2, low, high
+
+    @njit(cache=True, nogil=True)
+    def _merge_moments(count, mean, m2, other_count, other_mean, other_m2):
+        """Chan's formula: (count, mean, M2) of the union of two groups."""
+        total = count + other_count
+        delta = other_mean - mean
+        mean += delta * other_count / total
+        m2 += other_m2 + delta * delta * count * other_count / total
+        return total, mean, m2
+
+    @njit(cache=True, nogil=True)
+    def _collect_moments(n, means, m2s, lows, highs):
+        """Merge per-chunk moments.
+
+        Returns:
+            (min, max, mean, std) of all n values
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for c in range(_MOMENT_CHUNKS):
+            chunk_count = (c + 1) * n // _MOMENT_CHUNKS - c * n // _MOMENT_CHUNKS
+            if chunk_count > 0:
+                count, mean, m2 = _merge_moments(count, mean, m2, chunk_count, means[c], m2s[c])
+        return lows.min(), highs.max(), mean, np.sqrt(m2 / n)
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _moments_kernel(values):
+        """Field statistics in a single parallel pass.
+
+        Returns:
+            (min, max, mean, std)
+        """
+        n = values.shape[0]
+        means = np.zeros(_MOMENT_CHUNKS)
+        m2s = np.zeros(_MOMENT_CHUNKS)
+        lows = np.full(_MOMENT_CHUNKS, np.inf)
+        highs = np.full(_MOMENT_CHUNKS, -np.inf)
+        for c in prange(_MOMENT_CHUNKS):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for lo in range(c * n // _MOMENT_CHUNKS, (c + 1) * n // _MOMENT_CHUNKS, _MOMENT_BLOCK):
+                hi = min(lo + _MOMENT_BLOCK, (c + 1) * n // _MOMENT_CHUNKS)
+                block_mean, block_m2, low, high = _block_moments(values, lo, hi)
+                count, mean, m2 = _merge_moments(count, mean, m2, hi - lo, block_mean, block_m2)
+                lows[c] = min(lows[c], low)
+                highs[c] = max(highs[c], high)
+            means[c] = mean
+            m2s[c] = m2
+        return _collect_moments(n, means, m2s, lows, highs)
+
+    # No fastmath: per-cell values decide the risk thresholds, so they must
+    # match the NumPy path exactly
+    @njit(parallel=True, cache=True, nogil=True)
+    def _niyama_kernel(grad_T, cooling_rate):
+        """Niyama criterion and its statistics, written over cooling_rate.
+
+        Each block is classified and then summarized while still in cache.
+
+        Returns:
+            (high risk, moderate risk) cell counts and (min, max, mean, std)
+        """
+        n = grad_T.shape[0]
+        high_risk = 0
+        moderate_risk = 0
+        means = np.zeros(_MOMENT_CHUNKS)
+        m2s = np.zeros(_MOMENT_CHUNKS)
+        lows = np.full(_MOMENT_CHUNKS, np.inf)
+        highs = np.full(_MOMENT_CHUNKS, -np.inf)
+        for c in prange(_MOMENT_CHUNKS):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for lo in range(c * n // _MOMENT_CHUNKS, (c + 1) * n // _MOMENT_CHUNKS, _MOMENT_BLOCK):
+                hi = min(lo + _MOMENT_BLOCK, (c + 1) * n // _MOMENT_CHUNKS)
+                for i in range(lo, hi):
+                    niyama = grad_T[i] / np.sqrt(max(cooling_rate[i], _NIYAMA_FLOOR))
+                    cooling_rate[i] = niyama
+                    if niyama < 0.5:
+                        high_risk += 1
+                    elif niyama < 1.0:
+                        moderate_risk += 1
+                block_mean, block_m2, low, high = _block_moments(cooling_rate, lo, hi)
+                count, mean, m2 = _merge_moments(count, mean, m2, hi - lo, block_mean, block_m2)
+                lows[c] = min(lows[c], low)
+                highs[c] = max(highs[c], high)
+            means[c] = mean
+            m2s[c] = m2
+        return high_risk, moderate_risk, _collect_moments(n, means, m2s, lows, highs)
+
+    @njit(parallel=True, cache=True, nogil=True)
+    def _fill_kernel(alpha):
+        """Fill counters and alpha statistics in a single parallel pass.
+
+        Returns:
+            (filled, partially filled) cell counts and (min, max, mean, std)
+        """
+        n = alpha.shape[0]
+        filled = 0
+        partial = 0
+        means = np.zeros(_MOMENT_CHUNKS)
+        m2s = np.zeros(_MOMENT_CHUNKS)
+        lows = np.full(_MOMENT_CHUNKS, np.inf)
+        highs = np.full(_MOMENT_CHUNKS, -np.inf)
+        for c in prange(_MOMENT_CHUNKS):
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for lo in range(c * n // _MOMENT_CHUNKS, (c + 1) * n // _MOMENT_CHUNKS, _MOMENT_BLOCK):
+                hi = min(lo + _MOMENT_BLOCK, (c + 1) * n // _MOMENT_CHUNKS)
+                for i in range(lo, hi):
+                    a = alpha[i]
+                    if a > 0.5:
+                        filled += 1
+                    if a > 0.01 and a < 0.99:
+                        partial += 1
+                block_mean, block_m2, low, high = _block_moments(alpha, lo, hi)
+                count, mean, m2 = _merge_moments(count, mean, m2, hi - lo, block_mean, block_m2)
+                lows[c] = min(lows[c], low)
+                highs[c] = max(highs[c], high)
+            means[c] = mean
+            m2s[c] = m2
+        return filled, partial, _collect_moments(n, means, m2s, lows, highs)
+else:
+    _moments_kernel = None
+    _niyama_kernel = None
+    _fill_kernel = None
+
+
+def _statistics_dict(moments: Tuple[float, float, float, float], count: int) -> Dict[str, float]:
+    """Format kernel (min, max, mean, std) like calculate_field_statistics."""
+    low, high, mean, std = moments
+    return {
+        'min': float(low),
+        'max': float(high),
+        'mean': float(mean),
+        'std': float(std),
+        'count': count
+    }
+
+
+def _field_statistics(parser: OpenFOAMFieldParser, values: np.ndarray) -> Dict[str, float]:
+    """Calculate field statistics, in one compiled pass when available.
+
+    Args:
+        parser: Field parser, for the NumPy fallback
+        values: Array of field values
+
+    Returns:
+        Dictionary with min, max, mean, std and count
+    """
+    if _moments_kernel is None or len(values) == 0:
+        return parser.calculate_field_statistics(values)
+    return _statistics_dict(_moments_kernel(values), len(values))
+
+
+def _niyama(
+    parser: OpenFOAMFieldParser,
+    grad_T: np.ndarray,
+    cooling_rate: np.ndarray
+) -> Tuple[int, int, int, Dict[str, float]]:
+    """Compute the Niyama criterion G / sqrt(R) and classify the cells.
+
+    Overwrites cooling_rate with the criterion.
+
+    Args:
+        parser: Field parser, for the NumPy statistics fallback
+        grad_T: Temperature gradient magnitude per cell
+        cooling_rate: Non-empty cooling rate per cell (float32)
+
+    Returns:
+        High risk (< 0.5), moderate risk and safe (>= 1.0) cell counts, and
+        the Niyama statistics
+    """
+    if _niyama_kernel is not None:
+        high_risk, moderate_risk, moments = _niyama_kernel(grad_T, cooling_rate)
+        total = len(cooling_rate)
+        return high_risk, moderate_risk, total - high_risk - moderate_risk, _statistics_dict(moments, total)
+
+    # Avoid division by zero
+    np.maximum(cooling_rate, _NIYAMA_FLOOR, out=cooling_rate)
+    np.sqrt(cooling_rate, out=cooling_rate)
+    niyama = np.divide(grad_T, cooling_rate, out=cooling_rate)
+
+    # Classify risk zones in one pass: <0.5 high, [0.5, 1.0) moderate, >=1.0 safe
+    high_risk, moderate_risk, safe = np.bincount(np.digitize(niyama, (0.5, 1.0)), minlength=3)
+    return int(high_risk), int(moderate_risk), int(safe), parser.calculate_field_statistics(niyama)
+
+
+def _fill_statistics(
+    parser: OpenFOAMFieldParser,
+    alpha: np.ndarray
+) -> Tuple[int, int, Dict[str, float]]:
+    """Count filled (> 0.5) and partially filled (0.01 - 0.99) cells.
+
+    Args:
+        parser: Field parser, for the NumPy statistics fallback
+        alpha: Non-empty metal volume fraction per cell
+
+    Returns:
+        Filled cell count, partially filled cell count and alpha statistics
+    """
+    if _fill_kernel is not None:
+        filled, partial, moments = _fill_kernel(alpha)
+        return filled, partial, _statistics_dict(moments, len(alpha))
+
+    filled = np.count_nonzero(alpha > 0.5)
+    partial = alpha > 0.01
+    np.logical_and(partial, alpha < 0.99, out=partial)
+    return filled, np.count_nonzero(partial), parser.calculate_field_statistics(alpha)
+
+
+def _percentiles(values: np.ndarray, percentiles: Tuple[float, ...]) -> np.ndarray:
+    """Compute several percentiles with a single partial sort.
+
+    Matches np.percentile's default linear interpolation exactly, so
+    callers needing different percentiles of one field can share the
+    np.partition call.
+
+    Args:
+        values: Non-empty array of values
+        percentiles: Percentiles to compute, in [0, 100]
+
+    Returns:
+        Array with one value per requested percentile
+    """
+    n = len(values)
+    positions = np.true_divide(percentiles, 100) * (n - 1)
+    below = np.floor(positions).astype(np.intp)
+    above = np.minimum(below + 1, n - 1)
+    ranked = np.partition(values, np.union1d(below, above))
+
+    # Same interpolation as NumPy, which switches ends at t >= 0.5
+    lower, upper, t = ranked[below], ranked[above], positions - below
+    diff = upper - lower
+    return np.where(t >= 0.5, upper - diff * (1 - t), lower + diff * t)
+
 
 class RealResultAnalyzer:
     """Real analyzer that actually parses OpenFOAM results."""
@@ -71,8 +348,8 @@ class RealResultAnalyzer:
                 results["solidification"] = await self._analyze_solidification(parser)
 
             if analysis_type in ["defect_prediction", "all"]:
-                results["defects"] = await self.predict_defects(
-                    case_name,
+                results["defects"] = await self._predict_defects(
+                    parser,
                     ["porosity", "shrinkage", "hot_spots"]
                 )
 
@@ -104,16 +381,15 @@ class RealResultAnalyzer:
             if len(alpha_values) == 0:
                 return {"error": "No data in alpha.metal field"}
 
-            # Calculate fill statistics
-            stats = parser.calculate_field_statistics(alpha_values)
+            # Calculate fill statistics, filled cells and partially filled
+            # cells (0 < alpha < 1, air entrapment)
+            filled_cells, partially_filled, stats = _fill_statistics(parser, alpha_values)
 
             # Estimate filling percentage
-            filled_cells = np.sum(alpha_values > 0.5)
             total_cells = len(alpha_values)
             fill_percentage = (filled_cells / total_cells * 100) if total_cells > 0 else 0
 
-            # Check for air entrapment (cells with 0 < alpha < 1)
-            partially_filled = np.sum((alpha_values > 0.01) & (alpha_values < 0.99))
+            # Check for air entrapment
             entrapment_risk = (partially_filled / total_cells * 100) if total_cells > 0 else 0
 
             return {
@@ -154,16 +430,16 @@ class RealResultAnalyzer:
                 return {"error": "No data in T field"}
 
             # Calculate statistics
-            stats = parser.calculate_field_statistics(T_values)
+            stats = _field_statistics(parser, T_values)
 
             # Calculate temperature gradient
-            grad_T = parser.calculate_gradient(T_values)
-            grad_stats = parser.calculate_field_statistics(grad_T)
+            grad_T = parser.read_scalar_gradient('T', T_data['time'])
+            grad_stats = _field_statistics(parser, grad_T)
 
             # Identify hot spots (top 10% temperatures)
             if len(T_values) > 0:
-                temp_threshold = np.percentile(T_values, 90)
-                hot_spot_cells = np.sum(T_values > temp_threshold)
+                temp_threshold = _percentiles(T_values, (90,))[0]
+                hot_spot_cells = np.count_nonzero(T_values > temp_threshold)
                 hot_spot_percentage = (hot_spot_cells / len(T_values)) * 100
             else:
                 hot_spot_cells = 0
@@ -199,6 +475,7 @@ class RealResultAnalyzer:
                 return {"error": "Need at least 2 time steps for solidification analysis"}
 
             # Read temperature at different times
+            await self._prefetch_fields(parser, 'T', (times[0], times[-1]))
             T_initial = parser.read_scalar_field('T', times[0])
             T_final = parser.read_scalar_field('T', times[-1])
 
@@ -208,8 +485,9 @@ class RealResultAnalyzer:
             # Calculate cooling rate
             dt = times[-1] - times[0]
             if dt > 0 and len(T_init_values) == len(T_final_values):
-                cooling_rate = (T_init_values - T_final_values) / dt
-                cooling_stats = parser.calculate_field_statistics(np.abs(cooling_rate))
+                cooling_rate = np.subtract(T_init_values, T_final_values)
+                cooling_rate /= dt
+                cooling_stats = _field_statistics(parser, np.abs(cooling_rate, out=cooling_rate))
             else:
                 cooling_stats = {"mean": 0, "max": 0}
 
@@ -218,8 +496,8 @@ class RealResultAnalyzer:
                 "final_time": times[-1],
                 "time_span": dt,
                 "cooling_rate_stats": cooling_stats,
-                "initial_temp_stats": parser.calculate_field_statistics(T_init_values),
-                "final_temp_stats": parser.calculate_field_statistics(T_final_values),
+                "initial_temp_stats": _field_statistics(parser, T_init_values),
+                "final_temp_stats": _field_statistics(parser, T_final_values),
                 "analysis": f"Average cooling rate: {cooling_stats['mean']:.2f} K/s"
             }
 
@@ -241,21 +519,88 @@ class RealResultAnalyzer:
             Dictionary mapping defect type to actual prediction
         """
         case_dir = self.run_dir / case_name
-        parser = OpenFOAMFieldParser(case_dir)
+        return await self._predict_defects(OpenFOAMFieldParser(case_dir), defect_types)
 
-        predictions = {}
+    @staticmethod
+    async def _prefetch_fields(
+        parser: OpenFOAMFieldParser,
+        field_name: str,
+        times: Sequence[float]
+    ) -> None:
+        """Read a field at several times concurrently into the parser's cache.
 
-        for defect_type in defect_types:
-            if defect_type == "porosity":
-                predictions["porosity"] = await self._predict_porosity_real(parser)
-            elif defect_type == "shrinkage":
-                predictions["shrinkage"] = await self._predict_shrinkage_real(parser)
-            elif defect_type == "hot_spots":
-                predictions["hot_spots"] = await self._predict_hot_spots_real(parser)
+        Read errors are ignored here; they surface again, in context, when
+        the field is read for analysis.
 
-        return predictions
+        Args:
+            parser: Field parser
+            field_name: Name of field
+            times: Time directories to read
+        """
+        await asyncio.gather(
+            *(asyncio.to_thread(parser.read_scalar_field, field_name, time) for time in times),
+            return_exceptions=True
+        )
+
+    async def _predict_defects(
+        self,
+        parser: OpenFOAMFieldParser,
+        defect_types: List[str]
+    ) -> Dict[str, Any]:
+        """Predict casting defects from the latest temperature field.
+
+        The field and its gradient are read once and shared by every
+        prediction, and with the temperature analysis when both use the
+        latest time.
 
-    async def _predict_porosity_real(self, parser: OpenFOAMFieldParser) -> Dict[str, Any]:
+        Args:
+            parser: Field parser
+            defect_types: Types of defects to predict
+
+        Returns:
+            Dictionary mapping defect type to actual prediction
+        """
+        try:
+            # Porosity also needs the previous time step for the cooling rate
+            times = parser.get_time_directories()
+            await self._prefetch_fields(parser, 'T', times[-2:] if "porosity" in defect_types else times[-1:])
+
+            T_values = parser.read_scalar_field('T')['internal_field']
+            if len(T_values):
+                # Differentiate in float64, scan the result in float32
+                grad_T = parser.read_scalar_gradient('T').astype(np.float32)
+                # Shrinkage uses the 90th and hot spots the 95th percentile
+                p90, p95 = _percentiles(T_values, (90, 95))
+            else:
+                # Each prediction reports the missing data itself
+                grad_T, p90, p95 = None, None, None
+        except Exception as e:
+            error = {"error": str(e)}
+            return {
+                defect_type: error
+                for defect_type in defect_types
+                if defect_type in ("porosity", "shrinkage", "hot_spots")
+            }
+
+        handlers = {
+            "porosity": partial(self._predict_porosity_real, parser, T_values, grad_T),
+            "shrinkage": partial(self._predict_shrinkage_real, T_values, grad_T, p90),
+            "hot_spots": partial(self._predict_hot_spots_real, T_values, p95)
+        }
+
+        # Predictions are independent and CPU-bound; NumPy and the nogil
+        # kernels release the GIL, so threads run them in parallel
+        requested = [d for d in dict.fromkeys(defect_types) if d in handlers]
+        predictions = await asyncio.gather(*(asyncio.to_thread(handlers[d]) for d in requested))
+
+        return dict(zip(requested, predictions))
+
+    def _predict_porosity_real(
+        self,
+        parser: OpenFOAMFieldParser,
+        T_values: np.ndarray,
+        grad_T: Optional[np.ndarray]
+    ) -> Dict[str, Any]:
         """REAL porosity prediction using Niyama criterion.
 
         Niyama criterion: Ny = G / sqrt(R)
@@ -265,16 +610,9 @@ class RealResultAnalyzer:
         Ny < 0.5: High porosity risk
         """
         try:
-            # Need temperature field
-            T_data = parser.read_scalar_field('T')
-            T_values = T_data['internal_field']
-
             if len(T_values) == 0:
                 return {"error": "No temperature data available"}
 
-            # Calculate temperature gradient
-            grad_T = parser.calculate_gradient(T_values)
-
             # Estimate cooling rate from time series (if available)
             times = parser.get_time_directories()
 
@@ -283,28 +621,24 @@ class RealResultAnalyzer:
                 dt = times[-1] - times[-2]
 
                 if len(T_prev) == len(T_values) and dt > 0:
-                    cooling_rate = np.abs((T_values - T_prev) / dt)
+                    # Subtract in float64 to avoid cancellation, store float32
+                    cooling_rate = np.subtract(
+                        T_values, T_prev, out=np.empty(len(T_values), dtype=np.float32), casting='same_kind'
+                    )
+                    cooling_rate /= np.float32(dt)
+                    np.abs(cooling_rate, out=cooling_rate)
                 else:
                     # Use constant estimate
-                    cooling_rate = np.ones_like(T_values) * 10.0  # K/s estimate
+                    cooling_rate = np.full(len(T_values), 10.0, dtype=np.float32)  # K/s estimate
             else:
-                cooling_rate = np.ones_like(T_values) * 10.0
-
-            # Calculate Niyama criterion
-            # Avoid division by zero
-            cooling_rate = np.maximum(cooling_rate, 1e-10)
-            niyama = grad_T / np.sqrt(cooling_rate)
+                cooling_rate = np.full(len(T_values), 10.0, dtype=np.float32)
 
-            # Classify risk zones
-            high_risk = np.sum(niyama < 0.5)
-            moderate_risk = np.sum((niyama >= 0.5) & (niyama < 1.0))
-            safe = np.sum(niyama >= 1.0)
-            total = len(niyama)
+            # Calculate Niyama criterion, classify risk zones and summarize
+            high_risk, moderate_risk, safe, ny_stats = _niyama(parser, grad_T, cooling_rate)
+            total = len(cooling_rate)
 
             risk_percentage = (high_risk / total * 100) if total > 0 else 0
 
-            ny_stats = parser.calculate_field_statistics(niyama)
-
             return {
                 "niyama_stats": ny_stats,
                 "high_risk_cells": int(high_risk),
@@ -321,25 +655,25 @@ class RealResultAnalyzer:
             logger.error(f"Error predicting porosity: {e}")
             return {"error": str(e)}
 
-    async def _predict_shrinkage_real(self, parser: OpenFOAMFieldParser) -> Dict[str, Any]:
+    def _predict_shrinkage_real(
+        self,
+        T_values: np.ndarray,
+        grad_T: Optional[np.ndarray],
+        hot_threshold: Optional[float]
+    ) -> Dict[str, Any]:
         """REAL shrinkage prediction using thermal modulus."""
         try:
-            T_data = parser.read_scalar_field('T')
-            T_values = T_data['internal_field']
-
             if len(T_values) == 0:
                 return {"error": "No temperature data"}
 
             # Find hottest regions (last to solidify = shrinkage risk)
-            hot_threshold = np.percentile(T_values, 90)
-            hot_cells = np.sum(T_values > hot_threshold)
+            hot = T_values > hot_threshold
+            hot_cells = np.count_nonzero(hot)
             shrinkage_risk = (hot_cells / len(T_values) * 100) if len(T_values) > 0 else 0
 
-            # Calculate temperature gradient to find isolated hot spots
-            grad_T = parser.calculate_gradient(T_values)
-
             # Isolated hot spots have high temperature but low gradient (fed poorly)
-            isolated_hot = np.sum((T_values > hot_threshold) & (grad_T < np.median(grad_T)))
+            isolated = grad_T < np.median(grad_T)
+            isolated_hot = np.count_nonzero(np.logical_and(hot, isolated, out=isolated))
 
             return {
                 "high_temp_cells": int(hot_cells),
@@ -353,28 +687,29 @@ class RealResultAnalyzer:
         except Exception as e:
             return {"error": str(e)}
 
-    async def _predict_hot_spots_real(self, parser: OpenFOAMFieldParser) -> Dict[str, Any]:
+    def _predict_hot_spots_real(
+        self,
+        T_values: np.ndarray,
+        hot_threshold: Optional[float]
+    ) -> Dict[str, Any]:
         """REAL hot spot detection."""
         try:
-            T_data = parser.read_scalar_field('T')
-            T_values = T_data['internal_field']
-
             # Find cells in top 5% of temperature
             if len(T_values) > 0:
-                hot_threshold = np.percentile(T_values, 95)
                 hot_spots = T_values > hot_threshold
-                num_hot_spots = np.sum(hot_spots)
+                num_hot_spots = np.count_nonzero(hot_spots)
+                hot_spot_percentage = num_hot_spots / len(T_values) * 100
 
                 hot_spot_temps = T_values[hot_spots]
                 avg_hot_temp = np.mean(hot_spot_temps) if len(hot_spot_temps) > 0 else 0
 
                 return {
                     "hot_spot_count": int(num_hot_spots),
-                    "hot_spot_percentage": float(num_hot_spots / len(T_values) * 100),
+                    "hot_spot_percentage": float(hot_spot_percentage),
                     "threshold_temperature": float(hot_threshold),
                     "average_hot_spot_temp": float(avg_hot_temp),
                     "locations": "See VTK output for spatial distribution",
-                    "recommendation": self._hot_spot_recommendation(num_hot_spots, len(T_values))
+                    "recommendation": self._hot_spot_recommendation(hot_spot_percentage)
                 }
             else:
                 return {"error": "No temperature data"}
@@ -424,10 +759,8 @@ class RealResultAnalyzer:
         else:
             return "❌ High shrinkage risk! Add risers near thick sections or increase chill usage."
 
-    def _hot_spot_recommendation(self, num_hot: int, total: int) -> str:
+    def _hot_spot_recommendation(self, pct: float) -> str:
         """Generate hot spot recommendation."""
-        pct = (num_hot / total * 100) if total > 0 else 0
-
         if pct < 5:
             return "✅ Minimal hot spots. Good thermal distribution."
         elif pct < 15:
@@ -1,7 +1,212 @@
 """Case builder for creating OpenFOAM case templates."""
 
-from typing import Dict, Any
-from .templates import MOLD_FILLING_TEMPLATE, SOLIDIFICATION_TEMPLATE
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
+from .templates import MOLD_FILLING_TEMPLATE, SOLIDIFICATION_TEMPLATE, foam_file
+
+# Material properties databases
+_METAL_DB = MappingProxyType({
+    "steel": MappingProxyType({
+        "density": 7800,
+        "viscosity": 0.006,
+        "thermal_conductivity": 30,
+        "specific_heat": 600,
+        "liquidus_temp": 1809,
+        "solidus_temp": 1673,
+        "latent_heat": 270000
+    }),
+    "aluminum": MappingProxyType({
+        "density": 2700,
+        "viscosity": 0.0013,
+        "thermal_conductivity": 200,
+        "specific_heat": 900,
+        "liquidus_temp": 933,
+        "solidus_temp": 821,
+        "latent_heat": 397000
+    }),
+    "iron": MappingProxyType({
+        "density": 7200,
+        "viscosity": 0.005,
+        "thermal_conductivity": 35,
+        "specific_heat": 540,
+        "liquidus_temp": 1811,
+        "solidus_temp": 1422,
+        "latent_heat": 247000
+    }),
+    "copper": MappingProxyType({
+        "density": 8940,
+        "viscosity": 0.004,
+        "thermal_conductivity": 380,
+        "specific_heat": 385,
+        "liquidus_temp": 1358,  # Pure copper - no freezing range
+        "solidus_temp": 1358,    # Liquidus = Solidus for pure metals
+        "latent_heat": 205000
+    }),
+    "bronze": MappingProxyType({
+        "density": 8800,
+        "viscosity": 0.0045,
+        "thermal_conductivity": 120,
+        "specific_heat": 380,
+        "liquidus_temp": 1223,
+        "solidus_temp": 1093,
+        "latent_heat": 180000
+    })
+})
+
+_MOLD_DB = MappingProxyType({
+    "sand": MappingProxyType({
+        "density": 1600,
+        "thermal_conductivity": 1.0,
+        "specific_heat": 1000
+    }),
+    "ceramic": MappingProxyType({
+        "density": 2000,
+        "thermal_conductivity": 1.5,
+        "specific_heat": 900
+    }),
+    "metal": MappingProxyType({
+        "density": 7800,
+        "thermal_conductivity": 50,
+        "specific_heat": 500
+    }),
+    "graphite": MappingProxyType({
+        "density": 2200,
+        "thermal_conductivity": 150,
+        "specific_heat": 700
+    })
+})
+
+# Template placeholders; OpenFOAM braces always enclose whitespace
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+# (literal text, field name or None) segments of one file
+_CompiledFile = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _compile_file(content_template: str) -> _CompiledFile:
+    """Split a template into literal text and placeholder segments."""
+    segments = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(content_template):
+        segments.append((content_template[position:match.start()], match.group(1)))
+        position = match.end()
+    segments.append((content_template[position:], None))
+    return tuple(segments)
+
+
+def _compile_template(
+    template: Dict[str, Tuple[str, str]]
+) -> Dict[str, Tuple[str, _CompiledFile, Tuple[str, ...]]]:
+    """Split a case template's file bodies into segments once, at import time.
+
+    Args:
+        template: Mapping of file path to (FoamFile class, body template)
+
+    Returns:
+        Mapping of file path to (FoamFile class, body segments, the
+        placeholder names the body uses, sorted)
+    """
+    compiled = {}
+    for file_path, (foam_class, body_template) in template.items():
+        segments = _compile_file(body_template)
+        fields = tuple(sorted({field for _, field in segments if field is not None}))
+        compiled[file_path] = (foam_class, segments, fields)
+    return compiled
+
+
+_COMPILED_TEMPLATES = {
+    "mold_filling": _compile_template(MOLD_FILLING_TEMPLATE),
+    "solidification": _compile_template(SOLIDIFICATION_TEMPLATE),
+}
+
+
+@lru_cache(maxsize=256)
+def _render_file(template_name: str, file_path: str, field_text: Tuple[str, ...]) -> str:
+    """Render one compiled file, memoized on the placeholder values it uses.
+
+    Keyed on formatted text rather than raw values so that, e.g., 700 and
+    700.0 (equal as cache keys) never share a rendering. A sweep that varies
+    one property therefore re-renders only the files that reference it.
+
+    Args:
+        template_name: Key into _COMPILED_TEMPLATES
+        file_path: File within that template
+        field_text: Formatted values of the file's placeholders, in its
+            sorted field order
+
+    Returns:
+        Complete file content
+    """
+    foam_class, segments, fields = _COMPILED_TEMPLATES[template_name][file_path]
+    text = dict(zip(fields, field_text))
+    return foam_file(file_path, foam_class, "".join(
+        literal if field is None else literal + text[field]
+        for literal, field in segments
+    ))
+
+
+@lru_cache(maxsize=256)
+def _encode_file(content: str) -> bytes:
+    """Encode a rendered file to bytes, memoized.
+
+    Renders are memoized too, so repeated builds pass back the same string
+    objects, whose hashes are cached and whose lookups are O(1).
+    """
+    return content.encode()
+
+
+@lru_cache(maxsize=64)
+def _render_template(
+    template_name: str,
+    metal_props: Tuple[Tuple[str, Any], ...],
+    mold_props: Tuple[Tuple[str, Any], ...],
+    pouring_temperature: float
+) -> Tuple[Tuple[str, str], ...]:
+    """Render a compiled case template, memoized on everything it depends on.
+
+    Args:
+        template_name: Key into _COMPILED_TEMPLATES
+        metal_props: Metal properties as (name, value) pairs
+        mold_props: Mold properties as (name, value) pairs
+        pouring_temperature: Pouring temperature in Celsius
+
+    Returns:
+        Tuples of (file path, content)
+    """
+    metal = dict(metal_props)
+    mold = dict(mold_props)
+
+    values = {
+        "metal_density": metal["density"],
+        "metal_viscosity": metal["viscosity"],
+        # Calculate kinematic viscosity (nu = mu / rho)
+        # OpenFOAM needs kinematic viscosity (m²/s), not dynamic viscosity (Pa·s)
+        "metal_nu": metal["viscosity"] / metal["density"],
+        "metal_k": metal["thermal_conductivity"],
+        "metal_cp": metal["specific_heat"],
+        "liquidus_temp": metal["liquidus_temp"],
+        "solidus_temp": metal["solidus_temp"],
+        "latent_heat": metal["latent_heat"],
+        "pouring_temp": pouring_temperature + 273.15,  # Convert to Kelvin
+        "mold_density": mold["density"],
+        "mold_k": mold["thermal_conductivity"],
+        "mold_cp": mold["specific_heat"],
+        "mold_temp": 573,  # Default mold temperature: 573 K (300°C) - typical for die casting
+        "ambient_temp": 300  # Ambient temperature: 300 K (27°C)
+    }
+    # Format each value once, however many files reference it
+    text = {field: str(value) for field, value in values.items()}
+
+    return tuple(
+        (file_path, _render_file(
+            template_name,
+            file_path,
+            tuple(text[field] for field in fields)
+        ))
+        for file_path, (_, _, fields) in _COMPILED_TEMPLATES[template_name].items()
+    )
 
 
 class CaseBuilder:
@@ -18,77 +223,9 @@ class CaseBuilder:
         self.pouring_temperature = None
         self.mold_material = None
 
-        # Material properties database
-        self.metal_database = {
-            "steel": {
-                "density": 7800,
-                "viscosity": 0.006,
-                "thermal_conductivity": 30,
-                "specific_heat": 600,
-                "liquidus_temp": 1809,
-                "solidus_temp": 1673,
-                "latent_heat": 270000
-            },
-            "aluminum": {
-                "density": 2700,
-                "viscosity": 0.0013,
-                "thermal_conductivity": 200,
-                "specific_heat": 900,
-                "liquidus_temp": 933,
-                "solidus_temp": 821,
-                "latent_heat": 397000
-            },
-            "iron": {
-                "density": 7200,
-                "viscosity": 0.005,
-                "thermal_conductivity": 35,
-                "specific_heat": 540,
-                "liquidus_temp": 1811,
-                "solidus_temp": 1422,
-                "latent_heat": 247000
-            },
-            "copper": {
-                "density": 8940,
-                "viscosity": 0.004,
-                "thermal_conductivity": 380,
-                "specific_heat": 385,
-                "liquidus_temp": 1358,  # Pure copper - no freezing range
-                "solidus_temp": 1358,    # Liquidus = Solidus for pure metals
-                "latent_heat": 205000
-            },
-            "bronze": {
-                "density": 8800,
-                "viscosity": 0.0045,
-                "thermal_conductivity": 120,
-                "specific_heat": 380,
-                "liquidus_temp": 1223,
-                "solidus_temp": 1093,
-                "latent_heat": 180000
-            }
-        }
-
-        self.mold_database = {
-            "sand": {
-                "density": 1600,
-                "thermal_conductivity": 1.0,
-                "specific_heat": 1000
-            },
-            "ceramic": {
-                "density": 2000,
-                "thermal_conductivity": 1.5,
-                "specific_heat": 900
-            },
-            "metal": {
-                "density": 7800,
-                "thermal_conductivity": 50,
-                "specific_heat": 500
-            },
-            "graphite": {
-                "density": 2200,
-                "thermal_conductivity": 150,
-                "specific_heat": 700
-            }
-        }
+        # Material properties database (shared, read-only)
+        self.metal_database = _METAL_DB
+        self.mold_database = _MOLD_DB
 
     def set_metal_type(self, metal_type: str):
         """Set metal type."""
@@ -108,46 +245,87 @@ class CaseBuilder:
         Returns:
             Dictionary mapping file paths to content
         """
-        files = {}
+        return dict(self._render())
+
+    def iter_files(self) -> Iterator[Tuple[str, bytes]]:
+        """Generate case files one at a time, ready to be written to disk.
+
+        Yields:
+            Tuples of (file path, UTF-8 encoded content)
+        """
+        for file_path, content in self._render():
+            yield file_path, _encode_file(content)
+
+    def build_batch(self, combos: Iterable[Tuple[str, str, float]]) -> List[Dict[str, str]]:
+        """Build case files for many material combinations of this case type.
+
+        Intended for design-of-experiments sweeps: the template is selected
+        once and combinations repeated across the batch (or earlier builds)
+        are rendered only once.
+
+        Args:
+            combos: Tuples of (metal type, mold material, pouring temperature
+                in Celsius)
+
+        Returns:
+            One dictionary mapping file paths to content per combination
+        """
+        template = self._template_name()
+        return [
+            dict(self._render_files(template, metal_type, mold_material, pouring_temperature))
+            for metal_type, mold_material, pouring_temperature in combos
+        ]
 
+    def _render(self) -> Iterator[Tuple[str, str]]:
+        """Render the case templates one file at a time.
+
+        Templates are parsed once at import and renders are memoized, so
+        repeated builds with the same materials (parameter sweeps) reuse
+        the rendered content.
+
+        Yields:
+            Tuples of (file path, content)
+        """
+        yield from self._render_files(
+            self._template_name(),
+            self.metal_type,
+            self.mold_material,
+            self.pouring_temperature
+        )
+
+    def _render_files(
+        self,
+        template: str,
+        metal_type: Optional[str],
+        mold_material: Optional[str],
+        pouring_temperature: float
+    ) -> Tuple[Tuple[str, str], ...]:
+        """Render one material combination with a compiled template.
+
+        Returns:
+            Tuples of (file path, content)
+        """
         # Get material properties
-        metal_props = self.metal_database.get(self.metal_type, self.metal_database["steel"])
-        mold_props = self.mold_database.get(self.mold_material, self.mold_database["sand"])
+        metal_props = self.metal_database.get(metal_type, self.metal_database["steel"])
+        mold_props = self.mold_database.get(mold_material, self.mold_database["sand"])
 
-        # Calculate kinematic viscosity (nu = mu / rho)
-        # OpenFOAM needs kinematic viscosity (m²/s), not dynamic viscosity (Pa·s)
-        metal_nu = metal_props["viscosity"] / metal_props["density"]
+        # Generate files from template
+        return _render_template(
+            template,
+            tuple(metal_props.items()),
+            tuple(mold_props.items()),
+            pouring_temperature
+        )
 
-        # Select template based on case type
+    def _template_name(self) -> str:
+        """Select the template for this case type."""
         if self.case_type == "mold_filling":
-            template = MOLD_FILLING_TEMPLATE
+            return "mold_filling"
         elif self.case_type == "solidification":
-            template = SOLIDIFICATION_TEMPLATE
+            return "solidification"
         elif self.case_type == "continuous_casting":
-            template = SOLIDIFICATION_TEMPLATE  # Would have dedicated template
+            return "solidification"  # Would have dedicated template
         elif self.case_type == "die_casting":
-            template = SOLIDIFICATION_TEMPLATE  # Use thermal solver for die casting
+            return "solidification"  # Use thermal solver for die casting
         else:
-            template = MOLD_FILLING_TEMPLATE
-
-        # Generate files from template
-        for file_path, content_template in template.items():
-            content = content_template.format(
-                metal_density=metal_props["density"],
-                metal_viscosity=metal_props["viscosity"],
-                metal_nu=metal_nu,
-                metal_k=metal_props["thermal_conductivity"],
-                metal_cp=metal_props["specific_heat"],
-                liquidus_temp=metal_props["liquidus_temp"],
-                solidus_temp=metal_props["solidus_temp"],
-                latent_heat=metal_props["latent_heat"],
-                pouring_temp=self.pouring_temperature + 273.15,  # Convert to Kelvin
-                mold_density=mold_props["density"],
-                mold_k=mold_props["thermal_conductivity"],
-                mold_cp=mold_props["specific_heat"],
-                mold_temp=573,  # Default mold temperature: 573 K (300°C) - typical for die casting
-                ambient_temp=300  # Ambient temperature: 300 K (27°C)
-            )
-            files[file_path] = content
-
-        return files
+            return "mold_filling"
@@ -1,24 +1,148 @@
-"""OpenFOAM case file templates for casting simulations."""
+"""OpenFOAM case file templates for casting simulations.
 
-# Template for mold filling simulation
-MOLD_FILLING_TEMPLATE = {
-    "system/controlDict": """/*--------------------------------*- C++ -*----------------------------------*\\
+Each template maps a file path to (FoamFile class, body). The body is the
+dictionary content only; foam_file() adds the shared banner, FoamFile header
+and trailer. Braces in a body are literal, and only a bare {identifier}
+(no whitespace inside the braces) is a placeholder, filled in by CaseBuilder.
+"""
+
+# Banner comment that opens every generated OpenFOAM dictionary
+_FOAM_BANNER = """/*--------------------------------*- C++ -*----------------------------------*\\
 | =========                 |                                                 |
 | \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
+|  \\\\    /   O peration     | Version:  11                                    |
+|   \\\\  /    A nd           | Website:  www.openfoam.org                      |
 |    \\\\/     M anipulation  |                                                 |
 \\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      controlDict;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+"""
+
+_FOAM_SEPARATOR = "// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //\n"
+
+_FOAM_TRAILER = "\n// ************************************************************************* //\n"
+
+
+def foam_file(file_path: str, foam_class: str, body: str) -> str:
+    """Wrap a dictionary body in the banner, FoamFile header and trailer.
+
+    Args:
+        file_path: Path within the case, e.g. "system/controlDict"
+        foam_class: FoamFile class, e.g. "dictionary" or "volScalarField"
+        body: Dictionary content
+
+    Returns:
+        Complete OpenFOAM file text
+    """
+    location, _, object_name = file_path.rpartition("/")
+    # Initial-condition files carry no location entry
+    location_line = "" if location == "0" else f'    location    "{location}";\n'
+    return (
+        _FOAM_BANNER
+        + "FoamFile\n{\n    version     2.0;\n    format      ascii;\n"
+        + f"    class       {foam_class};\n"
+        + location_line
+        + f"    object      {object_name};\n}}\n"
+        + _FOAM_SEPARATOR
+        + body
+        + _FOAM_TRAILER
+    )
+
+
+# Files shared verbatim by every case type
+_COMMON_FILES = {
+    "constant/g": ("uniformDimensionedVectorField", """
+dimensions      [0 1 -2 0 0 0 0];
+value           (0 0 -9.81);
+"""),
+
+    "constant/momentumTransport": ("dictionary", """
+simulationType  laminar;
+"""),
+
+    "0/alpha.metal": ("volScalarField", """
+dimensions      [0 0 0 0 0 0 0];
+
+internalField   uniform 0;
+
+boundaryField
+{
+    walls
+    {
+        type            zeroGradient;
+    }
+
+    inlet
+    {
+        type            fixedValue;
+        value           uniform 1;
+    }
+
+    outlet
+    {
+        type            inletOutlet;
+        inletValue      uniform 0;
+        value           uniform 0;
+    }
+}
+"""),
 
+    "0/U": ("volVectorField", """
+dimensions      [0 1 -1 0 0 0 0];
+
+internalField   uniform (0 0 0);
+
+boundaryField
+{
+    walls
+    {
+        type            noSlip;
+    }
+
+    inlet
+    {
+        type            fixedValue;
+        value           uniform (0 0 0.5);
+    }
+
+    outlet
+    {
+        type            pressureInletOutletVelocity;
+        value           uniform (0 0 0);
+    }
+}
+"""),
+
+    "0/p_rgh": ("volScalarField", """
+dimensions      [1 -1 -2 0 0 0 0];
+
+internalField   uniform 0;
+
+boundaryField
+{
+    walls
+    {
+        type            fixedFluxPressure;
+        value           uniform 0;
+    }
+
+    inlet
+    {
+        type            fixedFluxPressure;
+        value           uniform 0;
+    }
+
+    outlet
+    {
+        type            totalPressure;
+        p0              uniform 0;
+        value           uniform 0;
+    }
+}
+"""),
+}
+
+# Template for mold filling simulation
+MOLD_FILLING_TEMPLATE = {
+    "system/controlDict": ("dictionary", """
 application     foamRun;
 
 solver          incompressibleVoF;
@@ -58,375 +182,127 @@ maxCo           0.5;
 maxAlphaCo      0.5;
 
 maxDeltaT       1;
+"""),
 
-// ************************************************************************* //
-""",
-
-    "system/fvSchemes": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      fvSchemes;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
+    "system/fvSchemes": ("dictionary", """
 ddtSchemes
-{{{{
+{
     default         Euler;
-}}}}
+}
 
 gradSchemes
-{{{{
+{
     default         Gauss linear;
-}}}}
+}
 
 divSchemes
-{{{{
+{
     div(rhoPhi,U)   Gauss linearUpwind grad(U);
     div(phi,alpha)  Gauss vanLeer;
     div(phirb,alpha) Gauss linear;
     div(((rho*nuEff)*dev2(T(grad(U))))) Gauss linear;
-}}}}
+}
 
 laplacianSchemes
-{{{{
+{
     default         Gauss linear corrected;
-}}}}
+}
 
 interpolationSchemes
-{{{{
+{
     default         linear;
-}}}}
+}
 
 snGradSchemes
-{{{{
+{
     default         corrected;
-}}}}
-
-// ************************************************************************* //
-""",
-
-    "system/fvSolution": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      fvSolution;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+}
+"""),
 
+    "system/fvSolution": ("dictionary", """
 solvers
-{{{{
+{
     "alpha.metal.*"
-    {{{{
+    {
         nAlphaCorr      2;
         nAlphaSubCycles 1;
         cAlpha          1;
-    }}}}
+    }
 
     pcorr
-    {{{{
+    {
         solver          PCG;
         preconditioner  DIC;
         tolerance       1e-5;
         relTol          0;
-    }}}}
+    }
 
     p_rgh
-    {{{{
+    {
         solver          PCG;
         preconditioner  DIC;
         tolerance       1e-07;
         relTol          0.05;
-    }}}}
+    }
 
     p_rghFinal
-    {{{{
+    {
         $p_rgh;
         relTol          0;
-    }}}}
+    }
 
     U
-    {{{{
+    {
         solver          smoothSolver;
         smoother        symGaussSeidel;
         tolerance       1e-06;
         relTol          0;
-    }}}}
-}}}}
+    }
+}
 
 PIMPLE
-{{{{
+{
     momentumPredictor   no;
     nOuterCorrectors    1;
     nCorrectors         3;
     nNonOrthogonalCorrectors 0;
-}}}}
+}
 
 relaxationFactors
-{{{{
+{
     equations
-    {{{{
+    {
         ".*"            1;
-    }}}}
-}}}}
-
-// ************************************************************************* //
-""",
-
-    "constant/transportProperties": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      transportProperties;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "constant/transportProperties": ("dictionary", """
 phases (metal air);
 
 metal
-{{{{
+{
     transportModel  Newtonian;
     nu              {metal_nu};
     rho             {metal_density};
-}}}}
+}
 
 air
-{{{{
+{
     transportModel  Newtonian;
     nu              1.48e-05;
     rho             1;
-}}}}
+}
 
 sigma           0.07;
+"""),
 
-// ************************************************************************* //
-""",
-
-    "constant/g": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       uniformDimensionedVectorField;
-    location    "constant";
-    object      g;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 1 -2 0 0 0 0];
-value           (0 0 -9.81);
-
-// ************************************************************************* //
-""",
-
-    "constant/momentumTransport": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  11                                    |
-|   \\\\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      momentumTransport;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-simulationType  laminar;
-
-// ************************************************************************* //
-""",
-
-    "0/alpha.metal": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      alpha.metal;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 0 0 0 0 0 0];
-
-internalField   uniform 0;
-
-boundaryField
-{{{{
-    walls
-    {{{{
-        type            zeroGradient;
-    }}}}
-
-    inlet
-    {{{{
-        type            fixedValue;
-        value           uniform 1;
-    }}}}
-
-    outlet
-    {{{{
-        type            inletOutlet;
-        inletValue      uniform 0;
-        value           uniform 0;
-    }}}}
-}}}}
-
-// ************************************************************************* //
-""",
-
-    "0/U": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       volVectorField;
-    object      U;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 1 -1 0 0 0 0];
-
-internalField   uniform (0 0 0);
-
-boundaryField
-{{{{
-    walls
-    {{{{
-        type            noSlip;
-    }}}}
-
-    inlet
-    {{{{
-        type            fixedValue;
-        value           uniform (0 0 0.5);
-    }}}}
-
-    outlet
-    {{{{
-        type            pressureInletOutletVelocity;
-        value           uniform (0 0 0);
-    }}}}
-}}}}
-
-// ************************************************************************* //
-""",
-
-    "0/p_rgh": """/*--------------------------------*- C++ -*----------------------------------*\\
-| =========                 |                                                 |
-| \\\\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\\\    /   O peration     | Version:  v2306                                 |
-|   \\\\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\\\/     M anipulation  |                                                 |
-\\*---------------------------------------------------------------------------*/
-FoamFile
-{{{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      p_rgh;
-}}}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [1 -1 -2 0 0 0 0];
-
-internalField   uniform 0;
-
-boundaryField
-{{{{
-    walls
-    {{{{
-        type            fixedFluxPressure;
-        value           uniform 0;
-    }}}}
-
-    inlet
-    {{{{
-        type            fixedFluxPressure;
-        value           uniform 0;
-    }}}}
-
-    outlet
-    {{{{
-        type            totalPressure;
-        p0              uniform 0;
-        value           uniform 0;
-    }}}}
-}}}}
-
-// ************************************************************************* //
-"""
+    **_COMMON_FILES,
 }
 
-# Template for solidification simulation (with heat transfer)
 # Template for solidification simulation (with heat transfer)
 SOLIDIFICATION_TEMPLATE = {
-    "system/controlDict": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      controlDict;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
+    "system/controlDict": ("dictionary", """
 application     foamRun;
 
 solver          compressibleVoF;
@@ -474,40 +350,22 @@ maxDeltaT       0.01;
 
 // Maximum diffusion number for thermal stability
 maxDi           10;
+"""),
 
-// ************************************************************************* //
-""",
-
-    "system/fvSchemes": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      fvSchemes;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
+    "system/fvSchemes": ("dictionary", """
 ddtSchemes
-{{
+{
     default         Euler;
-}}
+}
 
 gradSchemes
-{{
+{
     default         Gauss linear;
     limited         cellLimited Gauss linear 1;
-}}
+}
 
 divSchemes
-{{
+{
     default                             none;
     
     div(phi,alpha)                      Gauss vanLeer;
@@ -545,133 +403,115 @@ divSchemes
     
     div(((rho*nuEff)*dev2(T(grad(U))))) Gauss linear;
     div((nuEff*dev2(T(grad(U)))))       Gauss linear;
-}}
+}
 
 laplacianSchemes
-{{
+{
     default         Gauss linear corrected;
-}}
+}
 
 interpolationSchemes
-{{
+{
     default         linear;
-}}
+}
 
 snGradSchemes
-{{
+{
     default         corrected;
-}}
+}
 
 fluxRequired
-{{
+{
     default         no;
     p               ;
     alpha.metal     ;
-}}
-
-// ************************************************************************* //
-""",
-
-    "system/fvSolution": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      fvSolution;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+}
+"""),
 
+    "system/fvSolution": ("dictionary", """
 solvers
-{{
+{
     "alpha.metal.*"
-    {{
+    {
         nAlphaCorr      2;
         nAlphaSubCycles 1;
         cAlpha          1;
-    }}
+    }
 
     ".*(rho|rhoFinal)"
-    {{
+    {
         solver          diagonal;
-    }}
+    }
 
     pcorr
-    {{
+    {
         solver          PCG;
         preconditioner  DIC;
         tolerance       1e-5;
         relTol          0;
-    }}
+    }
 
     p_rgh
-    {{
+    {
         solver          PCG;
         preconditioner  DIC;
         tolerance       1e-07;
         relTol          0.05;
-    }}
+    }
 
     p_rghFinal
-    {{
+    {
         $p_rgh;
         relTol          0;
-    }}
+    }
 
     p
-    {{
+    {
         solver          PCG;
         preconditioner  DIC;
         tolerance       1e-07;
         relTol          0.05;
-    }}
+    }
 
     pFinal
-    {{
+    {
         $p;
         relTol          0;
-    }}
+    }
 
     U
-    {{
+    {
         solver          PBiCGStab;
         preconditioner  DILU;
         tolerance       1e-06;
         relTol          0.1;
         maxIter         50;
-    }}
+    }
 
     UFinal
-    {{
+    {
         $U;
         relTol          0;
-    }}
+    }
 
     "(T|e|h).*"
-    {{
+    {
         solver          PBiCGStab;
         preconditioner  DILU;
         tolerance       1e-07;
         relTol          0.1;
         maxIter         50;
-    }}
+    }
 
     TFinal
-    {{
+    {
         $T;
         relTol          0;
-    }}
-}}
+    }
+}
 
 PIMPLE
-{{
+{
     // Enable momentum predictor for compressible flow
     momentumPredictor   yes;
 
@@ -691,146 +531,65 @@ PIMPLE
 
     // Tighter tolerances for thermal solidification
     outerCorrectorResidualControl
-    {{
+    {
         p_rgh
-        {{
+        {
             tolerance   1e-5;
             relTol      0;
-        }}
+        }
         U
-        {{
+        {
             tolerance   1e-5;
             relTol      0;
-        }}
+        }
         "(e|h|T)"
-        {{
+        {
             tolerance   1e-6;
             relTol      0;
-        }}
-    }}
-}}
+        }
+    }
+}
 
 // Under-relaxation for solidification stability
 // Stable source formulation allows more reasonable values
 relaxationFactors
-{{
+{
     fields
-    {{
+    {
         p_rgh           0.7;
         p               0.7;
-    }}
+    }
 
     equations
-    {{
+    {
         U               0.7;
         "(e|h|T)"       0.6;
         ".*"            0.7;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "constant/g": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  v2306                                 |
-|   \\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       uniformDimensionedVectorField;
-    location    "constant";
-    object      g;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 1 -2 0 0 0 0];
-value           (0 0 -9.81);
-
-// ************************************************************************* //
-""",
-
-    "constant/momentumTransport": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      momentumTransport;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-simulationType  laminar;
-
-// ************************************************************************* //
-""",
-
-    "constant/phaseProperties": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      phaseProperties;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "constant/phaseProperties": ("dictionary", """
 type    thermalPhaseChangeMultiphaseSystem;
 
 phases  (metal gas);
 
 metal
-{{
+{
     type            pureMovingPhaseModel;
-}}
+}
 
 gas
-{{
+{
     type            pureMovingPhaseModel;
-}}
+}
 
 sigma   0.07;
+"""),
 
-// ************************************************************************* //
-""",
-
-    "constant/physicalProperties.metal": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      physicalProperties.metal;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
+    "constant/physicalProperties.metal": ("dictionary", """
 thermoType
-{{
+{
     type            heRhoThermo;
     mixture         pureMixture;
     transport       const;
@@ -838,52 +597,34 @@ thermoType
     equationOfState rhoConst;
     specie          specie;
     energy          sensibleEnthalpy;
-}}
+}
 
 mixture
-{{
+{
     specie
-    {{
+    {
         molWeight   26.98;
-    }}
+    }
     equationOfState
-    {{
+    {
         rho         {metal_density};
-    }}
+    }
     thermodynamics
-    {{
-        Cp          {metal_specific_heat};
+    {
+        Cp          {metal_cp};
         Hf          0;
-    }}
+    }
     transport
-    {{
+    {
         mu          {metal_viscosity};
         Pr          0.7;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "constant/physicalProperties.gas": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "constant";
-    object      physicalProperties.gas;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "constant/physicalProperties.gas": ("dictionary", """
 thermoType
-{{
+{
     type            heRhoThermo;
     mixture         pureMixture;
     transport       const;
@@ -891,268 +632,84 @@ thermoType
     equationOfState perfectGas;
     specie          specie;
     energy          sensibleEnthalpy;
-}}
+}
 
 mixture
-{{
+{
     specie
-    {{
+    {
         molWeight   28.97;
-    }}
+    }
     thermodynamics
-    {{
+    {
         Cp          1005;
         Hf          0;
-    }}
+    }
     transport
-    {{
+    {
         mu          1.8e-05;
         Pr          0.7;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "0/alpha.metal": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  v2306                                 |
-|   \\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      alpha.metal;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 0 0 0 0 0 0];
-
-internalField   uniform 0;
-
-boundaryField
-{{
-    walls
-    {{
-        type            zeroGradient;
-    }}
-
-    inlet
-    {{
-        type            fixedValue;
-        value           uniform 1;
-    }}
-
-    outlet
-    {{
-        type            inletOutlet;
-        inletValue      uniform 0;
-        value           uniform 0;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "0/U": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  v2306                                 |
-|   \\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       volVectorField;
-    object      U;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [0 1 -1 0 0 0 0];
-
-internalField   uniform (0 0 0);
-
-boundaryField
-{{
-    walls
-    {{
-        type            noSlip;
-    }}
-
-    inlet
-    {{
-        type            fixedValue;
-        value           uniform (0 0 0.5);
-    }}
-
-    outlet
-    {{
-        type            pressureInletOutletVelocity;
-        value           uniform (0 0 0);
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "0/p_rgh": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  v2306                                 |
-|   \\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      p_rgh;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
-
-dimensions      [1 -1 -2 0 0 0 0];
-
-internalField   uniform 0;
-
-boundaryField
-{{
-    walls
-    {{
-        type            fixedFluxPressure;
-        value           uniform 0;
-    }}
-
-    inlet
-    {{
-        type            fixedFluxPressure;
-        value           uniform 0;
-    }}
-
-    outlet
-    {{
-        type            totalPressure;
-        p0              uniform 0;
-        value           uniform 0;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "0/p": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      p;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "0/p": ("volScalarField", """
 dimensions      [1 -1 -2 0 0 0 0];
 
 internalField   uniform 101325;
 
 boundaryField
-{{
+{
     walls
-    {{
+    {
         type            calculated;
         value           uniform 101325;
-    }}
+    }
 
     inlet
-    {{
+    {
         type            calculated;
         value           uniform 101325;
-    }}
+    }
 
     outlet
-    {{
+    {
         type            totalPressure;
         p0              uniform 101325;
         value           uniform 101325;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "0/T": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  v2306                                 |
-|   \\  /    A nd           | Website:  www.openfoam.com                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       volScalarField;
-    object      T;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "0/T": ("volScalarField", """
 dimensions      [0 0 0 1 0 0 0];
 
 internalField   uniform {mold_temp};
 
 boundaryField
-{{
+{
     walls
-    {{
+    {
         type            fixedValue;
         value           uniform {mold_temp};
-    }}
+    }
 
     inlet
-    {{
+    {
         type            fixedValue;
         value           uniform {pouring_temp};
-    }}
+    }
 
     outlet
-    {{
+    {
         type            zeroGradient;
-    }}
-}}
-
-// ************************************************************************* //
-""",
-
-    "system/fvOptions": """/*--------------------------------*- C++ -*----------------------------------*\
-| =========                 |                                                 |
-| \\      /  F ield         | OpenFOAM: The Open Source CFD Toolbox           |
-|  \\    /   O peration     | Version:  11                                    |
-|   \\  /    A nd           | Website:  www.openfoam.org                      |
-|    \\/     M anipulation  |                                                 |
-\*---------------------------------------------------------------------------*/
-FoamFile
-{{
-    version     2.0;
-    format      ascii;
-    class       dictionary;
-    location    "system";
-    object      fvOptions;
-}}
-// * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * * //
+    }
+}
+"""),
 
+    "system/fvOptions": ("dictionary", """
 solidificationHeat
-{{
+{
     type            coded;
     active          yes;
     name            solidificationSource;
@@ -1162,12 +719,12 @@ solidificationHeat
     field           h;
 
     codeCorrect
-    #{{
+    #{
         // Do nothing
-    #}};
+    #};
 
     codeAddSup
-    #{{
+    #{
         const volScalarField& T = mesh().lookupObject<volScalarField>("T");
         const volScalarField& alpha = mesh().lookupObject<volScalarField>("alpha.metal");
 
@@ -1191,29 +748,29 @@ solidificationHeat
         const scalar relax = 0.1;  // Under-relaxation factor for stability
 
         forAll(hSource, i)
-        {{
+        {
             if (alpha[i] > 0.5)  // Only in metal phase
-            {{
+            {
                 if (T[i] < Tliquidus && T[i] > Tsolidus)
-                {{
+                {
                     // In mushy zone - add latent heat source
                     // Source = rho * L * (solid_fraction) / tau * relax
                     // Negative sign because solidification RELEASES heat (exothermic)
                     scalar solidFraction = 1.0 - fl[i];
                     hSource[i] -= relax * rho * L * solidFraction * V[i] / tau;
-                }}
-            }}
-        }}
-    #}};
+                }
+            }
+        }
+    #};
 
     codeSetValue
-    #{{
+    #{
         // Do nothing
-    #}};
-}}
+    #};
+}
 
 mushyZoneDrag
-{{
+{
     type            coded;
     active          yes;
     name            mushyZoneSource;
@@ -1223,12 +780,12 @@ mushyZoneDrag
     field           U;
 
     codeCorrect
-    #{{
+    #{
         // Do nothing
-    #}};
+    #};
 
     codeAddSup
-    #{{
+    #{
         const volScalarField& T = mesh().lookupObject<volScalarField>("T");
         const volScalarField& alpha = mesh().lookupObject<volScalarField>("alpha.metal");
         const volVectorField& U = mesh().lookupObject<volVectorField>("U");
@@ -1248,11 +805,11 @@ mushyZoneDrag
         fl = max(min(fl, 1.0), 0.0);
 
         forAll(USource, i)
-        {{
+        {
             if (alpha[i] > 0.5)  // Only in metal phase
-            {{
+            {
                 if (fl[i] < 0.999)  // Not fully liquid
-                {{
+                {
                     // Carman-Kozeny permeability model
                     scalar flCubed = fl[i] * fl[i] * fl[i];
                     scalar solidFrac = 1.0 - fl[i];
@@ -1263,17 +820,17 @@ mushyZoneDrag
 
                     // Add drag term (momentum sink)
                     USource[i] -= drag * U[i] * V[i];
-                }}
-            }}
-        }}
-    #}};
+                }
+            }
+        }
+    #};
 
     codeSetValue
-    #{{
+    #{
         // Do nothing
-    #}};
-}}
+    #};
+}
+"""),
 
-// ************************************************************************* //
-"""
+    **_COMMON_FILES,
 }
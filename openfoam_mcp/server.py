@@ -37,7 +37,7 @@ app = Server("openfoam-mcp")
 openfoam_client = OpenFOAMClient()
 case_manager = CaseManager()
 result_analyzer = RealResultAnalyzer()  # REAL analyzer with actual OpenFOAM parsing
-parametric_engine = ParametricStudyEngine()
+parametric_engine = ParametricStudyEngine(openfoam_client=openfoam_client)
 
 
 @app.list_tools()
@@ -87,6 +87,10 @@ async def list_tools() -> list[Tool]:
                     "filter_type": {
                         "type": "string",
                         "description": "Filter cases by type (optional)"
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of cases to return (optional)"
                     }
                 }
             }
@@ -216,6 +220,11 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "default": 4,
                         "description": "Number of processors for parallel execution"
+                    },
+                    "check_quality": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "Run checkMesh to assess mesh quality (otherwise only cell and point counts are reported)"
                     }
                 },
                 "required": ["case_name"]
@@ -253,6 +262,11 @@ async def list_tools() -> list[Tool]:
                         "type": "integer",
                         "default": 4,
                         "description": "Number of processors for parallel execution"
+                    },
+                    "reconstruct": {
+                        "type": "boolean",
+                        "default": True,
+                        "description": "Reconstruct parallel results (analysis also works on the processor directories)"
                     }
                 },
                 "required": ["case_name"]
@@ -428,6 +442,20 @@ async def list_tools() -> list[Tool]:
                         "enum": ["minimize_porosity", "minimize_shrinkage", "minimize_hot_spots", "fastest_fill"],
                         "default": "minimize_porosity",
                         "description": "Optimization metric"
+                    },
+                    "max_concurrent": {
+                        "type": "integer",
+                        "default": 4,
+                        "description": "Maximum number of simulations run at the same time"
+                    },
+                    "early_stop_threshold": {
+                        "type": "number",
+                        "description": "Stop once a configuration scores at or below this value (optional)"
+                    },
+                    "processors_per_case": {
+                        "type": "integer",
+                        "default": 1,
+                        "description": "MPI ranks per simulation; cores are split among simultaneous runs"
                     }
                 },
                 "required": ["base_case_name", "parameters"]
@@ -503,7 +531,10 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
         elif name == "list_cases":
             filter_type = arguments.get("filter_type")
 
-            cases = await case_manager.list_cases(filter_type=filter_type)
+            cases = await case_manager.list_cases(
+                filter_type=filter_type,
+                limit=arguments.get("limit")
+            )
 
             if not cases:
                 return [TextContent(type="text", text="No cases found.")]
@@ -579,7 +610,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
             result = await openfoam_client.run_mesh_generation(
                 case_name=case_name,
                 parallel=parallel,
-                num_processors=num_procs
+                num_processors=num_procs,
+                check_quality=arguments.get("check_quality", True)
             )
 
             return [TextContent(
@@ -603,7 +635,8 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
                 end_time=arguments.get("end_time"),
                 write_interval=arguments.get("write_interval"),
                 parallel=parallel,
-                num_processors=arguments.get("num_processors", 4)
+                num_processors=arguments.get("num_processors", 4),
+                reconstruct=arguments.get("reconstruct", True)
             )
 
             return [TextContent(
@@ -964,7 +997,10 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent | ImageCo
             result = await parametric_engine.run_parametric_study(
                 base_case_name=base_case_name,
                 parameters=parameters,
-                metric=metric
+                metric=metric,
+                max_concurrent=arguments.get("max_concurrent", 4),
+                early_stop_threshold=arguments.get("early_stop_threshold"),
+                processors_per_case=arguments.get("processors_per_case", 1)
             )
 
             # Format parametric study results
@@ -1,5 +1,10 @@
 """Utility modules for OpenFOAM MCP."""
 
 from .field_parser import OpenFOAMFieldParser
+from .file_io import (
+    append_file, clone_tree, copy_file, link_or_copy, make_dirs, regex_rewrite, write_file,
+    write_file_atomic
+)
 
-__all__ = ['OpenFOAMFieldParser']
+__all__ = ['OpenFOAMFieldParser', 'append_file', 'clone_tree', 'copy_file', 'link_or_copy', 'make_dirs',
+           'regex_rewrite', 'write_file', 'write_file_atomic']
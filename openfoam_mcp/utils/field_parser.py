@@ -4,13 +4,29 @@ This module provides utilities for reading and parsing OpenFOAM field files
 (both ASCII and binary formats) and extracting data for analysis.
 """
 
+import mmap
+import os
 import re
 import struct
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Union
 import numpy as np
 from loguru import logger
 
+_NONUNIFORM_SCALARS_RE = re.compile(rb'internalField\s+nonuniform\s+List<scalar>\s*(\d+)\s*\(')
+_BINARY_FORMAT_RE = re.compile(rb'format\s+binary\s*;')
+_SCALAR32_RE = re.compile(rb'scalar=32')
+
+# Parsed ASCII value lists are kept as .npy files in this case subdirectory.
+# It only holds derived data: it may be deleted at any time and is not copied
+# into parametric clones.
+ANALYSIS_CACHE_DIR = ".analysis_cache"
+# Smaller lists parse faster than a cache round trip
+_CACHE_MIN_VALUES = 10000
+# Least recently stored entries are evicted beyond this many bytes per case
+_CACHE_MAX_BYTES = 1 << 30
+
 
 class OpenFOAMFieldParser:
     """Parser for OpenFOAM field files."""
@@ -22,16 +38,55 @@ class OpenFOAMFieldParser:
             case_dir: Path to OpenFOAM case directory
         """
         self.case_dir = Path(case_dir)
+        self._roots: Optional[List[Path]] = None
+        self._times: Optional[List[float]] = None
+        self._scalar_fields: Dict[Tuple[str, float], Dict[str, any]] = {}
+        self._gradients: Dict[Tuple[str, float], np.ndarray] = {}
+
+    def _field_roots(self) -> List[Path]:
+        """Get the directories that hold the case's time directories.
+
+        A case run in parallel without reconstructPar keeps its results in
+        processor* directories; fields are then read from every processor
+        and joined in processor order.
+
+        Returns:
+            Case directory, or the processor directories of a decomposed case
+        """
+        if self._roots is None:
+            processors = sorted(
+                (p for p in self.case_dir.glob("processor*") if p.name[9:].isdigit() and p.is_dir()),
+                key=lambda p: int(p.name[9:])
+            )
+            self._roots = [self.case_dir]
+            if processors:
+                decomposed_times = self._list_times(processors[0])
+                times = self._list_times(self.case_dir)
+                if decomposed_times and (not times or decomposed_times[-1] > times[-1]):
+                    self._roots = processors
+
+        return self._roots
 
     def get_time_directories(self) -> List[float]:
         """Get all time directories in case.
 
+        The directory is scanned once per parser; create a new parser to
+        see time directories written since.
+
         Returns:
             List of time values (sorted)
         """
+        if self._times is None:
+            self._times = self._list_times(self._field_roots()[0])
+
+        return self._times
+
+    @staticmethod
+    def _list_times(directory: Path) -> List[float]:
+        """List the time directories directly inside a directory."""
         time_dirs = []
 
-        for item in self.case_dir.iterdir():
+        for item in directory.iterdir():
             if item.is_dir():
                 try:
                     # Try to convert directory name to float (time value)
@@ -43,6 +98,44 @@ class OpenFOAMFieldParser:
 
         return sorted(time_dirs)
 
+    def results_stamp(self) -> Tuple:
+        """Identify the current state of the case's results.
+
+        Covers what analyses read: the time directories of each field root
+        (see _field_roots) and the (mtime, size) of every file in the latest
+        one, so it changes when a run (serial or decomposed) adds a time
+        directory or rewrites fields. Call it on a new parser: the field
+        roots are determined once per parser.
+
+        Returns:
+            Hashable stamp; equal stamps mean unchanged results
+        """
+        stamp = []
+
+        for root in self._field_roots():
+            time_dirs = []
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        try:
+                            time_dirs.append((float(entry.name), entry.path))
+                        except ValueError:
+                            continue
+            time_dirs.sort()
+
+            files = ()
+            if time_dirs:
+                with os.scandir(time_dirs[-1][1]) as entries:
+                    files = tuple(sorted(
+                        (entry.name, stat.st_mtime_ns, stat.st_size)
+                        for entry in entries if entry.is_file()
+                        for stat in (entry.stat(),)
+                    ))
+
+            stamp.append((root.name, tuple(time for time, _ in time_dirs), files))
+
+        return tuple(stamp)
+
     def get_latest_time(self) -> Optional[float]:
         """Get latest time in simulation.
 
@@ -67,32 +160,22 @@ class OpenFOAMFieldParser:
                 'dimensions': field dimensions,
                 'class': field class
             }
+
+            Reads are cached per (field_name, time); the returned values are
+            read-only and shared between callers.
         """
         if time is None:
             time = self.get_latest_time()
             if time is None:
                 raise ValueError("No time directories found in case")
 
-        # Handle time formatting: OpenFOAM uses "0" for t=0, but keeps decimals for other times
-        # Try to find the actual directory name
-        time_str = str(int(time)) if time == 0.0 else str(time)
-        field_path = self.case_dir / time_str / field_name
+        cached = self._scalar_fields.get((field_name, time))
+        if cached is not None:
+            return cached
 
-        # If not found, try alternative formatting
-        if not field_path.exists() and time != 0.0:
-            # Try without trailing .0
-            if str(time).endswith('.0'):
-                alt_time_str = str(int(time))
-                alt_field_path = self.case_dir / alt_time_str / field_name
-                if alt_field_path.exists():
-                    field_path = alt_field_path
-                    time_str = alt_time_str
-
-        if not field_path.exists():
-            raise FileNotFoundError(f"Field file not found: {field_path}")
-
-        with open(field_path, 'r') as f:
-            content = f.read()
+        files = [self._read_scalar_file(path) for path in self._field_paths(field_name, time)]
+        contents = [content for content, _ in files]
+        content = contents[0]
 
         # Parse FoamFile header
         foam_file = self._parse_foam_file_header(content)
@@ -105,18 +188,46 @@ class OpenFOAMFieldParser:
         dimensions = self._parse_dimensions(content)
 
         # Parse internal field
-        internal_field = self._parse_internal_field(content)
+        internal_field = self._join(values for _, values in files)
+        internal_field.flags.writeable = False
 
         # Parse boundary field
-        boundary_field = self._parse_boundary_field(content)
+        boundary_field = self._join_boundaries(contents)
 
-        return {
+        field = {
             'internal_field': internal_field,
             'boundary_field': boundary_field,
             'dimensions': dimensions,
             'class': foam_file.get('class', 'unknown'),
             'time': time
         }
+        self._scalar_fields[(field_name, time)] = field
+
+        return field
+
+    def read_scalar_gradient(self, field_name: str, time: Optional[float] = None) -> np.ndarray:
+        """Read a scalar field's gradient magnitude (see calculate_gradient).
+
+        Cached per (field_name, time) like the field itself; the returned
+        array is read-only and shared between callers.
+
+        Args:
+            field_name: Name of a non-empty scalar field
+            time: Time directory to read from (uses latest if None)
+
+        Returns:
+            Gradient magnitude at each cell
+        """
+        field = self.read_scalar_field(field_name, time)
+        key = (field_name, field['time'])
+
+        gradient = self._gradients.get(key)
+        if gradient is None:
+            gradient = self.calculate_gradient(field['internal_field'])
+            gradient.flags.writeable = False
+            self._gradients[key] = gradient
+
+        return gradient
 
     def read_vector_field(self, field_name: str, time: Optional[float] = None) -> Dict[str, any]:
         """Read vector field from OpenFOAM case.
@@ -131,27 +242,15 @@ class OpenFOAMFieldParser:
         if time is None:
             time = self.get_latest_time()
 
-        # Handle time formatting: OpenFOAM uses "0" for t=0, but keeps decimals for other times
-        time_str = str(int(time)) if time == 0.0 else str(time)
-        field_path = self.case_dir / time_str / field_name
-
-        # If not found, try alternative formatting
-        if not field_path.exists() and time != 0.0:
-            if str(time).endswith('.0'):
-                alt_time_str = str(int(time))
-                alt_field_path = self.case_dir / alt_time_str / field_name
-                if alt_field_path.exists():
-                    field_path = alt_field_path
-
-        with open(field_path, 'r') as f:
-            content = f.read()
+        contents = self._read_field_files(field_name, time)
+        content = contents[0]
 
         foam_file = self._parse_foam_file_header(content)
         dimensions = self._parse_dimensions(content)
 
         # Parse internal field (vectors)
-        internal_field = self._parse_vector_internal_field(content)
-        boundary_field = self._parse_boundary_field(content)
+        internal_field = self._join(self._parse_vector_internal_field(c) for c in contents)
+        boundary_field = self._join_boundaries(contents)
 
         return {
             'internal_field': internal_field,
@@ -161,6 +260,226 @@ class OpenFOAMFieldParser:
             'time': time
         }
 
+    def _read_field_files(self, field_name: str, time: float) -> List[str]:
+        """Read a field file from each field root (see _field_roots).
+
+        Args:
+            field_name: Name of field
+            time: Time directory to read from
+
+        Returns:
+            File contents, one per root
+        """
+        contents = []
+
+        for field_path in self._field_paths(field_name, time):
+            with open(field_path, 'r') as f:
+                contents.append(f.read())
+
+        return contents
+
+    def _read_scalar_file(self, field_path: Path) -> Tuple[str, np.ndarray]:
+        """Read a scalar field file without decoding its value list as text.
+
+        The file is memory-mapped. A nonuniform internalField is parsed
+        straight into an array: binary lists are mapped in place with
+        np.memmap, and ASCII lists are parsed in C by np.fromstring. Only
+        the text around the list is decoded.
+
+        Large parsed ASCII lists are persisted under the case's
+        ANALYSIS_CACHE_DIR and reused while the field file is unchanged
+        (see _load_cached_values).
+
+        Args:
+            field_path: Path to the field file
+
+        Returns:
+            File text with the internalField values cut out, and the values
+        """
+        stat = field_path.stat()
+        if stat.st_size == 0:
+            return '', self._parse_internal_field('')
+
+        with open(field_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            match = _NONUNIFORM_SCALARS_RE.search(mm)
+            if match is None:
+                content = mm[:].decode(errors='replace')
+                return content, self._parse_internal_field(content)
+
+            size = int(match.group(1))
+            start = match.end()
+            header = mm[:start]
+
+            if _BINARY_FORMAT_RE.search(header):
+                dtype = np.dtype('<f4' if _SCALAR32_RE.search(header) else '<f8')
+                end = start + size * dtype.itemsize
+                if end > len(mm):
+                    raise ValueError(f"Truncated binary field: {field_path}")
+                values = np.memmap(field_path, dtype=dtype, mode='r', offset=start, shape=(size,))
+            else:
+                end = mm.find(b')', start)
+                if end < 0:
+                    raise ValueError(f"Unterminated internalField list: {field_path}")
+                values = self._load_cached_values(field_path, stat, size)
+                if values is None:
+                    try:
+                        values = np.fromstring(mm[start:end], sep=' ')
+                    except ValueError as e:
+                        # Newer NumPy rejects unparsable text; older versions stop at it
+                        raise ValueError(f"Malformed internalField list: {field_path}") from e
+                    if len(values) != size:
+                        raise ValueError(
+                            f"Expected {size} internalField values, read {len(values)}: {field_path}"
+                        )
+                    self._store_cached_values(field_path, stat, values)
+
+            content = (header + mm[end:]).decode(errors='replace')
+
+        return content, values
+
+    def _cache_path(self, field_path: Path, stat: os.stat_result) -> Path:
+        """Path of the persisted values of a field file in a given state.
+
+        The name records the file's inode, size, mtime and ctime, so a
+        rewrite is detected even when it keeps the size and mtime (ctime
+        cannot be set back by the writer).
+        """
+        relative = field_path.relative_to(self.case_dir)
+        stamp = f"{stat.st_ino:x}-{stat.st_size:x}-{stat.st_mtime_ns:x}-{stat.st_ctime_ns:x}"
+        return self.case_dir / ANALYSIS_CACHE_DIR / f"{'_'.join(relative.parts)}@{stamp}.npy"
+
+    def _load_cached_values(
+        self,
+        field_path: Path,
+        stat: os.stat_result,
+        size: int
+    ) -> Optional[np.ndarray]:
+        """Load persisted values of a field file, if still current.
+
+        Args:
+            field_path: Path to the field file
+            stat: Status of the field file
+            size: Expected number of values
+
+        Returns:
+            Read-only memory-mapped values, or None on a cache miss
+        """
+        if size < _CACHE_MIN_VALUES:
+            return None
+
+        try:
+            values = np.load(self._cache_path(field_path, stat), mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+
+        return values if values.shape == (size,) else None
+
+    def _store_cached_values(self, field_path: Path, stat: os.stat_result, values: np.ndarray):
+        """Persist parsed values of a field file (see _load_cached_values).
+
+        The entry is written to a unique temporary file and renamed into
+        place, so concurrent writers of the same field never see each
+        other's partial files. It is not fsync'd: a lost entry is simply
+        parsed again. Then the entry for an earlier state of the same file
+        is removed, and the least recently stored entries are evicted while
+        the cache exceeds _CACHE_MAX_BYTES. Failures (e.g. a read-only case
+        directory) only skip the cache.
+
+        Args:
+            field_path: Path to the field file
+            stat: Status of the field file when it was read
+            values: Parsed values
+        """
+        if len(values) < _CACHE_MIN_VALUES:
+            return
+
+        cache_path = self._cache_path(field_path, stat)
+        prefix = cache_path.name.partition('@')[0]
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=cache_path.parent)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    np.save(f, values)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            # Only complete entries: temporary files of other writers end in .tmp
+            entries = []
+            with os.scandir(cache_path.parent) as scan:
+                for entry in scan:
+                    if not entry.name.endswith('.npy'):
+                        continue
+                    try:
+                        if entry.name.partition('@')[0] == prefix and entry.name != cache_path.name:
+                            os.unlink(entry.path)
+                        else:
+                            entry_stat = entry.stat()
+                            entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry.path))
+                    except FileNotFoundError:
+                        pass  # Removed by a concurrent writer
+
+            total = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, path in sorted(entries):
+                if total <= _CACHE_MAX_BYTES:
+                    break
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+                total -= entry_size
+        except OSError as e:
+            logger.debug(f"Could not cache values of {field_path}: {e}")
+
+    def _field_paths(self, field_name: str, time: float) -> List[Path]:
+        """Locate a field file in each field root (see _field_roots).
+
+        Args:
+            field_name: Name of field
+            time: Time directory to read from
+
+        Returns:
+            Field file paths, one per root
+        """
+        paths = []
+
+        for root in self._field_roots():
+            # Handle time formatting: OpenFOAM uses "0" for t=0, but keeps decimals for other times
+            time_str = str(int(time)) if time == 0.0 else str(time)
+            field_path = root / time_str / field_name
+
+            # If not found, try alternative formatting
+            if not field_path.exists() and time != 0.0:
+                # Try without trailing .0
+                if str(time).endswith('.0'):
+                    alt_field_path = root / str(int(time)) / field_name
+                    if alt_field_path.exists():
+                        field_path = alt_field_path
+
+            if not field_path.exists():
+                raise FileNotFoundError(f"Field file not found: {field_path}")
+
+            paths.append(field_path)
+
+        return paths
+
+    @staticmethod
+    def _join(arrays) -> np.ndarray:
+        """Join per-processor field values in processor order."""
+        arrays = [a for a in arrays if a.size]
+        if not arrays:
+            return np.array([])
+        return arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    def _join_boundaries(self, contents: List[str]) -> Dict[str, Dict]:
+        """Merge boundaryField entries from per-processor field files."""
+        boundary_field = {}
+        for content in contents:
+            boundary_field.update(self._parse_boundary_field(content))
+        return boundary_field
+
     def _parse_foam_file_header(self, content: str) -> Dict[str, str]:
         """Parse FoamFile dictionary."""
         foam_file = {}
@@ -280,18 +599,20 @@ class OpenFOAMFieldParser:
         Returns:
             Nx3 array of cell centers
         """
-        c_file = self.case_dir / "constant" / "polyMesh" / "C"
+        c_files = [root / "constant" / "polyMesh" / "C" for root in self._field_roots()]
 
-        if not c_file.exists():
+        if not all(c_file.exists() for c_file in c_files):
             # Try to generate with postProcess
             logger.warning("Cell centers file not found. Run 'postProcess -func writeCellCentres'")
             return np.array([])
 
         # Read C file (similar to vector field)
-        with open(c_file, 'r') as f:
-            content = f.read()
+        centers = []
+        for c_file in c_files:
+            with open(c_file, 'r') as f:
+                centers.append(self._parse_vector_internal_field(f.read()))
 
-        return self._parse_vector_internal_field(content)
+        return self._join(centers)
 
     def calculate_field_statistics(self, field_data: np.ndarray) -> Dict[str, float]:
         """Calculate statistics for a field.
@@ -314,8 +635,9 @@ class OpenFOAMFieldParser:
         return {
             'min': float(np.min(field_data)),
             'max': float(np.max(field_data)),
-            'mean': float(np.mean(field_data)),
-            'std': float(np.std(field_data)),
+            # Accumulate in float64 even for float32 fields
+            'mean': float(np.mean(field_data, dtype=np.float64)),
+            'std': float(np.std(field_data, dtype=np.float64)),
             'count': len(field_data)
         }
 
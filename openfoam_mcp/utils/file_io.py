@@ -0,0 +1,224 @@
+"""Filesystem helpers for writing and copying case files."""
+
+import errno
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Iterable, List, Tuple, Union
+
+
+def write_file_atomic(path: Union[str, Path], data: bytes):
+    """Replace a file's contents atomically.
+
+    The payload is written to a sibling temporary file with a single
+    write() call, flushed to disk, and renamed over the target, so readers
+    never observe a partially written file.
+
+    Args:
+        path: Destination file path
+        data: Complete file contents
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    os.replace(tmp_path, path)
+
+
+def make_dirs(directories: Iterable[Union[str, Path]]):
+    """Create each directory exactly once, parents before children.
+
+    The directories are deduplicated and sorted by depth so that a plain
+    mkdir() usually succeeds; makedirs() is only needed to fill in an
+    intermediate directory that is not in the set.
+
+    Args:
+        directories: Directories to create (existing ones are left alone)
+    """
+    for directory in sorted(set(map(Path, directories)), key=lambda d: len(d.parts)):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            os.makedirs(directory, exist_ok=True)
+
+
+def write_file(path: Union[str, Path], data: bytes):
+    """Write a file with the minimum number of syscalls.
+
+    Bypasses the buffered io stack (which adds fstat/ioctl/lseek calls
+    per open) and issues just open, write and close.
+
+    Args:
+        path: Destination file path
+        data: Complete file contents
+    """
+    # 0o666 before umask, matching files created through open()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+def regex_rewrite(path: Union[str, Path], substitutions: Iterable[Tuple[re.Pattern, str]]) -> bool:
+    """Rewrite a text file by applying regex substitutions in order.
+
+    Nothing is written when the substitutions are no-ops. Otherwise the file
+    is replaced with write_file_atomic, so a concurrent reader (or a solver
+    started on the case) never sees a half-rewritten file, and a hardlinked
+    copy elsewhere keeps its original contents.
+
+    Meant to be run in a worker thread (asyncio.to_thread) so the read and
+    write do not block the event loop.
+
+    Args:
+        path: File to rewrite
+        substitutions: (compiled pattern, replacement) pairs
+
+    Returns:
+        True if the file was modified
+    """
+    path = Path(path)
+    original = path.read_bytes()
+    content = original.decode()
+    for pattern, replacement in substitutions:
+        content = pattern.sub(replacement, content)
+    data = content.encode()
+
+    if data == original:
+        return False
+
+    write_file_atomic(path, data)
+    return True
+
+
+def append_file(path: Union[str, Path], data: bytes) -> int:
+    """Append data to a file, creating it if needed.
+
+    The file is opened with O_APPEND so concurrent appenders never
+    overwrite each other's records.
+
+    Args:
+        path: File to append to
+        data: Bytes to append
+
+    Returns:
+        Size of the file after the append
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        return os.fstat(fd).st_size
+    finally:
+        os.close(fd)
+
+
+def copy_file(src: Union[str, Path], dst: Union[str, Path]):
+    """Copy file contents without copying permission bits.
+
+    Uses os.copy_file_range where available so the data never passes
+    through user space (and becomes a reflink on filesystems that support
+    it), falling back to shutil.copyfile.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:
+            # Unsupported by the kernel or filesystem - use the portable path
+            pass
+
+    shutil.copyfile(src, dst)
+
+
+def link_or_copy(src: Union[str, Path], dst: Union[str, Path]):
+    """Make a read-only source file available at another path.
+
+    Tries a hardlink first (no data is copied and all links share the page
+    cache), then a symlink when the paths are on different filesystems, and
+    finally a full copy.
+
+    Args:
+        src: Source file path
+        dst: Destination file path (replaced if it exists)
+    """
+    dst = Path(dst)
+    if dst.exists() and os.path.samefile(src, dst):
+        return
+    dst.unlink(missing_ok=True)
+
+    try:
+        os.link(src, dst)
+        return
+    except OSError as e:
+        if e.errno == errno.EXDEV:
+            try:
+                os.symlink(Path(src).resolve(), dst)
+                return
+            except OSError:
+                pass
+
+    copy_file(src, dst)
+
+
+def clone_tree(
+    src: Union[str, Path],
+    dst: Union[str, Path],
+    shared: Iterable[str] = (),
+    exclude: Iterable[str] = ()
+):
+    """Copy a directory tree, hardlinking files that are never rewritten.
+
+    Files are copied with copy_file, so on copy-on-write filesystems the
+    clone shares data blocks with the source. Files under the ``shared``
+    subdirectories are linked instead; only use this for data nothing
+    writes to in place, since a hardlink shares the inode with the source.
+
+    Args:
+        src: Source directory
+        dst: Destination directory (must not exist)
+        shared: Subdirectories of src, relative to it, whose files are linked
+        exclude: Subdirectories of src, relative to it, that are not copied
+    """
+    shared_prefixes = tuple(os.path.join(str(src), d) + os.sep for d in shared)
+    excluded = {os.path.join(str(src), d) for d in exclude}
+
+    def ignore(directory: str, names: List[str]) -> List[str]:
+        return [name for name in names if os.path.join(directory, name) in excluded]
+
+    def copy_function(s: str, d: str):
+        if s.startswith(shared_prefixes):
+            link_or_copy(s, d)
+        else:
+            copy_file(s, d)
+
+    shutil.copytree(src, dst, symlinks=True, ignore=ignore, copy_function=copy_function)
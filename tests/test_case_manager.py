@@ -89,6 +89,24 @@ async def test_list_cases(case_manager):
     assert mold_filling_cases[0]["name"] == "case1"
 
 
+@pytest.mark.asyncio
+async def test_list_cases_limit(case_manager):
+    """Test limiting the number of listed cases."""
+    for name in ("case1", "case2", "case3"):
+        await case_manager.create_case(
+            case_name=name,
+            case_type="mold_filling",
+            metal_type="aluminum",
+            pouring_temperature=750
+        )
+
+    cases = await case_manager.list_cases(limit=2)
+    assert [c["name"] for c in cases] == ["case1", "case2"]
+
+    names = [c["name"] for c in case_manager.iter_cases(filter_type="mold_filling")]
+    assert names == ["case1", "case2", "case3"]
+
+
 @pytest.mark.asyncio
 async def test_setup_geometry_blockmesh(case_manager):
     """Test setting up blockMesh geometry."""
@@ -114,6 +132,81 @@ async def test_setup_geometry_blockmesh(case_manager):
     assert (case_dir / "system" / "blockMeshDict").exists()
 
 
+@pytest.mark.asyncio
+async def test_setup_geometry_blockmesh_cell_counts(case_manager):
+    """Test blockMesh cell counts are rounded and never zero."""
+    await case_manager.create_case(
+        case_name="test_case",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+
+    await case_manager.setup_geometry(
+        case_name="test_case",
+        geometry_type="blockMesh",
+        dimensions={"length": 0.2, "width": 0.001, "height": 0.1},
+        mesh_refinement="medium"
+    )
+
+    case_dir = case_manager.run_dir / "test_case"
+    block_mesh_dict = (case_dir / "system" / "blockMeshDict").read_text()
+    assert "(20 1 10)" in block_mesh_dict
+
+
+@pytest.mark.asyncio
+async def test_setup_geometry_nonexistent_case(case_manager):
+    """Test that setting up geometry for a missing case raises error."""
+    with pytest.raises(ValueError, match="does not exist"):
+        await case_manager.setup_geometry(
+            case_name="nonexistent_case",
+            geometry_type="blockMesh"
+        )
+
+
+@pytest.mark.asyncio
+async def test_setup_geometry_stl(case_manager, temp_run_dir):
+    """Test importing an STL file."""
+    await case_manager.create_case(
+        case_name="test_case",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+
+    stl_path = Path(temp_run_dir) / "part.stl"
+    stl_path.write_text("solid part\nendsolid part\n")
+
+    result = await case_manager.setup_geometry(
+        case_name="test_case",
+        geometry_type="stl_file",
+        stl_path=str(stl_path),
+        mesh_refinement="fine"
+    )
+
+    assert result["stl_file"] == "part.stl"
+
+    case_dir = case_manager.run_dir / "test_case"
+    dest_stl = case_dir / "constant" / "triSurface" / "part.stl"
+    assert dest_stl.read_text() == stl_path.read_text()
+    assert (case_dir / "system" / "snappyHexMeshDict").exists()
+
+    # The case holds its own copy of the user's file
+    assert dest_stl.stat().st_ino != stl_path.stat().st_ino
+    dest_stl.write_text("solid edited\nendsolid edited\n")
+    assert stl_path.read_text() == "solid part\nendsolid part\n"
+
+    # Re-importing replaces the copy, and importing the case's own STL is a no-op
+    for path in (stl_path, dest_stl):
+        await case_manager.setup_geometry(
+            case_name="test_case",
+            geometry_type="stl_file",
+            stl_path=str(path)
+        )
+        assert dest_stl.read_text() == "solid part\nendsolid part\n"
+    assert dest_stl.read_text() == stl_path.read_text()
+
+
 @pytest.mark.asyncio
 async def test_get_case_status(case_manager):
     """Test getting case status."""
@@ -128,6 +221,36 @@ async def test_get_case_status(case_manager):
     assert status["state"] == "created"
     assert "progress" in status
 
+    # Cached status must follow metadata changes
+    case_manager.metadata["test_case"]["status"] = "meshed"
+    status = await case_manager.get_case_status("test_case")
+    assert status["state"] == "meshed"
+
+
+@pytest.mark.asyncio
+async def test_case_created_timestamp(case_manager):
+    """Test creation times are reported as ISO strings, including legacy metadata."""
+    from datetime import datetime
+
+    await case_manager.create_case(
+        case_name="test_case",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+    case_manager.metadata["legacy_case"] = {
+        "name": "legacy_case",
+        "type": "mold_filling",
+        "status": "created",
+        "created": "2024-01-01T12:00:00"
+    }
+
+    status = await case_manager.get_case_status("test_case")
+    datetime.fromisoformat(status["last_updated"])
+
+    legacy = await case_manager.get_case_status("legacy_case")
+    assert legacy["last_updated"] == "2024-01-01T12:00:00"
+
 
 @pytest.mark.asyncio
 async def test_get_nonexistent_case_status(case_manager):
@@ -136,6 +259,109 @@ async def test_get_nonexistent_case_status(case_manager):
         await case_manager.get_case_status("nonexistent_case")
 
 
+@pytest.mark.asyncio
+async def test_batched_metadata_written_on_exit(temp_run_dir):
+    """Test that metadata writes are deferred until the batch exits."""
+    async with CaseManager(run_dir=temp_run_dir) as manager:
+        await manager.create_case(
+            case_name="case1",
+            case_type="mold_filling",
+            metal_type="aluminum",
+            pouring_temperature=750
+        )
+        assert not manager.metadata_log.exists()
+
+    assert manager.metadata_log.exists()
+    assert "case1" in CaseManager(run_dir=temp_run_dir).metadata
+
+
+@pytest.mark.asyncio
+async def test_metadata_log_compaction(case_manager, temp_run_dir):
+    """Test that case records are appended to the log and compacted on close."""
+    for name in ("case1", "case2"):
+        await case_manager.create_case(
+            case_name=name,
+            case_type="mold_filling",
+            metal_type="aluminum",
+            pouring_temperature=750
+        )
+
+    assert not case_manager.metadata_file.exists()
+    assert len(case_manager.metadata_log.read_bytes().splitlines()) == 2
+
+    case_manager.close()
+    assert case_manager.metadata_file.exists()
+    assert not case_manager.metadata_log.exists()
+
+    CaseManager._METADATA_CACHE.clear()
+    assert set(CaseManager(run_dir=temp_run_dir).metadata) == {"case1", "case2"}
+
+
+@pytest.mark.asyncio
+async def test_metadata_compaction_keeps_other_managers_cases(temp_run_dir):
+    """Test that compacting keeps cases another manager appended to the log."""
+    manager_a = CaseManager(run_dir=temp_run_dir)
+    manager_b = CaseManager(run_dir=temp_run_dir)
+    await manager_a.create_case(
+        case_name="a1",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+    await manager_b.create_case(
+        case_name="b1",
+        case_type="solidification",
+        metal_type="steel",
+        pouring_temperature=1650
+    )
+
+    manager_a.close()
+    assert not manager_a.metadata_log.exists()
+    assert set(manager_a.metadata) == {"a1", "b1"}
+    cases = await manager_a.list_cases(filter_type="solidification")
+    assert [c["name"] for c in cases] == ["b1"]
+
+    CaseManager._METADATA_CACHE.clear()
+    assert set(CaseManager(run_dir=temp_run_dir).metadata) == {"a1", "b1"}
+
+
+@pytest.mark.asyncio
+async def test_metadata_log_tombstone(case_manager, temp_run_dir):
+    """Test that a removed case is logged as a tombstone."""
+    for name in ("case1", "case2"):
+        await case_manager.create_case(
+            case_name=name,
+            case_type="mold_filling",
+            metal_type="aluminum",
+            pouring_temperature=750
+        )
+
+    del case_manager.metadata["case1"]
+    case_manager._record_case("case1")
+
+    cases = await case_manager.list_cases(filter_type="mold_filling")
+    assert [c["name"] for c in cases] == ["case2"]
+
+    assert set(CaseManager(run_dir=temp_run_dir).metadata) == {"case2"}
+    CaseManager._METADATA_CACHE.clear()
+    assert set(CaseManager(run_dir=temp_run_dir).metadata) == {"case2"}
+
+
+@pytest.mark.asyncio
+async def test_metadata_shared_between_managers(case_manager, temp_run_dir):
+    """Test that a new manager sees cases saved by another one."""
+    await case_manager.create_case(
+        case_name="case1",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+
+    other = CaseManager(run_dir=temp_run_dir)
+    assert "case1" in other.metadata
+    assert other.metadata is not case_manager.metadata
+
+
 def test_material_database(case_manager):
     """Test that material database contains expected materials."""
     from openfoam_mcp.builders.case_builder import CaseBuilder
@@ -161,3 +387,66 @@ def test_material_database(case_manager):
     assert "viscosity" in steel_props
     assert "thermal_conductivity" in steel_props
     assert "liquidus_temp" in steel_props
+
+
+def test_case_builder_build_batch():
+    """Test that batch builds match one-at-a-time builds."""
+    from openfoam_mcp.builders.case_builder import CaseBuilder
+
+    combos = [("aluminum", "sand", 700), ("steel", "ceramic", 1600)]
+    batch = CaseBuilder("solidification").build_batch(combos)
+
+    assert len(batch) == 2
+    for (metal, mold, temperature), files in zip(combos, batch):
+        builder = CaseBuilder("solidification")
+        builder.set_metal_type(metal)
+        builder.set_mold_material(mold)
+        builder.set_pouring_temperature(temperature)
+        assert files == builder.build()
+
+
+def test_update_boundary_values(case_manager):
+    """Test that patch values are replaced inside the matching patch block only."""
+    content = """boundaryField
+{
+    inletWall { type fixedValue; value uniform 1; }
+    inlet
+    {
+        type            codedFixedValue;
+        code { x; }
+        value           uniform (0 0 1);
+    }
+    walls { type zeroGradient; }
+    outlet { type fixedValue; value uniform 2; }
+}
+"""
+    updated = case_manager._update_boundary_values(
+        content, {"inlet": "(0 0 5)", "walls": 300}
+    )
+
+    assert "value           uniform (0 0 5);" in updated
+    assert "value uniform 1;" in updated
+    assert "value uniform 2;" in updated
+    assert "300" not in updated
+
+
+@pytest.mark.asyncio
+async def test_setup_boundary_conditions_skips_unchanged_files(case_manager):
+    """Test that re-applying the same boundary conditions rewrites nothing."""
+    await case_manager.create_case(
+        case_name="test_case",
+        case_type="mold_filling",
+        metal_type="aluminum",
+        pouring_temperature=750
+    )
+
+    result = await case_manager.setup_boundary_conditions("test_case", inlet_velocity=1.0)
+    assert result["files_updated"] == ["0/U"]
+
+    u_file = case_manager.run_dir / "test_case" / "0" / "U"
+    assert "uniform (0 0 1.0);" in u_file.read_text()
+    mtime_ns = u_file.stat().st_mtime_ns
+
+    result = await case_manager.setup_boundary_conditions("test_case", inlet_velocity=1.0)
+    assert result["files_updated"] == []
+    assert u_file.stat().st_mtime_ns == mtime_ns
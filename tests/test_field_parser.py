@@ -0,0 +1,200 @@
+"""Tests for OpenFOAMFieldParser."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from openfoam_mcp.utils import field_parser
+from openfoam_mcp.utils.field_parser import ANALYSIS_CACHE_DIR, OpenFOAMFieldParser
+
+
+def binary_field_bytes(values, dtype="<f8", boundary="wall"):
+    """Binary volScalarField file holding the given internal values."""
+    scalar = 32 if np.dtype(dtype).itemsize == 4 else 64
+    header = (
+        "FoamFile\n{\n    format      binary;\n    class       volScalarField;\n"
+        f"    arch        \"LSB;label=32;scalar={scalar}\";\n    object      T;\n}}\n"
+        "dimensions      [0 0 0 1 0 0 0];\n"
+        f"internalField   nonuniform List<scalar> {len(values)}("
+    ).encode()
+    footer = f");\nboundaryField\n{{\n    {boundary}\n    {{\n        type zeroGradient;\n    }}\n}}\n"
+    return header + np.asarray(values, dtype=dtype).tobytes() + footer.encode()
+
+
+def scalar_field_text(values, boundary="wall"):
+    """ASCII volScalarField file holding the given internal values."""
+    listing = "\n".join(repr(float(v)) for v in values)
+    return (
+        "FoamFile\n{\n    format      ascii;\n    class       volScalarField;\n"
+        "    object      T;\n}\n"
+        "dimensions      [0 0 0 1 0 0 0];\n"
+        f"internalField   nonuniform List<scalar>\n{len(values)}\n(\n{listing}\n)\n;\n"
+        f"boundaryField\n{{\n    {boundary}\n    {{\n        type zeroGradient;\n    }}\n}}\n"
+    )
+
+
+@pytest.fixture
+def cached_case(tmp_path, monkeypatch):
+    """Case with one ASCII field large enough to be cached."""
+    monkeypatch.setattr(field_parser, "_CACHE_MIN_VALUES", 4)
+    (tmp_path / "1").mkdir()
+    field = tmp_path / "1" / "T"
+    field.write_text(scalar_field_text([1.0, 2.0, 3.0, 4.0]))
+    return tmp_path, field
+
+
+@pytest.fixture
+def decomposed_case(tmp_path):
+    """Case run on two processors: ASCII on processor0, binary on processor1."""
+    (tmp_path / "0").mkdir()
+    (tmp_path / "0" / "T").write_text(scalar_field_text([0.0]))
+    for processor in ("processor0", "processor1"):
+        (tmp_path / processor / "0").mkdir(parents=True)
+        (tmp_path / processor / "1").mkdir()
+    (tmp_path / "processor0" / "1" / "T").write_text(scalar_field_text([1.0, 2.0], boundary="procBoundary0to1"))
+    (tmp_path / "processor1" / "1" / "T").write_bytes(binary_field_bytes([3.0, 4.0, 5.0], boundary="outlet"))
+    return tmp_path
+
+
+def test_field_roots_prefer_newer_processor_results(decomposed_case):
+    """Test that processor directories are read when they hold later times."""
+    parser = OpenFOAMFieldParser(decomposed_case)
+    assert parser._field_roots() == [decomposed_case / "processor0", decomposed_case / "processor1"]
+    assert parser.get_time_directories() == [0.0, 1.0]
+
+
+def test_field_roots_prefer_reconstructed_results(decomposed_case):
+    """Test that a reconstructed case is read from the case directory."""
+    (decomposed_case / "1").mkdir()
+    (decomposed_case / "1" / "T").write_text(scalar_field_text([1.0, 2.0, 3.0, 4.0, 5.0]))
+
+    assert OpenFOAMFieldParser(decomposed_case)._field_roots() == [decomposed_case]
+
+
+def test_decomposed_field_joined_in_processor_order(decomposed_case):
+    """Test that per-processor values and boundaries are joined."""
+    field = OpenFOAMFieldParser(decomposed_case).read_scalar_field("T")
+
+    assert field["internal_field"].tolist() == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert not field["internal_field"].flags.writeable
+    assert set(field["boundary_field"]) == {"procBoundary0to1", "outlet"}
+    assert field["time"] == 1.0
+
+
+@pytest.mark.parametrize("dtype", ["<f8", "<f4"])
+def test_binary_values_mapped_in_place(tmp_path, dtype):
+    """Test that binary lists are memory-mapped with the declared width."""
+    (tmp_path / "1").mkdir()
+    (tmp_path / "1" / "T").write_bytes(binary_field_bytes([1.5, 2.5, 3.5], dtype=dtype))
+
+    content, values = OpenFOAMFieldParser(tmp_path)._read_scalar_file(tmp_path / "1" / "T")
+
+    assert isinstance(values, np.memmap)
+    assert values.dtype == np.dtype(dtype)
+    assert values.tolist() == [1.5, 2.5, 3.5]
+    assert "boundaryField" in content
+
+
+def test_truncated_binary_field_rejected(tmp_path):
+    """Test that a binary list shorter than declared raises ValueError."""
+    (tmp_path / "1").mkdir()
+    data = binary_field_bytes([1.0, 2.0])
+    (tmp_path / "1" / "T").write_bytes(data[:data.index(b"2(") + 10])
+
+    with pytest.raises(ValueError, match="Truncated binary field"):
+        OpenFOAMFieldParser(tmp_path).read_scalar_field("T")
+
+
+def test_results_stamp_changes_with_new_time(decomposed_case):
+    """Test that a new time directory on a processor changes the stamp."""
+    before = OpenFOAMFieldParser(decomposed_case).results_stamp()
+    assert OpenFOAMFieldParser(decomposed_case).results_stamp() == before
+
+    (decomposed_case / "processor1" / "2").mkdir()
+    assert OpenFOAMFieldParser(decomposed_case).results_stamp() != before
+
+
+def cache_entries(case_dir):
+    return sorted(p.name for p in (case_dir / ANALYSIS_CACHE_DIR).iterdir())
+
+
+def test_ascii_values_cached_and_reused(cached_case):
+    """Test that parsed ASCII values are stored once and then reused."""
+    case_dir, _ = cached_case
+
+    values = OpenFOAMFieldParser(case_dir).read_scalar_field("T")["internal_field"]
+    assert values.tolist() == [1.0, 2.0, 3.0, 4.0]
+    entries = cache_entries(case_dir)
+    assert len(entries) == 1
+
+    cached = OpenFOAMFieldParser(case_dir).read_scalar_field("T")["internal_field"]
+    assert isinstance(cached, np.memmap)
+    assert cached.tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_cache_ignored_after_rewrite_keeping_mtime(cached_case):
+    """Test that a same-size rewrite restoring the mtime is not served stale."""
+    case_dir, field = cached_case
+    OpenFOAMFieldParser(case_dir).read_scalar_field("T")
+    stat = field.stat()
+
+    field.write_text(scalar_field_text([5.0, 6.0, 7.0, 8.0]))
+    os.utime(field, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert field.stat().st_size == stat.st_size
+
+    values = OpenFOAMFieldParser(case_dir).read_scalar_field("T")["internal_field"]
+    assert values.tolist() == [5.0, 6.0, 7.0, 8.0]
+    # The entry for the old contents was replaced
+    assert len(cache_entries(case_dir)) == 1
+
+
+def test_concurrent_cache_writers(cached_case):
+    """Test that concurrent stores of one field leave one complete entry."""
+    case_dir, _ = cached_case
+    cache_dir = case_dir / ANALYSIS_CACHE_DIR
+    cache_dir.mkdir()
+    # Another writer's file still being written
+    in_flight = cache_dir / "1_T@0-0-0-0.npy.tmp"
+    in_flight.write_bytes(b"partial")
+
+    def read(_):
+        return OpenFOAMFieldParser(case_dir).read_scalar_field("T")["internal_field"].tolist()
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(read, range(16)))
+
+    assert results == [[1.0, 2.0, 3.0, 4.0]] * 16
+    assert in_flight.exists()
+    entries = cache_entries(case_dir)
+    assert len([name for name in entries if name.endswith(".npy")]) == 1
+    assert [name for name in entries if name.endswith(".tmp")] == [in_flight.name]
+
+
+def test_cache_evicts_beyond_size_bound(cached_case, monkeypatch):
+    """Test that the least recently stored entries are evicted."""
+    case_dir, field = cached_case
+    for time in ("2", "3"):
+        (case_dir / time).mkdir()
+        (case_dir / time / "T").write_text(field.read_text())
+
+    monkeypatch.setattr(field_parser, "_CACHE_MAX_BYTES", 0)
+    parser = OpenFOAMFieldParser(case_dir)
+    for time in (1.0, 2.0, 3.0):
+        parser.read_scalar_field("T", time)
+
+    assert cache_entries(case_dir) == []
+
+
+@pytest.mark.parametrize("listing", ["1.0\n2.0\n3.0", "1.0\n2.0\nnan?\n4.0", "1.0\n2.0\n3.0\n4.0\n5.0"])
+def test_ascii_list_with_wrong_count_rejected(tmp_path, listing):
+    """Test that a short, malformed or overlong value list raises ValueError."""
+    (tmp_path / "1").mkdir()
+    text = scalar_field_text([1.0, 2.0, 3.0, 4.0])
+    start = text.index("(\n") + 2
+    end = text.index("\n)")
+    (tmp_path / "1" / "T").write_text(text[:start] + listing + text[end:])
+
+    with pytest.raises(ValueError, match="internalField"):
+        OpenFOAMFieldParser(tmp_path).read_scalar_field("T")
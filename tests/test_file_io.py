@@ -0,0 +1,87 @@
+"""Tests for file I/O helpers."""
+
+import re
+
+from openfoam_mcp.utils.file_io import clone_tree, link_or_copy, regex_rewrite
+
+
+TEMPERATURE = re.compile(r"(value\s+uniform\s+)[\d.]+")
+
+
+def test_regex_rewrite_same_length(tmp_path):
+    """Test an in-place rewrite that keeps the file length."""
+    path = tmp_path / "T"
+    path.write_text("inlet { value uniform 700; }\nwall { value uniform 300; }\n")
+
+    assert regex_rewrite(path, [(TEMPERATURE, r"\g<1>720")])
+    assert path.read_text() == "inlet { value uniform 720; }\nwall { value uniform 720; }\n"
+
+
+def test_regex_rewrite_changed_length(tmp_path):
+    """Test a rewrite that changes the file length."""
+    path = tmp_path / "T"
+    path.write_text("inlet { value uniform 700; }\n")
+
+    assert regex_rewrite(path, [(TEMPERATURE, r"\g<1>1000.5")])
+    assert path.read_text() == "inlet { value uniform 1000.5; }\n"
+
+
+def test_regex_rewrite_replaces_file(tmp_path):
+    """Test that a rewrite replaces the file instead of writing into it."""
+    path = tmp_path / "T"
+    path.write_text("inlet { value uniform 700; }\n")
+    linked = tmp_path / "T.link"
+    linked.hardlink_to(path)
+
+    assert regex_rewrite(path, [(TEMPERATURE, r"\g<1>720")])
+    assert path.read_text() == "inlet { value uniform 720; }\n"
+    assert linked.read_text() == "inlet { value uniform 700; }\n"
+    assert not (tmp_path / "T.tmp").exists()
+
+
+def test_regex_rewrite_no_change(tmp_path):
+    """Test that a no-op substitution leaves the file untouched."""
+    path = tmp_path / "T"
+    path.write_text("inlet { value uniform 700; }\n")
+    stat = path.stat()
+
+    assert not regex_rewrite(path, [(TEMPERATURE, r"\g<1>700")])
+    assert path.stat().st_mtime_ns == stat.st_mtime_ns
+
+
+def test_link_or_copy_links_and_replaces(tmp_path):
+    """Test that link_or_copy shares the source and replaces the target."""
+    src = tmp_path / "points"
+    src.write_text("points")
+    dst = tmp_path / "linked"
+    dst.write_text("stale")
+
+    link_or_copy(src, dst)
+    assert dst.read_text() == "points"
+    assert dst.stat().st_ino == src.stat().st_ino
+
+    # Linking onto an existing link is a no-op
+    link_or_copy(src, dst)
+    assert dst.stat().st_ino == src.stat().st_ino
+
+
+def test_clone_tree_links_shared_and_skips_excluded(tmp_path):
+    """Test that clone_tree links shared files and leaves out excluded dirs."""
+    src = tmp_path / "base"
+    (src / "constant" / "polyMesh").mkdir(parents=True)
+    (src / "system").mkdir()
+    (src / ".analysis_cache").mkdir()
+    (src / "constant" / "polyMesh" / "points").write_text("points")
+    (src / "system" / "controlDict").write_text("endTime 1;")
+    (src / ".analysis_cache" / "T.npy").write_bytes(b"cached")
+
+    dst = tmp_path / "clone"
+    clone_tree(src, dst, shared=("constant/polyMesh",), exclude=(".analysis_cache",))
+
+    points = dst / "constant" / "polyMesh" / "points"
+    assert points.read_text() == "points"
+    assert points.stat().st_ino == (src / "constant" / "polyMesh" / "points").stat().st_ino
+    control = dst / "system" / "controlDict"
+    assert control.read_text() == "endTime 1;"
+    assert control.stat().st_ino != (src / "system" / "controlDict").stat().st_ino
+    assert not (dst / ".analysis_cache").exists()
@@ -0,0 +1,82 @@
+"""Tests for OpenFOAMClient.run_case."""
+
+import pytest
+
+from openfoam_mcp.api import openfoam_client
+from openfoam_mcp.api.openfoam_client import OpenFOAMClient
+
+
+def make_client(tmp_path, monkeypatch, check_output):
+    """Client whose commands are recorded instead of run."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    client = OpenFOAMClient(foam_dir=str(tmp_path / "no_openfoam"))
+    client.run_dir = tmp_path
+    (tmp_path / "case").mkdir()
+    commands = []
+
+    async def run_command(command, case_dir, capture_output=True, log_file=None, line_handler=None):
+        commands.append(command[0])
+        if command[0] == "checkMesh":
+            line_handler(check_output)
+        return {"returncode": 0, "stdout": "", "stderr": ""}
+
+    client.run_command = run_command
+    client._solver_command = lambda case_dir, solver: ["foamRun"]
+    return client, commands
+
+
+@pytest.mark.asyncio
+async def test_run_case_checks_mesh_before_solving(tmp_path, monkeypatch):
+    """Test that checkMesh finishes before the solver starts."""
+    client, commands = make_client(tmp_path, monkeypatch, "    cells:            8000\nMesh OK.\n")
+
+    result = await client.run_case("case", generate_mesh=False)
+
+    assert commands == ["checkMesh", "foamRun"]
+    assert result["mesh"]["quality"] == "OK"
+    assert result["simulation"]["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_run_case_skips_solver_on_failed_mesh(tmp_path, monkeypatch):
+    """Test that a mesh failing checkMesh is not solved."""
+    client, commands = make_client(tmp_path, monkeypatch, "Failed 1 mesh checks.\n")
+
+    result = await client.run_case("case", generate_mesh=False)
+
+    assert commands == ["checkMesh"]
+    assert result["mesh"]["quality"] == "FAILED"
+    assert result["simulation"]["status"] == "failed"
+    assert "checkMesh" in result["simulation"]["error"]
+
+
+@pytest.mark.asyncio
+async def test_environment_captured_once_on_first_command(tmp_path, monkeypatch):
+    """Test that the bashrc is sourced lazily, once per installation."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(openfoam_client, "_FOAM_ENVIRONMENTS", {})
+    foam_dir = tmp_path / "openfoam"
+    (foam_dir / "etc").mkdir(parents=True)
+    sourced = tmp_path / "sourced"
+    (foam_dir / "etc" / "bashrc").write_text(f"echo x >> {sourced}\nexport FOAM_TEST=captured\n")
+
+    clients = [OpenFOAMClient(foam_dir=str(foam_dir)) for _ in range(2)]
+    assert not sourced.exists()
+
+    for client in clients:
+        result = await client.run_command(["sh", "-c", "echo $FOAM_TEST"], str(tmp_path))
+        assert result["stdout"].strip() == "captured"
+    assert sourced.read_text() == "x\n"
+
+
+@pytest.mark.asyncio
+async def test_log_file_in_missing_case_reported_as_failure(tmp_path, monkeypatch):
+    """Test that an unopenable log file fails the command instead of raising."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    client = OpenFOAMClient(foam_dir=str(tmp_path / "no_openfoam"))
+    case_dir = tmp_path / "missing_case"
+
+    result = await client.run_command(["true"], str(case_dir), log_file=case_dir / "log.solver")
+
+    assert result["returncode"] != 0
+    assert "missing_case" in result["stderr"]
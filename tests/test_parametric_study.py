@@ -0,0 +1,242 @@
+"""Tests for ParametricStudyEngine with a mocked OpenFOAMClient."""
+
+import asyncio
+import shutil
+import threading
+import time
+
+import pytest
+
+from openfoam_mcp.api import parametric_study
+from openfoam_mcp.api.parametric_study import ParametricStudyEngine
+
+
+class FakeClient:
+    """Stands in for OpenFOAMClient: meshes and solves instantly."""
+
+    def __init__(self, run_dir, solve_delays=None):
+        self.run_dir = run_dir
+        self.solve_delays = solve_delays or {}
+        self.meshed = []
+        self.busy_cores = set()
+        self.max_busy_cores = 0
+
+    async def run_mesh_pipeline(self, case_name):
+        self.meshed.append(case_name)
+        mesh = self.run_dir / case_name / "constant" / "polyMesh"
+        mesh.mkdir(parents=True, exist_ok=True)
+        (mesh / "points").write_text(case_name)
+
+    async def run_case(self, case_name, solver=None, generate_mesh=True, cores=None):
+        if generate_mesh:
+            await self.run_mesh_pipeline(case_name)
+        if cores:
+            assert self.busy_cores.isdisjoint(cores), f"cores {cores} already in use"
+            self.busy_cores.update(cores)
+            self.max_busy_cores = max(self.max_busy_cores, len(self.busy_cores))
+        delay = self.solve_delays.get(case_name.split("_p")[-1][:4])
+        await asyncio.sleep(delay or 0.01)
+        self.busy_cores.difference_update(cores or ())
+        return {"mesh": {"quality": "OK"}, "simulation": {"status": "completed"}}
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Study engine over a base case, with a fake client and analyzer."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    run_dir = tmp_path / "run"
+    base = run_dir / "base"
+    (base / "0").mkdir(parents=True)
+    (base / "system").mkdir()
+    (base / "0" / "T").write_text("inlet { type fixedValue; value uniform 1000; }\n")
+    (base / "system" / "blockMeshDict").write_text("blocks ( hex (0 1 2 3 4 5 6 7) (10 10 10) );\n")
+
+    study = ParametricStudyEngine(run_dir=str(run_dir))
+    study.openfoam_client = FakeClient(run_dir)
+
+    async def analyze(case_name, analysis_type="all", time_step=None):
+        return {"defects": {"porosity": {"high_risk_percentage": 0.0}}}
+
+    study.analyzer.analyze = analyze
+    return study
+
+
+@pytest.mark.asyncio
+async def test_run_in_thread_finishes_work_before_cancelling(tmp_path):
+    """Test that a cancelled caller returns only once its thread is done."""
+    started = threading.Event()
+    marker = tmp_path / "written"
+
+    def slow_write():
+        started.set()
+        time.sleep(0.2)
+        marker.write_text("done")
+
+    task = asyncio.create_task(parametric_study._run_in_thread(slow_write))
+    await asyncio.to_thread(started.wait)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert marker.exists()
+
+
+@pytest.mark.asyncio
+async def test_early_stop_keeps_finished_cases(engine):
+    """Test that early stopping cancels running cases but keeps finished ones."""
+    engine.openfoam_client.solve_delays = {"0001": 30}
+
+    # Cases 0 and 2 finish in the same event loop step, so the study stops
+    # on one of them while the other is already done
+    finished = asyncio.Event()
+    asyncio.get_running_loop().call_later(0.2, finished.set)
+
+    async def analyze(case_name, analysis_type="all", time_step=None):
+        await finished.wait()
+        return {"defects": {"porosity": {"high_risk_percentage": 0.0}}}
+
+    engine.analyzer.analyze = analyze
+
+    study = await engine.run_parametric_study(
+        "base",
+        {"pouring_temperature": [700, 720, 740]},
+        max_concurrent=3,
+        early_stop_threshold=1.0
+    )
+
+    assert study["early_stopped"]
+    assert [r["index"] for r in study["study_results"]] == [0, 2]
+    assert study["cancelled_runs"] == 1
+    remaining = sorted(p.name for p in engine.run_dir.iterdir() if p.name.startswith("base_"))
+    assert [name[:10] for name in remaining] == ["base_p0000", "base_p0002"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_study_stops_and_removes_its_cases(engine):
+    """Test that cancelling a study cancels its running cases and cleans up."""
+    engine.openfoam_client.solve_delays = {"0000": 30, "0001": 30}
+    study = asyncio.create_task(
+        engine.run_parametric_study("base", {"pouring_temperature": [700, 720]}, max_concurrent=2)
+    )
+    # Wait until both cases have their mesh and are solving
+    while len(list(engine.run_dir.glob("base_p*/constant/polyMesh/points"))) < 2:
+        await asyncio.sleep(0.01)
+
+    study.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await study
+
+    assert not list(engine.run_dir.glob("base_p*"))
+    assert not list(engine.run_dir.glob(".study_meshes_*"))
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert not pending
+
+
+@pytest.mark.asyncio
+async def test_mesh_shared_between_cases_with_same_mesh_files(engine):
+    """Test that cases with identical mesh files mesh once and share it."""
+    study = await engine.run_parametric_study(
+        "base", {"pouring_temperature": [700, 720, 740]}, max_concurrent=3
+    )
+
+    assert study["completed_runs"] == 3
+    assert len(engine.openfoam_client.meshed) == 1
+    owner = engine.openfoam_client.meshed[0]
+    for entry in study["study_results"]:
+        points = engine.run_dir / entry["case_name"] / "constant" / "polyMesh" / "points"
+        assert points.read_text() == owner
+
+    # The study's shared mesh directory is gone once the study ends
+    assert not list(engine.run_dir.glob(".study_meshes_*"))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_studies_keep_their_own_meshes(engine):
+    """Test that two studies on one engine each share meshes only internally."""
+    other = engine.run_dir / "other"
+    shutil.copytree(engine.run_dir / "base", other)
+    other.joinpath("system", "blockMeshDict").write_text("blocks ( hex (0 1 2 3 4 5 6 7) (5 5 5) );\n")
+    # The first study's cases outlive the second study
+    engine.openfoam_client.solve_delays = {"0002": 0.3}
+
+    first, second = await asyncio.gather(
+        engine.run_parametric_study("base", {"pouring_temperature": [700, 720, 740]}, max_concurrent=3),
+        engine.run_parametric_study("other", {"pouring_temperature": [700, 720]}, max_concurrent=2)
+    )
+
+    assert first["completed_runs"] == 3
+    assert second["completed_runs"] == 2
+    meshed = engine.openfoam_client.meshed
+    assert sorted(name.split("_p")[0] for name in meshed) == ["base", "other"]
+    for study, base in ((first, "base"), (second, "other")):
+        owner = next(name for name in meshed if name.startswith(f"{base}_p"))
+        for entry in study["study_results"]:
+            points = engine.run_dir / entry["case_name"] / "constant" / "polyMesh" / "points"
+            assert points.read_text() == owner
+    assert not list(engine.run_dir.glob(".study_meshes_*"))
+
+
+@pytest.mark.asyncio
+async def test_mesh_not_shared_when_mesh_files_differ(engine):
+    """Test that cases whose mesh files differ each generate a mesh."""
+    meshes = parametric_study._StudyMeshes(engine.run_dir / ".study_meshes_test")
+    meshes.directory.mkdir()
+
+    base = engine.run_dir / "base"
+    first = engine.run_dir / "case_a"
+    second = engine.run_dir / "case_b"
+    for case in (first, second):
+        engine._clone_case(base, case)
+    second.joinpath("system", "blockMeshDict").write_text("blocks ( hex (0 1 2 3 4 5 6 7) (20 20 20) );\n")
+
+    assert await engine._mesh_from_cache(meshes, "base", "case_a")
+    assert await engine._mesh_from_cache(meshes, "base", "case_b")
+    assert engine.openfoam_client.meshed == ["case_a", "case_b"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_cached_reuses_until_results_change(engine):
+    """Test that analyses are reused only while the case results are unchanged."""
+    calls = []
+
+    async def analyze(case_name, analysis_type="all", time_step=None):
+        calls.append(case_name)
+        return {"call": len(calls)}
+
+    engine.analyzer.analyze = analyze
+    case = engine.run_dir / "base"
+
+    first = await engine._analyze_cached("base", "all")
+    assert await engine._analyze_cached("base", "all") is first
+    assert calls == ["base"]
+
+    # A new time directory invalidates the analysis
+    (case / "1").mkdir()
+    (case / "1" / "T").write_text("internalField uniform 900;\n")
+    second = await engine._analyze_cached("base", "all")
+    assert second["call"] == 2
+
+    # So does rewriting a field in the latest time directory
+    (case / "1" / "T").write_text("internalField uniform 850.5;\n")
+    assert (await engine._analyze_cached("base", "all"))["call"] == 3
+    assert (await engine._analyze_cached("base", "all"))["call"] == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_studies_share_one_core_pool(engine):
+    """Test that parallel cases of concurrent studies never share a core."""
+    engine._core_pool = parametric_study._CorePool([0, 1, 2, 3])
+    other = engine.run_dir / "other"
+    shutil.copytree(engine.run_dir / "base", other)
+
+    first, second = await asyncio.gather(
+        engine.run_parametric_study(
+            "base", {"pouring_temperature": [700, 720, 740]}, max_concurrent=3, processors_per_case=2
+        ),
+        engine.run_parametric_study(
+            "other", {"pouring_temperature": [700, 720, 740]}, max_concurrent=3, processors_per_case=2
+        )
+    )
+
+    assert first["completed_runs"] == second["completed_runs"] == 3
+    assert engine.openfoam_client.max_busy_cores == 4
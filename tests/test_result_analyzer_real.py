@@ -0,0 +1,88 @@
+"""Tests comparing the analyzer's fast paths with plain NumPy."""
+
+import numpy as np
+import pytest
+
+from openfoam_mcp.api import result_analyzer_real
+from openfoam_mcp.api.result_analyzer_real import _percentiles
+from openfoam_mcp.utils.field_parser import OpenFOAMFieldParser
+
+needs_numba = pytest.mark.skipif(result_analyzer_real.njit is None, reason="numba not installed")
+
+# Sizes around the block and chunk boundaries of the kernels
+SIZES = [1, 7, 511, 512, 513, 64 * 512 + 3, 100000]
+
+
+@pytest.fixture
+def parser(tmp_path):
+    return OpenFOAMFieldParser(tmp_path)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5, 1000, 1001])
+def test_percentiles_match_numpy(n):
+    """Test that _percentiles reproduces np.percentile exactly."""
+    values = np.random.default_rng(n).normal(900.0, 50.0, n)
+    percentiles = (0, 10, 25, 50, 90, 95, 99.5, 100)
+
+    np.testing.assert_array_equal(_percentiles(values, percentiles), np.percentile(values, percentiles))
+
+
+def test_percentiles_leave_input_unsorted():
+    """Test that _percentiles partitions a copy, not the caller's array."""
+    values = np.array([5.0, 1.0, 4.0, 2.0, 3.0])
+    _percentiles(values, (50,))
+    assert values.tolist() == [5.0, 1.0, 4.0, 2.0, 3.0]
+
+
+@needs_numba
+@pytest.mark.parametrize("n", SIZES)
+def test_moments_kernel_matches_numpy(parser, n):
+    """Test the compiled field statistics against the NumPy path."""
+    values = np.random.default_rng(n).normal(900.0, 50.0, n)
+
+    fast = result_analyzer_real._field_statistics(parser, values)
+    expected = parser.calculate_field_statistics(values)
+
+    assert fast['count'] == expected['count']
+    assert fast['min'] == expected['min']
+    assert fast['max'] == expected['max']
+    assert fast['mean'] == pytest.approx(expected['mean'], rel=1e-12)
+    assert fast['std'] == pytest.approx(expected['std'], rel=1e-9, abs=1e-9)
+
+
+@needs_numba
+@pytest.mark.parametrize("n", SIZES)
+def test_niyama_kernel_matches_numpy(parser, monkeypatch, n):
+    """Test the compiled Niyama classification against the NumPy path."""
+    rng = np.random.default_rng(n)
+    grad_T = rng.uniform(0.0, 2.0, n).astype(np.float32)
+    cooling_rate = rng.uniform(0.0, 4.0, n).astype(np.float32)
+    cooling_rate[::5] = 0.0
+
+    fast_rate = cooling_rate.copy()
+    fast = result_analyzer_real._niyama(parser, grad_T, fast_rate)
+    monkeypatch.setattr(result_analyzer_real, "_niyama_kernel", None)
+    slow_rate = cooling_rate.copy()
+    slow = result_analyzer_real._niyama(parser, grad_T, slow_rate)
+
+    assert fast[:3] == slow[:3]
+    np.testing.assert_array_equal(fast_rate, slow_rate)
+    assert fast[3]['mean'] == pytest.approx(slow[3]['mean'], rel=1e-9)
+    assert fast[3]['std'] == pytest.approx(slow[3]['std'], rel=1e-6, abs=1e-9)
+
+
+@needs_numba
+@pytest.mark.parametrize("n", SIZES)
+def test_fill_kernel_matches_numpy(parser, monkeypatch, n):
+    """Test the compiled fill counters against the NumPy path."""
+    alpha = np.random.default_rng(n).uniform(0.0, 1.0, n)
+    alpha[::3] = 1.0
+    alpha[1::7] = 0.0
+
+    fast = result_analyzer_real._fill_statistics(parser, alpha)
+    monkeypatch.setattr(result_analyzer_real, "_fill_kernel", None)
+    slow = result_analyzer_real._fill_statistics(parser, alpha)
+
+    assert fast[:2] == slow[:2]
+    assert fast[2]['mean'] == pytest.approx(slow[2]['mean'], rel=1e-12)
+    assert fast[2]['std'] == pytest.approx(slow[2]['std'], rel=1e-9, abs=1e-9)